@@ -9,5 +9,9 @@ EMPTY_SPACE_CONST = -1
 ON_PAGE_LOAD_ACTION_PREFIX = "on_page_load_action"
 FILTER_ACTION_PREFIX = "filter_action"
 PARAMETER_ACTION_PREFIX = "parameter_action"
+ZOOM_ACTION_PREFIX = "zoom_action"
+GET_ROWS_ACTION_PREFIX = "get_rows_action"
+GET_PAGE_ACTION_PREFIX = "get_page_action"
+TARGET_SIGNATURES_PREFIX = "target_signatures"
 ACCORDION_DEFAULT_TITLE = "SELECT PAGE"
 VIZRO_ASSETS_PATH = Path(__file__).with_name("static")
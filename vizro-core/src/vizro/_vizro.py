@@ -3,9 +3,10 @@ from __future__ import annotations
 import logging
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import Executor
 from contextlib import suppress
 from pathlib import Path
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Literal, Optional, TypedDict, Union
 
 import dash
 import plotly.io as pio
@@ -27,14 +28,51 @@ if TYPE_CHECKING:
 class Vizro:
     """The main class of the `vizro` package."""
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        executor: Union[Literal["thread", "process"], Executor, None] = None,
+        chart_executor: Optional[Literal["process"]] = None,
+        chart_timeout: Optional[float] = None,
+        chart_max_tasks_per_worker: int = 100,
+        json_engine: Literal["auto", "json", "orjson"] = "json",
+        **kwargs,
+    ):
         """Initializes Dash app, stored in `self.dash`.
 
         Args:
+            executor: How to update the components of a page concurrently. Defaults to `None`, which updates components
+                one after the other. With `"thread"`, data is loaded and filtered and components are rendered in a
+                thread pool, so your data loading and chart functions must be thread-safe. With `"process"`, components
+                are instead rendered in a process pool, which is only possible on platforms that support forking.
+                Forking a server process that runs several threads can deadlock if a lock held by another thread is
+                inherited by the worker, and chart functions that run in the pool cannot use `set_props`. You can also
+                give a `ThreadPoolExecutor` or `ProcessPoolExecutor` to control e.g. the number of workers.
+            chart_executor: With `"process"`, all `@capture("graph")` functions run in a persistent pool of worker
+                processes, unless they were captured with `executor="local"`. Functions captured with
+                `executor="process"` always run in the pool. The pool is only possible on platforms that support
+                forking. Defaults to `None`.
+            chart_timeout: Number of seconds a chart function may run in the pool before a `TimeoutError` is raised
+                and the pool's workers are killed and replaced. Defaults to `None`, which means no timeout.
+            chart_max_tasks_per_worker: Number of chart functions each worker in the pool runs before the workers are
+                replaced by new ones. Defaults to `100`.
+            json_engine: How to serialize the responses of callbacks to JSON. Defaults to `"json"`, which serializes
+                them in the same way as any other Dash app. `"orjson"` is much faster for large figures and tables but
+                requires [orjson](https://github.com/ijl/orjson) to be installed, and the JSON it gives can differ
+                from Dash's, e.g. in how dates and 32-bit floats are formatted. `"auto"` uses orjson if it is
+                installed and otherwise falls back to `"json"`.
             **kwargs : Passed through to `Dash.__init__`, e.g. `assets_folder`, `url_base_pathname`. See
                 [Dash documentation](https://dash.plotly.com/reference#dash.dash) for possible arguments.
 
         """
+        from vizro.actions._actions_utils import _target_executors
+        from vizro.models._json_serializer import _json_serializer
+        from vizro.models._process_pool import _chart_process_pool
+
+        _target_executors.configure(executor)
+        _chart_process_pool.configure(
+            chart_executor, timeout=chart_timeout, max_tasks_per_worker=chart_max_tasks_per_worker
+        )
+
         # Set suppress_callback_exceptions=True for the following reasons:
         # 1. Prevents the following Dash exception when using html.Div as placeholders in build methods:
         #    "Property 'cellClicked' was used with component ID '__input_ag_grid_id' in one of the Input
@@ -78,7 +116,10 @@ class Vizro:
                 # error in dash._validate.validate_js_path.
                 self.dash.scripts.append_script(_make_resource_spec(path))
 
+        _json_serializer.configure(json_engine, server=self.dash.server)
         data_manager.cache.init_app(self.dash.server)
+        if data_manager.figure_cache is not None and data_manager.figure_cache is not data_manager.cache:
+            data_manager.figure_cache.init_app(self.dash.server)
 
     def build(self, dashboard: Dashboard):
         """Builds the `dashboard`.
@@ -160,8 +201,16 @@ class Vizro:
         This deliberately does not clear the data manager cache - see comments in data_manager._clear for
         explanation.
         """
+        from vizro.actions._actions_utils import _filter_plan, _target_executors
+        from vizro.models._json_serializer import _json_serializer
+        from vizro.models._process_pool import _chart_process_pool
+
         data_manager._clear()
         model_manager._clear()
+        _filter_plan.clear()
+        _target_executors.shutdown()
+        _chart_process_pool.clear()
+        _json_serializer.clear()
         dash._callback.GLOBAL_CALLBACK_LIST = []
         dash._callback.GLOBAL_CALLBACK_MAP = {}
         dash._callback.GLOBAL_INLINE_SCRIPTS = []
@@ -1,6 +1,9 @@
 from vizro.actions._filter_action import _filter
+from vizro.actions._get_page_action import _get_page
+from vizro.actions._get_rows_action import _get_rows
 from vizro.actions._on_page_load_action import _on_page_load
 from vizro.actions._parameter_action import _parameter
+from vizro.actions._zoom_action import _zoom
 from vizro.actions.export_data_action import export_data
 from vizro.actions.filter_interaction_action import filter_interaction
 
@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
+import contextvars
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
 from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Literal, Optional, TypedDict, Union
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, Optional, TypedDict, Union
 
+import dash
+import numpy as np
 import pandas as pd
 
 from vizro._constants import ALL_OPTION, NONE_OPTION
+from vizro.figures._kpi_cards import (
+    _aggregate,
+    _Aggregation,
+    _get_kpi_card_aggregation,
+    _precomputed_aggregations,
+)
 from vizro.managers import data_manager, model_manager
+from vizro.managers._data_manager import DataSourceName, _ColumnIndexes, _FilteredDataKey
 from vizro.managers._model_manager import ModelID
 from vizro.models.types import MultiValueType, SelectorType, SingleValueType
 
 if TYPE_CHECKING:
     from vizro.models import Action, VizroBaseModel
 
+logger = logging.getLogger(__name__)
+
+# When the fraction of rows still selected by the filters applied so far drops below this threshold, the remaining
+# filters are evaluated only on the selected rows rather than on the whole column.
+_SPARSE_MASK_THRESHOLD = 0.5
+
 ValidatedNoneValueType = Union[SingleValueType, MultiValueType, None, list[None]]
 
 
@@ -38,6 +62,175 @@ class CallbackTriggerDict(TypedDict):
     triggered: bool
 
 
+def _make_hashable(value: Any) -> Any:
+    """Recursively converts lists, tuples, sets and dicts in `value` into hashable equivalents."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _make_hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_make_hashable(item) for item in value)
+    return value
+
+
+class _DataLoadMemo:
+    """Loads each combination of data source and load arguments at most once.
+
+    A new instance should be created for each callback so that loaded data is shared between all the targets of that
+    callback but never between different callbacks. This means that dynamic data is still reloaded (or fetched from the
+    data manager cache) on every callback as usual.
+
+    The `loads` and `hits` counters record how many times data was actually loaded and how many times loading was
+    avoided by reusing data already loaded for another target.
+
+    Data can be loaded from several threads at the same time. Each combination of data source and load arguments is
+    still loaded only once, with other threads that need the same data waiting for it to be loaded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_locks: defaultdict[Any, threading.Lock] = defaultdict(threading.Lock)
+        self._loaded_data: dict[Any, pd.DataFrame] = {}
+        self._versions: dict[Any, Optional[Hashable]] = {}
+        self._column_indexes: dict[Any, Optional[_ColumnIndexes]] = {}
+        self.loads = 0
+        self.hits = 0
+
+    def load(self, data_source_name: DataSourceName, **load_kwargs: Any) -> pd.DataFrame:
+        """Loads data or, if it has already been loaded with the same arguments, returns the already loaded data.
+
+        Each call returns a new DataFrame object so that e.g. adding a column for one target does not affect another
+        target that shares the same loaded data.
+        """
+        try:
+            key = self._make_key(data_source_name, **load_kwargs)
+        except TypeError:
+            # Load arguments that cannot be hashed are very unlikely, but if they occur then just don't memoize.
+            with self._lock:
+                self.loads += 1
+            return data_manager[data_source_name].load(**load_kwargs)
+
+        with self._lock:
+            key_lock = self._key_locks[key]
+        with key_lock:
+            if key in self._loaded_data:
+                with self._lock:
+                    self.hits += 1
+            else:
+                with self._lock:
+                    self.loads += 1
+                data_source = data_manager[data_source_name]
+                self._loaded_data[key], self._versions[key] = data_source._load_with_version(**load_kwargs)
+                self._column_indexes[key] = data_source._get_column_indexes(self._versions[key])
+        return self._loaded_data[key].copy(deep=False)
+
+    def get_column_indexes(self, data_source_name: DataSourceName, **load_kwargs: Any) -> Optional[_ColumnIndexes]:
+        """Returns the column indexes of data that has already been loaded, or None if there are none available."""
+        try:
+            return self._column_indexes.get(self._make_key(data_source_name, **load_kwargs))
+        except TypeError:
+            return None
+
+    def get_version(self, data_source_name: DataSourceName, **load_kwargs: Any) -> Optional[Hashable]:
+        """Returns the version of data that has already been loaded, or None if the version is not known."""
+        try:
+            return self._versions.get(self._make_key(data_source_name, **load_kwargs))
+        except TypeError:
+            return None
+
+    def peek_version(self, data_source_name: DataSourceName, **load_kwargs: Any) -> Optional[Hashable]:
+        """Returns the version of data that would be loaded without loading it, or None if the version is not known.
+
+        This is cheap even for data that has not been loaded yet, so it can be used to look up derived results such as
+        filtered data without loading the data at all.
+        """
+        version = self.get_version(data_source_name, **load_kwargs)
+        if version is None:
+            version = data_manager[data_source_name]._get_version(**load_kwargs)
+        return version
+
+    @staticmethod
+    def _make_key(data_source_name: DataSourceName, **load_kwargs: Any) -> Any:
+        key = (data_source_name, _make_hashable(load_kwargs))
+        hash(key)
+        return key
+
+
+class _TargetExecutors:
+    """Executors used to run the work for independent targets of a callback concurrently.
+
+    Loading and filtering data is done in `thread_executor` since it is often I/O-bound or done by pandas and NumPy
+    operations that release the GIL. Rendering targets is done in `render_executor`, which can be either the same
+    thread pool or a process pool for charts that are CPU-bound in pure Python. When an executor is None, the work is
+    done sequentially in the thread that runs the callback.
+    """
+
+    def __init__(self):
+        self.thread_executor: Optional[ThreadPoolExecutor] = None
+        self.render_executor: Optional[Executor] = None
+
+    def configure(self, executor: Union[Literal["thread", "process"], Executor, None]):
+        """Sets the executors to use, shutting down any that were previously set."""
+        self.shutdown()
+        if executor is None:
+            return
+        if executor == "thread":
+            executor = ThreadPoolExecutor(thread_name_prefix="vizro")
+        elif executor == "process":
+            try:
+                # Processes must be forked so that they have the same models and data sources as the main process.
+                mp_context = multiprocessing.get_context("fork")
+            except ValueError as exc:
+                raise ValueError("executor='process' is only possible on platforms that support forking.") from exc
+            executor = ProcessPoolExecutor(mp_context=mp_context)
+
+        if isinstance(executor, ThreadPoolExecutor):
+            self.thread_executor = self.render_executor = executor
+        elif isinstance(executor, ProcessPoolExecutor):
+            self.thread_executor = ThreadPoolExecutor(thread_name_prefix="vizro")
+            self.render_executor = executor
+        else:
+            raise ValueError(
+                f"Unknown executor {executor!r}. Valid executors are 'thread', 'process', None, or an instance of "
+                "ThreadPoolExecutor or ProcessPoolExecutor."
+            )
+
+    def shutdown(self):
+        for executor in {self.thread_executor, self.render_executor} - {None}:
+            executor.shutdown(wait=False)
+        self.thread_executor = self.render_executor = None
+
+
+_target_executors = _TargetExecutors()
+
+
+def _map(executor: Optional[Executor], function: Callable[..., Any], *iterables: Iterable[Any]) -> list[Any]:
+    """Returns `list(map(function, *iterables))`, running the function calls concurrently in `executor` if possible.
+
+    Results are always in the same order as the iterables, regardless of the order in which the calls complete.
+    """
+    arguments = list(zip(*iterables))
+    if executor is None or len(arguments) <= 1:
+        return [function(*argument) for argument in arguments]
+    if isinstance(executor, ProcessPoolExecutor):
+        futures = [executor.submit(function, *argument) for argument in arguments]
+    else:
+        # Each thread needs a copy of the context so that it can access the Dash callback context, e.g. for set_props.
+        futures = [executor.submit(contextvars.copy_context().run, function, *argument) for argument in arguments]
+    return [future.result() for future in futures]
+
+
+class _FilterPlanEntry(NamedTuple):
+    filter_column: str
+    filter_function: Callable[[pd.Series, Any], pd.Series]
+
+
+# Maps each target to the filters that apply to it, keyed by the id of the filter's selector. This is compiled by
+# Filter.pre_build so that callbacks can look up which filters apply to a target without searching through the actions
+# of every selector on the page. Model IDs are unique across the whole dashboard, so one mapping covers all pages.
+_filter_plan: defaultdict[ModelID, dict[ModelID, list[_FilterPlanEntry]]] = defaultdict(dict)
+
+
 # Utility functions for helper functions used in pre-defined actions ----
 def _get_component_actions(component) -> list[Action]:
     return (
@@ -47,26 +240,91 @@ def _get_component_actions(component) -> list[Action]:
     )
 
 
-def _apply_filters(data_frame: pd.DataFrame, ctds_filters: list[CallbackTriggerDict], target: str) -> pd.DataFrame:
+def _update_filter_plan(selector: SelectorType) -> None:
+    """Adds the filters performed by `selector` to `_filter_plan`, replacing any existing entries for `selector`."""
+    for target_filters in _filter_plan.values():
+        target_filters.pop(selector.id, None)
+
+    for action in _get_component_actions(selector):
+        if action.function._function.__name__ != "_filter":
+            continue
+        for target in action.function["targets"]:
+            _filter_plan[target].setdefault(selector.id, []).append(
+                _FilterPlanEntry(
+                    filter_column=action.function["filter_column"], filter_function=action.function["filter_function"]
+                )
+            )
+
+
+def _estimate_filter_selectivity(selector: SelectorType, value: MultiValueType) -> float:
+    """Estimates the fraction of rows that are kept when filtering by `value` from the selector's options or range.
+
+    This is only a rough estimate that is used to decide the order in which filters are applied, so 1 is returned
+    whenever there's not enough information to make a better estimate.
+    """
+    try:
+        if getattr(selector, "options", None):
+            return min(len(value) / len(selector.options), 1.0)
+        if getattr(selector, "min", None) is not None and getattr(selector, "max", None) is not None:
+            # Unpacking raises ValueError unless value has exactly two items, i.e. it comes from a range selector.
+            low, high, selector_min, selector_max = (
+                pd.Timestamp(bound).value if not isinstance(bound, (int, float)) else bound
+                for bound in (*value, selector.min, selector.max)
+            )
+            return min(max((high - low) / (selector_max - selector_min), 0.0), 1.0)
+    except (TypeError, ValueError, ZeroDivisionError):
+        pass
+    return 1.0
+
+
+def _apply_filters(
+    data_frame: pd.DataFrame,
+    ctds_filters: list[CallbackTriggerDict],
+    target: str,
+    column_indexes: Optional[_ColumnIndexes] = None,
+) -> pd.DataFrame:
+    filters = []
+    target_filters = _filter_plan.get(target, {})
     for ctd in ctds_filters:
         selector_value = ctd["value"]
         selector_value = selector_value if isinstance(selector_value, list) else [selector_value]
-        selector_actions = _get_component_actions(model_manager[ctd["id"]])
+        if ctd["id"] not in target_filters or ALL_OPTION in selector_value:
+            continue
 
-        for action in selector_actions:
-            if (
-                action.function._function.__name__ != "_filter"
-                or target not in action.function["targets"]
-                or ALL_OPTION in selector_value
-            ):
-                continue
+        selectivity = _estimate_filter_selectivity(model_manager[ctd["id"]], selector_value)
+        filters.extend(
+            (selectivity, filter_plan_entry.filter_function, filter_plan_entry.filter_column, selector_value)
+            for filter_plan_entry in target_filters[ctd["id"]]
+        )
 
-            _filter_function = action.function["filter_function"]
-            _filter_column = action.function["filter_column"]
-            _filter_value = selector_value
-            data_frame = data_frame[_filter_function(data_frame[_filter_column], _filter_value)]
-
-    return data_frame
+    if not filters:
+        return data_frame
+
+    # Rather than slicing data_frame after each filter, which would create an intermediate DataFrame each time, we
+    # combine all the filters into a single mask and then slice data_frame just once at the end. The most selective
+    # filters are applied first so that, once only a small fraction of rows remains selected, the remaining filters can
+    # be evaluated on just those rows of the relevant column.
+    mask = np.ones(len(data_frame), dtype=bool)
+    for _, _filter_function, _filter_column, _filter_value in sorted(filters, key=lambda _filter: _filter[0]):
+        selected_positions = np.flatnonzero(mask)
+        if len(selected_positions) == 0:
+            break
+        # An index gives the mask for the whole column by looking up the selected values rather than scanning the
+        # column. This is only possible for data_frame exactly as it was loaded, i.e. before any filters are applied.
+        index_mask = None
+        if column_indexes is not None and _filter_function.__name__ == "_filter_isin":
+            index_mask = column_indexes.isin(_filter_column, data_frame[_filter_column], _filter_value)
+        elif column_indexes is not None and _filter_function.__name__ == "_filter_between":
+            index_mask = column_indexes.between(_filter_column, data_frame[_filter_column], _filter_value)
+        if index_mask is not None:
+            mask &= index_mask
+        elif len(selected_positions) < len(mask) * _SPARSE_MASK_THRESHOLD:
+            series = data_frame[_filter_column].iloc[selected_positions]
+            mask[selected_positions] = np.asarray(_filter_function(series, _filter_value), dtype=bool)
+        else:
+            mask &= np.asarray(_filter_function(data_frame[_filter_column], _filter_value), dtype=bool)
+
+    return data_frame if mask.all() else data_frame[mask]
 
 
 def _get_parent_vizro_model(_underlying_callable_object_id: str) -> VizroBaseModel:
@@ -171,34 +429,332 @@ def _get_parametrized_config(target: ModelID, ctd_parameters: list[CallbackTrigg
     return config
 
 
+def _get_applied_filter_ids(ctds_filter: list[CallbackTriggerDict], target: ModelID) -> tuple[ModelID, ...]:
+    """Gets the ids of the selectors in `ctds_filter` that filter data for `target`."""
+    target_filters = _filter_plan.get(target, {})
+    return tuple(ctd["id"] for ctd in ctds_filter if ctd["id"] in target_filters)
+
+
+def _get_applied_filter_interaction_ids(
+    ctds_filter_interaction: list[dict[str, CallbackTriggerDict]], target: ModelID
+) -> tuple[ModelID, ...]:
+    """Gets the ids of the models in `ctds_filter_interaction` that filter data for `target`."""
+    applied_filter_interaction_ids = []
+    for ctd_filter_interaction in ctds_filter_interaction:
+        triggered_model_id = ctd_filter_interaction["modelID"]["id"]
+        for action in _get_component_actions(model_manager[triggered_model_id]):
+            # filter_interaction targets can be None, in which case the filter_interaction does not apply.
+            if action.function._function.__name__ == "filter_interaction" and target in (
+                action.function["targets"] or []
+            ):
+                applied_filter_interaction_ids.append(triggered_model_id)
+                break
+    return tuple(applied_filter_interaction_ids)
+
+
+def _get_applied_controls(
+    ctds_filter: list[CallbackTriggerDict],
+    ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
+    target: ModelID,
+) -> list[Any]:
+    """Gets the values of the filters and filter interactions that apply to `target`.
+
+    Values are normalized so that e.g. the order in which options are selected in a checklist does not matter.
+    """
+    controls = []
+    target_filters = _filter_plan.get(target, {})
+    for ctd in ctds_filter:
+        selector_value = ctd["value"] if isinstance(ctd["value"], list) else [ctd["value"]]
+        if ctd["id"] not in target_filters or ALL_OPTION in selector_value:
+            continue
+        if all(entry.filter_function.__name__ == "_filter_isin" for entry in target_filters[ctd["id"]]):
+            selector_value = sorted(selector_value, key=repr)
+        controls.append([ctd["id"], selector_value])
+
+    applied_filter_interaction_ids = _get_applied_filter_interaction_ids(
+        ctds_filter_interaction=ctds_filter_interaction, target=target
+    )
+    controls.extend(
+        [[key, ctd["id"], ctd["property"], ctd["value"]] for key, ctd in sorted(ctd_filter_interaction.items())]
+        for ctd_filter_interaction in ctds_filter_interaction
+        if ctd_filter_interaction["modelID"]["id"] in applied_filter_interaction_ids
+    )
+    return controls
+
+
+def _get_filtered_data_key(
+    data_source_name: DataSourceName,
+    load_kwargs: dict[str, Any],
+    version: Optional[Hashable],
+    ctds_filter: list[CallbackTriggerDict],
+    ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
+    target: ModelID,
+) -> Optional[_FilteredDataKey]:
+    """Gets the key used to cache the data for `target` after filters and filter interactions have been applied.
+
+    Returns None if the filtered data should not be cached, e.g. because the version of the data is not known.
+    """
+    if version is None:
+        return None
+
+    controls = _get_applied_controls(
+        ctds_filter=ctds_filter, ctds_filter_interaction=ctds_filter_interaction, target=target
+    )
+    try:
+        key = _FilteredDataKey(
+            data_source_name=data_source_name,
+            load_arguments=_make_hashable(load_kwargs),
+            version=version,
+            controls=hashlib.sha256(json.dumps(controls, sort_keys=True, default=str).encode()).hexdigest(),
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_filtered_data(
+    data_load_memo: _DataLoadMemo,
+    ctds_filter: list[CallbackTriggerDict],
+    ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
+    data_source_name: DataSourceName,
+    load_kwargs: dict[str, Any],
+    target: ModelID,
+) -> tuple[pd.DataFrame, bool]:
+    """Loads data for `target` and applies filters and filter interactions to it.
+
+    Returns the filtered data and whether it was found in the filtered data cache.
+    """
+    get_filtered_data_key = partial(
+        _get_filtered_data_key,
+        data_source_name=data_source_name,
+        load_kwargs=load_kwargs,
+        ctds_filter=ctds_filter,
+        ctds_filter_interaction=ctds_filter_interaction,
+        target=target,
+    )
+    # The filtered data is looked up before loading the data so that, when only arguments that don't affect the data
+    # have changed (e.g. a parameter that targets a chart's color), the data does not need to be loaded at all.
+    version = data_load_memo.peek_version(data_source_name, **load_kwargs)
+    filtered_data_key = get_filtered_data_key(version=version)
+    if filtered_data_key is not None:
+        filtered_data = data_manager._filtered_data_cache.get(filtered_data_key, target=target)
+        if filtered_data is not None:
+            return filtered_data, True
+
+    data_frame = data_load_memo.load(data_source_name, **load_kwargs)
+    if data_load_memo.get_version(data_source_name, **load_kwargs) != version:
+        # The data has been reloaded since its version was looked up.
+        filtered_data_key = get_filtered_data_key(version=data_load_memo.get_version(data_source_name, **load_kwargs))
+
+    filtered_data = _apply_filters(
+        data_frame=data_frame,
+        ctds_filters=ctds_filter,
+        target=target,
+        column_indexes=data_load_memo.get_column_indexes(data_source_name, **load_kwargs),
+    )
+    filtered_data = _apply_filter_interaction(
+        data_frame=filtered_data, ctds_filter_interaction=ctds_filter_interaction, target=target
+    )
+    if filtered_data_key is not None:
+        filtered_data = data_manager._filtered_data_cache.set(
+            filtered_data_key, filtered_data, max_bytes=data_manager.filtered_data_cache_size, target=target
+        )
+    return filtered_data, False
+
+
+def _render_target(
+    target: ModelID,
+    data_frame: pd.DataFrame,
+    config: dict[str, Any],
+    aggregations: Optional[dict[_Aggregation, Any]] = None,
+) -> Any:
+    # This is a module-level function so that it can be pickled to run in a process pool. Aggregations that have already
+    # been computed for a KPI card are passed as an argument rather than set by the caller so that they also reach a
+    # process pool.
+    from vizro.models._components._components_utils import _render_with_figure_cache
+
+    token = _precomputed_aggregations.set(aggregations or {})
+    try:
+        return _render_with_figure_cache(target, {"data_frame": data_frame, **config})
+    finally:
+        _precomputed_aggregations.reset(token)
+
+
+def _get_target_signature(
+    data_load_memo: _DataLoadMemo,
+    ctds_filter: list[CallbackTriggerDict],
+    ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
+    parameterized_config: dict[str, Any],
+    target: ModelID,
+) -> Optional[str]:
+    """Gets a hash of everything that `target` depends on: its data, the controls that apply to it and its arguments.
+
+    `parameterized_config` is the configuration of `target` as given by `_get_parametrized_config`.
+
+    If the signature is the same as when `target` was last updated then `target` does not need to be updated again.
+    Returns None if the signature cannot be known, e.g. because the version of dynamic data is not known.
+    """
+    data_source_name = model_manager[target]["data_frame"]
+    version = data_load_memo.peek_version(data_source_name, **parameterized_config["data_frame"])
+    if version is None:
+        # The data might need to be loaded to find its version. This doesn't load the data twice since the target is
+        # then updated using the same loaded data.
+        data_load_memo.load(data_source_name, **parameterized_config["data_frame"])
+        version = data_load_memo.get_version(data_source_name, **parameterized_config["data_frame"])
+        if version is None:
+            return None
+
+    signature = [
+        data_source_name,
+        version,
+        _get_applied_controls(ctds_filter=ctds_filter, ctds_filter_interaction=ctds_filter_interaction, target=target),
+        parameterized_config,
+    ]
+    return hashlib.sha256(json.dumps(signature, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _get_target_group(
+    ctds_filter: list[CallbackTriggerDict],
+    ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
+    load_kwargs: dict[str, Any],
+    target: ModelID,
+) -> Hashable:
+    """Gets the group of targets that have the same filtered data as `target`.
+
+    Targets that use the same data source with the same load arguments and the same filters and filter interactions end
+    up with the same filtered data.
+    """
+    group = (
+        model_manager[target]["data_frame"],
+        _make_hashable(load_kwargs),
+        _get_applied_filter_ids(ctds_filter=ctds_filter, target=target),
+        _get_applied_filter_interaction_ids(ctds_filter_interaction=ctds_filter_interaction, target=target),
+    )
+    try:
+        hash(group)
+    except TypeError:
+        # Load arguments that cannot be hashed are very unlikely, but if they occur then don't share filtered data.
+        return target
+    return group
+
+
+def _get_precomputed_aggregations(
+    ctds_filter: list[CallbackTriggerDict],
+    ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
+    targets: list[ModelID],
+    filtered_data: dict[ModelID, pd.DataFrame],
+    parameterized_configs: dict[ModelID, dict[str, Any]],
+) -> dict[ModelID, dict[_Aggregation, Any]]:
+    """Computes the aggregations of KPI card targets that have the same filtered data together.
+
+    Each distinct aggregation is computed just once for each group of targets with the same filtered data. Returns the
+    aggregations that each KPI card target needs, to be passed to `_render_target`.
+    """
+    target_aggregations: dict[ModelID, _Aggregation] = {}
+    group_targets: defaultdict[Hashable, list[ModelID]] = defaultdict(list)
+    for target in targets:
+        # The "data_frame" key is only used for loading data and so is not an argument of the card.
+        config = {key: value for key, value in parameterized_configs[target].items() if key != "data_frame"}
+        aggregation = _get_kpi_card_aggregation(model_manager[target].figure, config)
+        if aggregation is None:
+            continue
+        group = _get_target_group(
+            ctds_filter=ctds_filter,
+            ctds_filter_interaction=ctds_filter_interaction,
+            load_kwargs=parameterized_configs[target]["data_frame"],
+            target=target,
+        )
+        target_aggregations[target] = aggregation
+        group_targets[group].append(target)
+
+    precomputed_aggregations = {}
+    for targets_in_group in group_targets.values():
+        # All the targets in a group have the same filtered data, so it doesn't matter which one is aggregated.
+        data_frame = filtered_data[targets_in_group[0]]
+        aggregations = {}
+        for target in targets_in_group:
+            aggregation = target_aggregations[target]
+            if aggregation not in aggregations:
+                aggregations[aggregation] = _aggregate(data_frame, aggregation)
+            precomputed_aggregations[target] = {aggregation: aggregations[aggregation]}
+    return precomputed_aggregations
+
+
 # Helper functions used in pre-defined actions ----
 def _get_targets_data_and_config(
     ctds_filter: list[CallbackTriggerDict],
     ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
     ctds_parameters: list[CallbackTriggerDict],
     targets: list[ModelID],
+    data_load_memo: Optional[_DataLoadMemo] = None,
+    parameterized_configs: Optional[dict[ModelID, dict[str, Any]]] = None,
 ):
+    """Gets the filtered data and the configuration given by parameters for each of `targets`.
+
+    `parameterized_configs` can give configurations of targets that have already been found with
+    `_get_parametrized_config`, so that they don't need to be found again.
+    """
     all_filtered_data = {}
     all_parameterized_config = {}
+    data_load_memo = data_load_memo or _DataLoadMemo()
+    parameterized_configs = parameterized_configs or {}
+    # Targets in the same group end up with the same filtered data. The filtering is done just once for each group of
+    # targets, using the first target in the group.
+    target_groups: dict[ModelID, Any] = {}
+    group_targets: dict[Any, ModelID] = {}
 
     for target in targets:
         # parametrized_config includes a key "data_frame" that is used in the data loading function.
-        parameterized_config = _get_parametrized_config(target=target, ctd_parameters=ctds_parameters)
-        data_source_name = model_manager[target]["data_frame"]
-        data_frame = data_manager[data_source_name].load(**parameterized_config["data_frame"])
+        parameterized_config = parameterized_configs.get(target) or _get_parametrized_config(
+            target=target, ctd_parameters=ctds_parameters
+        )
 
-        filtered_data = _apply_filters(data_frame=data_frame, ctds_filters=ctds_filter, target=target)
-        filtered_data = _apply_filter_interaction(
-            data_frame=filtered_data, ctds_filter_interaction=ctds_filter_interaction, target=target
+        group = _get_target_group(
+            ctds_filter=ctds_filter,
+            ctds_filter_interaction=ctds_filter_interaction,
+            load_kwargs=parameterized_config["data_frame"],
+            target=target,
         )
+        target_groups[target] = group
+        group_targets.setdefault(group, target)
+        all_parameterized_config[target] = parameterized_config
+
+    # Groups are independent of each other and so are loaded and filtered concurrently.
+    filtered_data_by_group = dict(
+        zip(
+            group_targets,
+            _map(
+                _target_executors.thread_executor,
+                lambda target: _get_filtered_data(
+                    data_load_memo=data_load_memo,
+                    ctds_filter=ctds_filter,
+                    ctds_filter_interaction=ctds_filter_interaction,
+                    data_source_name=model_manager[target]["data_frame"],
+                    load_kwargs=all_parameterized_config[target]["data_frame"],
+                    target=target,
+                ),
+                group_targets.values(),
+            ),
+        )
+    )
 
+    for target in targets:
+        # Each target gets its own shallow copy of the filtered data so that e.g. adding a column for one target does
+        # not affect another target in the same group.
+        all_filtered_data[target] = filtered_data_by_group[target_groups[target]][0].copy(deep=False)
         # Parameters affecting data_frame have already been used above in data loading and so are excluded from
         # all_parameterized_config.
-        all_filtered_data[target] = filtered_data
         all_parameterized_config[target] = {
-            key: value for key, value in parameterized_config.items() if key != "data_frame"
+            key: value for key, value in all_parameterized_config[target].items() if key != "data_frame"
         }
 
+    logger.debug(
+        "Loaded data %d times and filtered data %d times for %d targets",
+        data_load_memo.loads,
+        sum(not filtered_data_cache_hit for _, filtered_data_cache_hit in filtered_data_by_group.values()),
+        len(targets),
+    )
     return all_filtered_data, all_parameterized_config
 
 
@@ -207,18 +763,74 @@ def _get_modified_page_figures(
     ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
     ctds_parameters: list[CallbackTriggerDict],
     targets: Optional[list[ModelID]] = None,
+    ctd_target_signatures: Optional[CallbackTriggerDict] = None,
 ) -> dict[str, Any]:
+    """Gets the updated outputs of `targets`.
+
+    If `ctd_target_signatures` is given then it holds the signatures of the targets as they are currently shown on the
+    page. Targets whose signature has not changed are not updated and instead give `dash.no_update`, and the new
+    signatures are returned as an additional output for the signatures' component.
+    """
     targets = targets or []
+    data_load_memo = _DataLoadMemo()
+    modified_targets = targets
+    # Building the configuration of a target copies all its arguments, so this is done just once for each target.
+    parameterized_configs = {
+        target: _get_parametrized_config(target=target, ctd_parameters=ctds_parameters) for target in targets
+    }
+
+    if ctd_target_signatures is not None:
+        previous_target_signatures = ctd_target_signatures["value"] or {}
+        target_signatures = {
+            target: _get_target_signature(
+                data_load_memo=data_load_memo,
+                ctds_filter=ctds_filter,
+                ctds_filter_interaction=ctds_filter_interaction,
+                parameterized_config=parameterized_configs[target],
+                target=target,
+            )
+            for target in targets
+        }
+        modified_targets = [
+            target
+            for target in targets
+            if target_signatures[target] is None or target_signatures[target] != previous_target_signatures.get(target)
+        ]
+        logger.debug("Updating %d of %d targets with changed inputs", len(modified_targets), len(targets))
 
     filtered_data, parameterized_config = _get_targets_data_and_config(
         ctds_filter=ctds_filter,
         ctds_filter_interaction=ctds_filter_interaction,
         ctds_parameters=ctds_parameters,
-        targets=targets,
+        targets=modified_targets,
+        data_load_memo=data_load_memo,
+        parameterized_configs=parameterized_configs,
     )
 
-    outputs: dict[str, Any] = {}
-    for target in targets:
-        outputs[target] = model_manager[target](data_frame=filtered_data[target], **parameterized_config[target])
+    # KPI cards that show the same filtered data share their aggregations.
+    precomputed_aggregations = _get_precomputed_aggregations(
+        ctds_filter=ctds_filter,
+        ctds_filter_interaction=ctds_filter_interaction,
+        targets=modified_targets,
+        filtered_data=filtered_data,
+        parameterized_configs=parameterized_configs,
+    )
 
-    return outputs
+    # Targets are rendered concurrently but outputs are always in the same order as targets.
+    outputs = _map(
+        _target_executors.render_executor,
+        _render_target,
+        modified_targets,
+        [filtered_data[target] for target in modified_targets],
+        [parameterized_config[target] for target in modified_targets],
+        [precomputed_aggregations.get(target) for target in modified_targets],
+    )
+    modified_page_figures = {target: dash.no_update for target in targets}
+    modified_page_figures.update(zip(modified_targets, outputs))
+
+    if ctd_target_signatures is not None:
+        new_target_signatures = {**previous_target_signatures, **target_signatures}
+        modified_page_figures[ctd_target_signatures["id"]] = {
+            target: signature for target, signature in new_target_signatures.items() if signature is not None
+        }
+    return modified_page_figures
@@ -4,6 +4,7 @@ from typing import Any, Callable, Union
 
 from dash import Output, State, dcc
 
+from vizro._constants import TARGET_SIGNATURES_PREFIX
 from vizro.actions import _parameter, filter_interaction
 from vizro.managers import model_manager
 from vizro.managers._model_manager import ModelID
@@ -71,10 +72,41 @@ def _get_action_callback_inputs(action_id: ModelID) -> dict[str, list[Union[Stat
         "filter_interaction": _get_inputs_of_figure_interactions(
             page=page, action_function=filter_interaction.__wrapped__
         ),
+        "target_signatures": State(component_id=f"{TARGET_SIGNATURES_PREFIX}_{page.id}", component_property="data"),
     }
     return action_input_mapping
 
 
+def _get_zoom_callback_inputs(action_id: ModelID) -> dict[str, Union[list[State], State]]:
+    """Creates mapping of `_zoom` action inputs, which also include the relayoutData of the zoomed graph."""
+    graph = model_manager._get_action_trigger(action_id=action_id)
+    return {
+        **_get_action_callback_inputs(action_id=action_id),
+        "relayout_data": State(component_id=graph.id, component_property="relayoutData"),
+    }
+
+
+def _get_get_rows_callback_inputs(action_id: ModelID) -> dict[str, Union[list[State], State]]:
+    """Creates mapping of `_get_rows` action inputs, which also include the getRowsRequest of the AG Grid."""
+    ag_grid = model_manager._get_action_trigger(action_id=action_id)
+    return {
+        **_get_action_callback_inputs(action_id=action_id),
+        "get_rows_request": State(component_id=ag_grid._input_component_id, component_property="getRowsRequest"),
+    }
+
+
+def _get_get_page_callback_inputs(action_id: ModelID) -> dict[str, Union[list[State], State]]:
+    """Creates mapping of `_get_page` action inputs, which also include the page, sorting and filter of the Table."""
+    table = model_manager._get_action_trigger(action_id=action_id)
+    return {
+        **_get_action_callback_inputs(action_id=action_id),
+        **{
+            argument: State(component_id=table._input_component_id, component_property=argument)
+            for argument in ["page_current", "page_size", "sort_by", "filter_query"]
+        },
+    }
+
+
 # CALLBACK OUTPUTS --------------
 def _get_action_callback_outputs(action_id: ModelID) -> dict[str, Output]:
     """Creates mapping of target names and their `Output`."""
@@ -93,7 +125,7 @@ def _get_action_callback_outputs(action_id: ModelID) -> dict[str, Output]:
     if action_function == _parameter.__wrapped__:
         targets = [target.split(".")[0] for target in targets]
 
-    return {
+    outputs = {
         target: Output(
             component_id=target,
             component_property=model_manager[target]._output_component_property,
@@ -101,6 +133,52 @@ def _get_action_callback_outputs(action_id: ModelID) -> dict[str, Output]:
         )
         for target in targets
     }
+    # The signatures of the targets are updated so that targets whose inputs do not change in the next action are not
+    # updated again.
+    target_signatures_id = f"{TARGET_SIGNATURES_PREFIX}_{model_manager._get_model_page_id(model_id=action_id)}"
+    outputs[target_signatures_id] = Output(
+        component_id=target_signatures_id, component_property="data", allow_duplicate=True
+    )
+    return outputs
+
+
+def _get_zoom_callback_outputs(action_id: ModelID) -> dict[str, Output]:
+    """Creates mapping of target names and their `Output` for `_zoom` action."""
+    # Unlike other actions, _zoom does not update the target signatures. A zoomed graph still shows the same inputs,
+    # just in more detail, so it should be fully updated when those inputs change.
+    return {
+        target: Output(component_id=target, component_property="figure", allow_duplicate=True)
+        for target in model_manager[action_id].function["targets"]
+    }
+
+
+def _get_get_rows_callback_outputs(action_id: ModelID) -> dict[str, Output]:
+    """Creates mapping of target names and their `Output` for `_get_rows` action."""
+    # Like _zoom, _get_rows does not update the target signatures since the targets still show the same inputs.
+    return {
+        target: Output(
+            component_id=model_manager[target]._input_component_id,
+            component_property="getRowsResponse",
+            allow_duplicate=True,
+        )
+        for target in model_manager[action_id].function["targets"]
+    }
+
+
+def _get_get_page_callback_outputs(action_id: ModelID) -> dict[str, dict[str, Output]]:
+    """Creates mapping of target names and their `Output`s of data and number of pages for `_get_page` action."""
+    # Like _zoom, _get_page does not update the target signatures since the targets still show the same inputs.
+    return {
+        target: {
+            component_property: Output(
+                component_id=model_manager[target]._input_component_id,
+                component_property=component_property,
+                allow_duplicate=True,
+            )
+            for component_property in ["data", "page_count"]
+        }
+        for target in model_manager[action_id].function["targets"]
+    }
 
 
 def _get_export_data_callback_outputs(action_id: ModelID) -> dict[str, Output]:
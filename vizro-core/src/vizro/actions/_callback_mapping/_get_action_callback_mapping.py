@@ -1,6 +1,6 @@
 """Creates action_callback_mapping to map callback arguments to action functions."""
 
-from typing import Any, Union
+from typing import Any, Callable, Union
 
 from dash import dcc
 from dash.dependencies import DashDependency
@@ -11,21 +11,26 @@ from vizro.actions._callback_mapping._callback_mapping_utils import (
     _get_action_callback_outputs,
     _get_export_data_callback_components,
     _get_export_data_callback_outputs,
+    _get_get_page_callback_inputs,
+    _get_get_page_callback_outputs,
+    _get_get_rows_callback_inputs,
+    _get_get_rows_callback_outputs,
+    _get_zoom_callback_inputs,
+    _get_zoom_callback_outputs,
 )
 from vizro.actions._filter_action import _filter
+from vizro.actions._get_page_action import _get_page
+from vizro.actions._get_rows_action import _get_rows
 from vizro.actions._on_page_load_action import _on_page_load
 from vizro.actions._parameter_action import _parameter
+from vizro.actions._zoom_action import _zoom
 from vizro.managers import model_manager
 from vizro.managers._model_manager import ModelID
 
 
-def _get_action_callback_mapping(
-    action_id: ModelID, argument: str
-) -> Union[list[dcc.Download], dict[str, DashDependency]]:
-    """Creates mapping of action name and required callback input/output."""
-    action_function = model_manager[action_id].function._function
-
-    action_callback_mapping: dict[str, Any] = {
+def _get_predefined_action_callback_mapping() -> dict[Callable[..., Any], dict[str, Callable[..., Any]]]:
+    """Creates mapping of predefined action functions and the functions that give their callback inputs/outputs."""
+    return {
         export_data.__wrapped__: {
             "inputs": _get_action_callback_inputs,
             "components": _get_export_data_callback_components,
@@ -47,7 +52,31 @@ def _get_action_callback_mapping(
             "inputs": _get_action_callback_inputs,
             "outputs": _get_action_callback_outputs,
         },
+        _zoom.__wrapped__: {
+            "inputs": _get_zoom_callback_inputs,
+            "outputs": _get_zoom_callback_outputs,
+        },
+        _get_rows.__wrapped__: {
+            "inputs": _get_get_rows_callback_inputs,
+            "outputs": _get_get_rows_callback_outputs,
+        },
+        _get_page.__wrapped__: {
+            "inputs": _get_get_page_callback_inputs,
+            "outputs": _get_get_page_callback_outputs,
+        },
     }
-    action_call = action_callback_mapping.get(action_function, {}).get(argument)
+
+
+def _is_predefined_action(action_id: ModelID) -> bool:
+    """Whether the action's function is one of Vizro's predefined actions rather than a custom action."""
+    return model_manager[action_id].function._function in _get_predefined_action_callback_mapping()
+
+
+def _get_action_callback_mapping(
+    action_id: ModelID, argument: str
+) -> Union[list[dcc.Download], dict[str, DashDependency]]:
+    """Creates mapping of action name and required callback input/output."""
+    action_function = model_manager[action_id].function._function
+    action_call = _get_predefined_action_callback_mapping().get(action_function, {}).get(argument)
     default_value: Union[list[dcc.Download], dict[str, DashDependency]] = [] if argument == "components" else {}
     return default_value if not action_call else action_call(action_id=action_id)
@@ -35,4 +35,5 @@ def _filter(
         ctds_filter=ctx.args_grouping["external"]["filters"],
         ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
         ctds_parameters=ctx.args_grouping["external"]["parameters"],
+        ctd_target_signatures=ctx.args_grouping["external"].get("target_signatures"),
     )
@@ -0,0 +1,43 @@
+"""Pre-defined action function "_get_page" to be reused in `action` parameter of VizroBaseModels."""
+
+from typing import Any
+
+from dash import ctx
+
+from vizro.actions._actions_utils import _get_targets_data_and_config
+from vizro.managers import model_manager
+from vizro.managers._model_manager import ModelID
+from vizro.models.types import capture
+
+
+@capture("action")
+def _get_page(targets: list[ModelID], **inputs: dict[str, Any]) -> dict[str, Any]:
+    """Gets the current page of targeted tables that are paged, sorted and filtered on the server.
+
+    The rows are taken from the data filtered by the current state of the page's controls, and are then filtered and
+    sorted by the table's own `filter_query` and `sort_by`.
+
+    Args:
+        targets: List of target component ids of Tables to get the current page for.
+        inputs: Dict mapping action function names with their inputs e.g.
+            inputs = {'filters': [], 'parameters': [], 'filter_interaction': [], 'page_current': 0, 'page_size': 10,
+            'sort_by': [], 'filter_query': ''}
+
+    Returns:
+        Dict mapping target component ids to the data and number of pages of the table e.g.
+            {'my_table': {'data': [], 'page_count': 1}}
+
+    """
+    filtered_data, _ = _get_targets_data_and_config(
+        ctds_filter=ctx.args_grouping["external"]["filters"],
+        ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
+        ctds_parameters=ctx.args_grouping["external"]["parameters"],
+        targets=targets,
+    )
+    page_request = {
+        argument: ctx.args_grouping["external"][argument]["value"]
+        for argument in ["page_current", "page_size", "sort_by", "filter_query"]
+    }
+    return {
+        target: model_manager[target]._get_page_response(filtered_data[target], **page_request) for target in targets
+    }
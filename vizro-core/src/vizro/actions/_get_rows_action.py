@@ -0,0 +1,41 @@
+"""Pre-defined action function "_get_rows" to be reused in `action` parameter of VizroBaseModels."""
+
+from typing import Any
+
+from dash import ctx, no_update
+
+from vizro.actions._actions_utils import _get_targets_data_and_config
+from vizro.managers import model_manager
+from vizro.managers._model_manager import ModelID
+from vizro.models.types import capture
+
+
+@capture("action")
+def _get_rows(targets: list[ModelID], **inputs: dict[str, Any]) -> dict[str, Any]:
+    """Gets the block of rows requested by targeted AG Grids that use the infinite row model.
+
+    The rows are taken from the data filtered by the current state of the page's controls, and are then filtered and
+    sorted by the grid's own column filters and sorting.
+
+    Args:
+        targets: List of target component ids of AG Grids to get rows for.
+        inputs: Dict mapping action function names with their inputs e.g.
+            inputs = {'filters': [], 'parameters': [], 'filter_interaction': [], 'get_rows_request': {}}
+
+    Returns:
+        Dict mapping target component ids to the block of rows e.g. {'my_ag_grid': {'rowData': [], 'rowCount': 0}}
+
+    """
+    get_rows_request = ctx.args_grouping["external"]["get_rows_request"]["value"]
+    if not get_rows_request:
+        return {target: no_update for target in targets}
+
+    filtered_data, _ = _get_targets_data_and_config(
+        ctds_filter=ctx.args_grouping["external"]["filters"],
+        ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
+        ctds_parameters=ctx.args_grouping["external"]["parameters"],
+        targets=targets,
+    )
+    return {
+        target: model_manager[target]._get_rows_response(filtered_data[target], get_rows_request) for target in targets
+    }
@@ -27,4 +27,5 @@ def _on_page_load(targets: list[ModelID], **inputs: dict[str, Any]) -> dict[str,
         ctds_filter=ctx.args_grouping["external"]["filters"],
         ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
         ctds_parameters=ctx.args_grouping["external"]["parameters"],
+        ctd_target_signatures=ctx.args_grouping["external"].get("target_signatures"),
     )
@@ -2,9 +2,10 @@
 
 from typing import Any
 
-from dash import ctx
+from dash import ctx, no_update
 
-from vizro.actions._actions_utils import _get_modified_page_figures
+from vizro.actions._actions_utils import _create_target_arg_mapping, _get_modified_page_figures
+from vizro.managers import model_manager
 from vizro.managers._model_manager import ModelID
 from vizro.models.types import capture
 
@@ -19,14 +20,27 @@ def _parameter(targets: list[str], **inputs: dict[str, Any]) -> dict[str, Any]:
             inputs = {'filters': [], 'parameters': ['gdpPercap'], 'filter_interaction': []}
 
     Returns:
-        Dict mapping target component ids to modified charts/components e.g. {'my_scatter': Figure({})}
+        Dict mapping target component ids to modified charts/components e.g. {'my_scatter': Figure({})}. When only
+        layout arguments of a figure change, the figure is replaced by a `dash.Patch` that updates just the layout
+        properties set by those arguments.
 
     """
-    target_ids: list[ModelID] = [target.split(".")[0] for target in targets]  # type: ignore[misc]
+    target_to_args = _create_target_arg_mapping(targets)
+    target_ids: list[ModelID] = list(target_to_args)  # type: ignore[arg-type]
 
-    return _get_modified_page_figures(
+    outputs = _get_modified_page_figures(
         targets=target_ids,
         ctds_filter=ctx.args_grouping["external"]["filters"],
         ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
         ctds_parameters=ctx.args_grouping["external"]["parameters"],
+        ctd_target_signatures=ctx.args_grouping["external"].get("target_signatures"),
     )
+
+    for target, args in target_to_args.items():
+        target_model = model_manager[target]
+        if outputs[target] is not no_update and hasattr(target_model, "_get_layout_patch"):
+            if target_model._is_layout_only(args):
+                # The trace data in the browser is unchanged, so only the (much smaller) layout needs to be sent.
+                outputs[target] = target_model._get_layout_patch(outputs[target], args)
+
+    return outputs
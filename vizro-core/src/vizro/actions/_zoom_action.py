@@ -0,0 +1,57 @@
+"""Pre-defined action function "_zoom" to be reused in `action` parameter of VizroBaseModels."""
+
+from typing import Any
+
+from dash import ctx, no_update
+
+from vizro.actions._actions_utils import _get_targets_data_and_config, _render_target
+from vizro.managers import model_manager
+from vizro.managers._model_manager import ModelID
+from vizro.models.types import capture
+
+
+@capture("action")
+def _zoom(targets: list[ModelID], **inputs: dict[str, Any]) -> dict[str, Any]:
+    """Reloads the trace data of targeted graphs for the x-axis range that has been zoomed into.
+
+    Data outside the zoomed range is dropped before the graph is rendered, so that the graph's `max_points` are all
+    spent on the visible range. Only the trace data and x-axis range of the graph are updated.
+
+    Args:
+        targets: List of target component ids of graphs to reload on zoom.
+        inputs: Dict mapping action function names with their inputs e.g.
+            inputs = {'filters': [], 'parameters': ['gdpPercap'], 'filter_interaction': [], 'relayout_data': {}}
+
+    Returns:
+        Dict mapping target component ids to `dash.Patch` objects that update trace data e.g. {'my_scatter': Patch()}
+
+    """
+    relayout_data = ctx.args_grouping["external"]["relayout_data"]["value"] or {}
+    if "xaxis.range[0]" in relayout_data:
+        x_range = [relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"]]
+    elif "xaxis.range" in relayout_data:
+        x_range = relayout_data["xaxis.range"]
+    elif relayout_data.get("xaxis.autorange"):
+        # Zoom has been reset, so the full range is shown again.
+        x_range = None
+    else:
+        # Other layout changes, e.g. zooming just the y-axis or resizing the graph, don't need new data.
+        return {target: no_update for target in targets}
+
+    filtered_data, parameterized_config = _get_targets_data_and_config(
+        ctds_filter=ctx.args_grouping["external"]["filters"],
+        ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
+        ctds_parameters=ctx.args_grouping["external"]["parameters"],
+        targets=targets,
+    )
+
+    outputs = {}
+    for target in targets:
+        graph = model_manager[target]
+        data_frame = filtered_data[target]
+        if x_range is not None:
+            data_frame = graph._select_x_range(data_frame, parameterized_config[target], x_range)
+        outputs[target] = graph._get_zoom_patch(
+            _render_target(target, data_frame, parameterized_config[target]), x_range
+        )
+    return outputs
@@ -33,4 +33,5 @@ def filter_interaction(targets: Optional[list[ModelID]] = None, **inputs: dict[s
         ctds_filter=ctx.args_grouping["external"]["filters"],
         ctds_filter_interaction=ctx.args_grouping["external"]["filter_interaction"],
         ctds_parameters=ctx.args_grouping["external"]["parameters"],
+        ctd_target_signatures=ctx.args_grouping["external"].get("target_signatures"),
     )
@@ -1,13 +1,37 @@
 """Contains default KPI card functions."""
 
-from typing import Optional
+import inspect
+from contextvars import ContextVar
+from typing import Any, Optional
 
 import dash_bootstrap_components as dbc
 import numpy as np
 import pandas as pd
 from dash import html
 
-from vizro.models.types import capture
+from vizro.models.types import CapturedCallable, capture
+
+# A KPI card aggregation is given by the aggregation function and the columns it aggregates.
+_Aggregation = tuple[str, tuple[str, ...]]
+
+# Aggregations of the data given to a KPI card that have been computed before the card is rendered. When several KPI
+# cards show the same filtered data, the action that updates them computes each distinct aggregation just once and sets
+# this while each card is rendered.
+_precomputed_aggregations: ContextVar[dict[_Aggregation, Any]] = ContextVar("_precomputed_aggregations")
+
+
+def _aggregate(data_frame: pd.DataFrame, aggregation: _Aggregation) -> Any:
+    """Aggregates columns of `data_frame`, giving a single value for one column and a Series for several columns."""
+    agg_func, columns = aggregation
+    return data_frame[columns[0]].agg(agg_func) if len(columns) == 1 else data_frame[list(columns)].agg(agg_func)
+
+
+def _get_aggregation(data_frame: pd.DataFrame, aggregation: _Aggregation) -> Any:
+    """Gets an aggregation of `data_frame`, using the precomputed aggregation if there is one."""
+    precomputed_aggregations = _precomputed_aggregations.get({})
+    if aggregation in precomputed_aggregations:
+        return precomputed_aggregations[aggregation]
+    return _aggregate(data_frame, aggregation)
 
 
 @capture("figure")
@@ -60,7 +84,7 @@ def kpi_card(
 
     """
     title = title or f"{agg_func} {value_column}".title()
-    value = data_frame[value_column].agg(agg_func)
+    value = _get_aggregation(data_frame, (agg_func, (value_column,)))
 
     header = dbc.CardHeader(
         [
@@ -130,7 +154,7 @@ def kpi_card_reference(  # noqa: PLR0913
 
     """
     title = title or f"{agg_func} {value_column}".title()
-    value, reference = data_frame[[value_column, reference_column]].agg(agg_func)
+    value, reference = _get_aggregation(data_frame, (agg_func, (value_column, reference_column)))
     delta = value - reference
     delta_relative = delta / reference if reference else np.nan
 
@@ -156,3 +180,15 @@ def kpi_card_reference(  # noqa: PLR0913
         className="color-pos" if delta > 0 else "color-neg" if delta < 0 else "",
     )
     return dbc.Card([header, body, footer], className="card-kpi")
+
+
+def _get_kpi_card_aggregation(figure: CapturedCallable, config: dict[str, Any]) -> Optional[_Aggregation]:
+    """Gets the aggregation computed by a KPI card with arguments `config`, or None if `figure` isn't a KPI card."""
+    if figure._function not in {kpi_card.__wrapped__, kpi_card_reference.__wrapped__}:
+        return None
+    arguments = inspect.signature(figure._function).bind_partial(**config)
+    arguments.apply_defaults()
+    columns = [arguments.arguments["value_column"]]
+    if "reference_column" in arguments.arguments:
+        columns.append(arguments.arguments["reference_column"])
+    return arguments.arguments["agg_func"], tuple(columns)
@@ -5,13 +5,19 @@ from __future__ import annotations
 import functools
 import logging
 import os
+import threading
+import uuid
 import warnings
+from collections import OrderedDict
+from collections.abc import Hashable
 from functools import partial
-from typing import Callable, Optional, Union
+from typing import Any, Callable, NamedTuple, Optional, Union
 
+import numpy as np
 import pandas as pd
 import wrapt
 from flask_caching import Cache
+from pandas.api.types import is_datetime64_any_dtype
 
 from vizro.managers._managers_utils import _state_modifier
 
@@ -23,6 +29,154 @@ logger = logging.getLogger(__name__)
 DataSourceName = str
 pd_DataFrameCallable = Callable[..., pd.DataFrame]
 
+# Distinct values are only stored in the column statistics for columns with at most this many distinct values.
+DISTINCT_VALUES_CAP = 10_000
+# Column indexes are kept for at most this many versions of each data source, e.g. for different load arguments.
+_COLUMN_INDEXES_CAP = 8
+
+
+class _ColumnStatistics(NamedTuple):
+    dtype: Any
+    min: Any
+    max: Any
+    null_count: int
+    # None if the column has more than DISTINCT_VALUES_CAP distinct values.
+    distinct_values: Optional[list[Any]]
+
+
+def _compute_column_statistics(data: pd.DataFrame) -> dict[str, _ColumnStatistics]:
+    column_statistics = {}
+    for column, series in data.items():
+        try:
+            column_min, column_max = series.min(), series.max()
+        except TypeError:
+            # Columns with mixed types that cannot be compared to each other have no min or max.
+            column_min = column_max = None
+        distinct_values = series.drop_duplicates()
+        column_statistics[column] = _ColumnStatistics(
+            dtype=series.dtype,
+            min=column_min,
+            max=column_max,
+            null_count=int(series.isna().sum()),
+            distinct_values=distinct_values.tolist() if len(distinct_values) <= DISTINCT_VALUES_CAP else None,
+        )
+    return column_statistics
+
+
+def _normalize_dates(series: pd.Series) -> pd.Series:
+    """Removes the time part of every value in `series` as `_filter_between` and `_filter_isin` do."""
+    return pd.to_datetime(series.dt.date)
+
+
+class _ColumnIndexes:
+    """Indexes of the columns of one particular version of a data source.
+
+    Two kinds of index are used for each column in `columns`, depending on how the column is filtered:
+        * for filtering by a set of values, the row positions of every distinct value are found once, so that the
+        column does not need to be scanned to find the rows that match the values
+        * for filtering by a range, the column's values are sorted once, so that the rows that lie in the range can be
+        found by binary search
+
+    Whether or not they are indexed, date columns are converted to dates without their time just once, since this is
+    much slower than the filtering itself.
+
+    Each index is built lazily the first time the column is filtered and then reused until the data is reloaded, at
+    which point a new `_ColumnIndexes` is used.
+    """
+
+    def __init__(self, columns: list[str]):
+        self.columns = frozenset(columns)
+        # Maps column to (distinct values, row positions sorted by value, boundaries of each value in row positions).
+        self.__categorical_indexes: dict[str, tuple[pd.Series, np.ndarray, np.ndarray]] = {}
+        # Maps column to (sorted non-null values, row positions of these values).
+        self.__sorted_indexes: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        # Maps date column to its values with time 00:00:00.
+        self.__normalized_dates: dict[str, pd.Series] = {}
+
+    def __get_normalized_dates(self, column: str, series: pd.Series) -> pd.Series:
+        if column not in self.__normalized_dates:
+            logger.debug("Normalizing dates of column %s", column)
+            self.__normalized_dates[column] = _normalize_dates(series)
+        return self.__normalized_dates[column]
+
+    def isin(self, column: str, series: pd.Series, values: list[Any]) -> Optional[np.ndarray]:
+        """Returns a boolean mask equivalent to `_filter_isin(series, values)`, or None if the index cannot be used."""
+        if is_datetime64_any_dtype(series):
+            # Dates are not indexed, but they are compared without their time just as in _filter_isin.
+            return self.__get_normalized_dates(column, series).isin(pd.to_datetime(values)).to_numpy()
+        # Null values need special handling that's done by series.isin, so these are not indexed.
+        if column not in self.columns or pd.isna(values).any():
+            return None
+
+        if column not in self.__categorical_indexes:
+            logger.debug("Building index for column %s", column)
+            codes, uniques = pd.factorize(series)
+            positions = np.argsort(codes, kind="stable")
+            boundaries = np.searchsorted(codes[positions], np.arange(len(uniques) + 1))
+            self.__categorical_indexes[column] = (pd.Series(uniques), positions, boundaries)
+
+        uniques, positions, boundaries = self.__categorical_indexes[column]
+        mask = np.zeros(len(series), dtype=bool)
+        # Using isin on the distinct values rather than the whole column gives exactly the same matching behavior as
+        # series.isin, e.g. when values are of a different type to the column.
+        for code in np.flatnonzero(uniques.isin(values)):
+            mask[positions[boundaries[code] : boundaries[code + 1]]] = True
+        return mask
+
+    def between(self, column: str, series: pd.Series, values: list[Any]) -> Optional[np.ndarray]:
+        """Returns a boolean mask equivalent to `_filter_between(series, values)`, or None if the index cannot be used.
+
+        As in `_filter_between`, the time part of dates is ignored so that a range includes all times on its end date.
+        """
+        if is_datetime64_any_dtype(series) and column not in self.columns:
+            return (
+                self.__get_normalized_dates(column, series)
+                .between(*pd.to_datetime(values), inclusive="both")
+                .to_numpy()
+            )
+        if column not in self.columns:
+            return None
+
+        if is_datetime64_any_dtype(series):
+            low, high = (value.to_datetime64() for value in pd.to_datetime(values))
+        elif isinstance(series.dtype, np.dtype) and series.dtype.kind in "iuf":
+            low, high = values
+        else:
+            return None
+
+        if column not in self.__sorted_indexes:
+            logger.debug("Building sorted index for column %s", column)
+            normalized_series = (
+                self.__get_normalized_dates(column, series) if is_datetime64_any_dtype(series) else series
+            )
+            non_null_positions = np.flatnonzero(normalized_series.notna().to_numpy())
+            non_null_values = normalized_series.to_numpy()[non_null_positions]
+            order = np.argsort(non_null_values, kind="stable")
+            self.__sorted_indexes[column] = (non_null_values[order], non_null_positions[order])
+
+        sorted_values, positions = self.__sorted_indexes[column]
+        start, end = np.searchsorted(sorted_values, low, "left"), np.searchsorted(sorted_values, high, "right")
+        mask = np.zeros(len(series), dtype=bool)
+        mask[positions[start:end]] = True
+        return mask
+
+
+def _get_or_add_column_indexes(
+    column_indexes: dict[Any, _ColumnIndexes], indexed_columns: list[str], version: Any
+) -> Optional[_ColumnIndexes]:
+    """Returns the column indexes for `version` of a data source from `column_indexes`, creating them if required.
+
+    Column indexes are used even when there are no `indexed_columns` so that dates are only normalized once for each
+    version. Only the most recently used versions are kept so that indexes of data that has been reloaded are discarded.
+    """
+    if version is None:
+        return None
+    indexes = column_indexes.pop(version, None) or _ColumnIndexes(indexed_columns)
+    column_indexes[version] = indexes
+    for old_version in list(column_indexes)[:-_COLUMN_INDEXES_CAP]:
+        column_indexes.pop(old_version, None)
+    return indexes
+
 
 # TODO: consider merging with model_utils _log_call. Using wrapt.decorator is probably better than functools here.
 #  Might need messages that run before/after the wrapped function call.
@@ -39,6 +193,23 @@ def _log_call(message: str):
     return wrapper
 
 
+def _call_after(function: Callable[[], None]):
+    @wrapt.decorator
+    def wrapper(wrapped, instance, args, kwargs):
+        return_value = wrapped(*args, **kwargs)
+        function()
+        return return_value
+
+    return wrapper
+
+
+@wrapt.decorator
+def _with_version(wrapped, instance, args, kwargs):
+    # The version is returned alongside the data so that it is stored in the same cache entry. This means that every
+    # process that uses the cache agrees on the version of the data, even if it was loaded by a different process.
+    return wrapped(*args, **kwargs), uuid.uuid4().hex
+
+
 class _DynamicData:
     """Wrapper for a pd_DataFrameCallable, i.e. a function that produces a pandas DataFrame.
 
@@ -50,6 +221,8 @@ class _DynamicData:
         >>>     return pd.read_csv("dynamic_data.csv")
         >>> data_manager["dynamic_data"] = dynamic_data
         >>> data_manager["dynamic_data"].timeout = 5  # if you want to change the cache timeout to 5 seconds
+        >>> data_manager["dynamic_data"].stale_while_revalidate = 60  # if you want to reload expired data in background
+        >>> data_manager["dynamic_data"].indexed_columns = ["continent"]  # if you want to index columns for filtering
 
     Possibly in future, this will become a public class so you could directly do:
         >>> data_manager["dynamic_data"] = DynamicData(dynamic_data, timeout=5)
@@ -61,11 +234,24 @@ class _DynamicData:
     def __init__(self, load_data: pd_DataFrameCallable):
         self.__load_data: pd_DataFrameCallable = load_data
         self.timeout: Optional[int] = None
+        # Number of seconds after timeout during which expired data is still served while it's reloaded in background.
+        self.stale_while_revalidate: Optional[int] = None
+        self.indexed_columns: list[str] = []
+        self._statistics: Optional[dict[str, _ColumnStatistics]] = None
+        self._column_indexes: dict[str, _ColumnIndexes] = {}
         # We might also want a self.cache_arguments dictionary in future that allows user to customize more than just
         # timeout, but no rush to do this since other arguments are unlikely to be useful.
 
     def load(self, *args, **kwargs) -> pd.DataFrame:
         """Loads data."""
+        return self._load_with_version(*args, **kwargs)[0]
+
+    def _load_with_version(self, *args, **kwargs) -> tuple[pd.DataFrame, Optional[str]]:
+        """Loads data and returns it together with an identifier of the version of the data that was loaded.
+
+        The version changes whenever the data is reloaded after its cache entry expires. It is None if the data is not
+        cached, since then the data could be different every time it is loaded.
+        """
         # Data source name can be extracted from the function's name since it was added there in DataManager.__setitem__
         logger.debug(
             "Looking in cache for data source %s on process %s",
@@ -80,11 +266,113 @@ class _DynamicData:
         if data_manager._cache_has_app:
             # This includes the case of NullCache.
             load_data = _log_call("Cache miss; reloading data")(self.__load_data)
+            if data_manager.cache.config["CACHE_TYPE"] != "NullCache":
+                # The cache entry has expired and so the data is being reloaded; column statistics computed from the
+                # old data must be recomputed. With NullCache, data is reloaded on every call, so statistics are
+                # instead computed just once like for static data.
+                load_data = _call_after(self._reset_statistics)(load_data)
+                load_data = data_manager.cache.memoize(timeout=self._get_cache_timeout())(_with_version(load_data))
+                data_and_version = load_data(*args, **kwargs)
+                # The cache might contain an entry saved before versions were introduced that is just the data.
+                if not isinstance(data_and_version, tuple):
+                    return data_and_version, None
+                cache_key = self._get_cache_key(*args, **kwargs)
+                if data_manager.cache.get(f"{cache_key}_version") != data_and_version[1]:
+                    # The data has just been reloaded. Its version is also stored on its own so that it can be looked
+                    # up without fetching the data. Since this entry has the same timeout and is saved just after
+                    # the data, it expires at almost the same time.
+                    self._set_version(cache_key, data_and_version[1])
+                elif self._is_stale(cache_key):
+                    self._revalidate(cache_key, *args, **kwargs)
+                return data_and_version
             load_data = data_manager.cache.memoize(timeout=self.timeout)(load_data)
         else:
             logger.debug("Cache not active; reloading data")
             load_data = self.__load_data
-        return load_data(*args, **kwargs)
+        return load_data(*args, **kwargs), None
+
+    def _get_version(self, *args, **kwargs) -> Optional[str]:
+        """Returns the version of the data that would currently be loaded, without loading the data.
+
+        Returns None if the version is not known, e.g. because the data is not cached or its cache entry has expired.
+        """
+        if not data_manager._cache_has_app or data_manager.cache.config["CACHE_TYPE"] == "NullCache":
+            return None
+        cache_key = self._get_cache_key(*args, **kwargs)
+        version = data_manager.cache.get(f"{cache_key}_version")
+        # When the version is known, the data might never be loaded, e.g. because data filtered from it is cached
+        # already. Stale data must therefore start to be reloaded here too.
+        if version is not None and self._is_stale(cache_key):
+            self._revalidate(cache_key, *args, **kwargs)
+        return version
+
+    def _get_cache_key(self, *args, **kwargs) -> str:
+        # The version and freshness of the data are stored in cache entries whose keys are derived from the key of the
+        # memoized data so that they are not found whenever the data would not be found either, e.g. because the cache
+        # entries of the data source were invalidated together. It also means that e.g. load("x") and load(label="x")
+        # give the same keys.
+        load_data = data_manager.cache.memoize(timeout=self._get_cache_timeout())(_with_version(self.__load_data))
+        return load_data.make_cache_key(load_data.uncached, *args, **kwargs)
+
+    def _get_fresh_timeout(self) -> Optional[int]:
+        """Returns the number of seconds that loaded data is fresh for, or None if stale data is never served."""
+        if not self.stale_while_revalidate:
+            return None
+        timeout = data_manager.cache.cache.default_timeout if self.timeout is None else self.timeout
+        # A timeout of 0 means that the cache entry never expires and so the data never becomes stale.
+        return timeout or None
+
+    def _get_cache_timeout(self) -> Optional[int]:
+        """Returns the timeout of the cache entry of the data, which is extended by `stale_while_revalidate`."""
+        fresh_timeout = self._get_fresh_timeout()
+        return self.timeout if fresh_timeout is None else fresh_timeout + self.stale_while_revalidate
+
+    def _set_version(self, cache_key: str, version: str):
+        fresh_timeout = self._get_fresh_timeout()
+        if fresh_timeout is not None:
+            # The data is fresh for as long as this entry exists. It's set before the version so that any process that
+            # finds the new version also finds the data to be fresh.
+            data_manager.cache.set(f"{cache_key}_fresh", True, timeout=fresh_timeout)
+        data_manager.cache.set(f"{cache_key}_version", version, timeout=self._get_cache_timeout())
+
+    def _is_stale(self, cache_key: str) -> bool:
+        return self._get_fresh_timeout() is not None and not data_manager.cache.has(f"{cache_key}_fresh")
+
+    def _revalidate(self, cache_key: str, *args, **kwargs):
+        """Starts to reload stale data in a background thread, unless this is already happening in any process.
+
+        Until the reload finishes, the stale data continues to be served. The reloaded data then replaces the stale data
+        in a single cache update.
+        """
+        # cache.add only succeeds if the entry does not exist already. If the process that is reloading the data stops
+        # before it finishes then the entry expires so that another reload can start.
+        if not data_manager.cache.add(f"{cache_key}_revalidating", True, timeout=self.stale_while_revalidate):
+            return
+
+        logger.debug("Serving stale data; reloading data in background")
+        # forced_update means the data is always reloaded and that the timeout of all the cache entries memoized for
+        # this data source is extended, since otherwise they would all expire together when the stale data does.
+        load_data = _call_after(self._reset_statistics)(_log_call("Reloading stale data")(self.__load_data))
+        load_data = data_manager.cache.memoize(timeout=self._get_cache_timeout(), forced_update=lambda: True)(
+            _with_version(load_data)
+        )
+
+        def revalidate():
+            try:
+                _, version = load_data(*args, **kwargs)
+                self._set_version(cache_key, version)
+            except Exception:
+                logger.exception("Reloading stale data failed; stale data will continue to be served.")
+            finally:
+                data_manager.cache.delete(f"{cache_key}_revalidating")
+
+        threading.Thread(target=revalidate, name="vizro_revalidate", daemon=True).start()
+
+    def _get_column_indexes(self, version: Optional[str]) -> Optional[_ColumnIndexes]:
+        return _get_or_add_column_indexes(self._column_indexes, self.indexed_columns, version)
+
+    def _reset_statistics(self):
+        self._statistics = None
 
 
 class _StaticData:
@@ -93,6 +381,8 @@ class _StaticData:
     This is currently private since it's not expected that a user would instantiate it directly. Instead, you would use
     through the data_manager interface as follows:
          >>> data_manager["static_data"] = pd.read_csv("static_data.csv")
+         >>> data_manager["static_data"].read_only = True  # if you want to avoid copying the data on every load
+         >>> data_manager["static_data"].indexed_columns = ["continent"]  # if you want to index columns for filtering
 
     This class does not have much functionality but exists for a couple of reasons:
         1. to align interface with _DynamicData by providing a load method so that fetching data from data_manager can
@@ -102,6 +392,11 @@ class _StaticData:
 
     def __init__(self, data: pd.DataFrame):
         self.__data = data
+        self.__read_only_data: Optional[pd.DataFrame] = None
+        self.read_only: bool = False
+        self.indexed_columns: list[str] = []
+        self._statistics: Optional[dict[str, _ColumnStatistics]] = None
+        self._column_indexes: dict[int, _ColumnIndexes] = {}
 
     def load(self) -> pd.DataFrame:
         """Loads data.
@@ -110,12 +405,32 @@ class _StaticData:
         but safest to leave it here, e.g. in case a user-defined action mutates the data. To be even safer we could
         additionally (but not instead) copy data when setting it in __init__ but this consumes more memory and is not
         necessary so long as data is only ever accessed through the intended API of data_manager["static_data"].load().
+
+        If `read_only` is set then no copy of the underlying data is made. Instead, a new DataFrame that shares memory
+        with the original data is returned. The NumPy arrays that back this DataFrame are not writeable, so any attempt
+        to modify values in place raises an error rather than silently changing the data for all future loads.
+        Operations that return a new object, such as filtering or adding a column, work as usual.
         """
-        return self.__data.copy()
+        if not self.read_only:
+            return self.__data.copy()
+
+        if self.__read_only_data is None:
+            self.__read_only_data = _make_read_only(self.__data)
+        return _copy_read_only(self.__read_only_data)
+
+    def _load_with_version(self) -> tuple[pd.DataFrame, int]:
+        # Static data never changes, so there is only ever one version of it.
+        return self.load(), 0
+
+    def _get_version(self) -> int:
+        return 0
+
+    def _get_column_indexes(self, version: int) -> Optional[_ColumnIndexes]:
+        return _get_or_add_column_indexes(self._column_indexes, self.indexed_columns, version)
 
     def __setattr__(self, name, value):
         # Any attributes that are only relevant for _DynamicData should go here to raise a clear error message.
-        if name in ["timeout"]:
+        if name in ["timeout", "stale_while_revalidate"]:
             raise AttributeError(
                 f"Static data that is a pandas.DataFrame itself does not support {name}; you should instead use a "
                 "dynamic data source that is a function that returns a pandas.DataFrame."
@@ -123,6 +438,190 @@ class _StaticData:
         super().__setattr__(name, value)
 
 
+def _column_arrays(data: pd.DataFrame) -> list[Union[np.ndarray, pd.api.extensions.ExtensionArray]]:
+    """Returns the array that backs each column of `data`, using NumPy arrays wherever this does not change dtype."""
+    return [
+        series.to_numpy() if isinstance(series.dtype, np.dtype) else series.array
+        for series in (data.iloc[:, position] for position in range(data.shape[1]))
+    ]
+
+
+def _make_read_only(data: pd.DataFrame) -> pd.DataFrame:
+    """Returns a DataFrame that shares memory with `data` but whose NumPy-backed columns are not writeable.
+
+    Only views of the original arrays are marked as read-only, so `data` itself remains writeable.
+    """
+    arrays = []
+    for array in _column_arrays(data):
+        if isinstance(array, np.ndarray):
+            array = array.view()  # noqa: PLW2901
+            array.flags.writeable = False
+        arrays.append(array)
+    # Use a RangeIndex for the column labels to handle DataFrames with duplicate column names.
+    read_only_data = pd.DataFrame(dict(enumerate(arrays)), index=data.index, copy=False)
+    read_only_data.columns = data.columns
+    return read_only_data
+
+
+def _copy_read_only(read_only_data: pd.DataFrame) -> pd.DataFrame:
+    """Returns a new DataFrame that shares the read-only NumPy arrays of `read_only_data`, made with `_make_read_only`.
+
+    Columns backed by pandas extension arrays cannot be marked as read-only, so these are copied.
+    """
+    data = read_only_data.copy(deep=False)
+    for position, array in enumerate(_column_arrays(data)):
+        if not isinstance(array, np.ndarray):
+            data.isetitem(position, data.iloc[:, position].copy())
+    return data
+
+
+class _FilteredDataKey(NamedTuple):
+    data_source_name: DataSourceName
+    load_arguments: Hashable
+    version: Hashable
+    # Hash of the values of the filters and filter interactions that were applied to the data.
+    controls: str
+
+
+class _LeastRecentlyUsedCache:
+    """Least recently used cache that holds values up to a maximum total size in bytes.
+
+    The `hits` and `misses` counters record how many times a value was and was not found in the cache.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        # The Flask server can run callbacks in several threads at the same time.
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            value, _ = self._entries[key]
+        return value
+
+    def _count(self, value: Optional[Any]):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+    def _set(
+        self,
+        key: Hashable,
+        value: Any,
+        nbytes: int,
+        max_bytes: int,
+        is_stale: Callable[[Hashable], bool] = lambda old_key: False,
+    ):
+        """Caches `value` for `key`, evicting the least recently used values so that at most `max_bytes` are cached.
+
+        Any cached value whose key satisfies `is_stale` is also evicted.
+        """
+        with self._lock:
+            for old_key in list(self._entries):
+                if old_key == key or is_stale(old_key):
+                    self.__pop(old_key)
+            if nbytes <= max_bytes:
+                self._entries[key] = (value, nbytes)
+                self.nbytes += nbytes
+            while self.nbytes > max_bytes:
+                self.__pop(next(iter(self._entries)))
+
+    def __pop(self, key: Hashable):
+        _, nbytes = self._entries.pop(key)
+        self.nbytes -= nbytes
+
+
+class _FilteredDataCache(_LeastRecentlyUsedCache):
+    """Cache of filtered data that holds at most `DataManager.filtered_data_cache_size` bytes.
+
+    Cached data is read-only so that modifying the data given to one callback cannot affect future callbacks. Since
+    the version of the data source is part of every key, data filtered from dynamic data that has since been reloaded
+    is never returned. Such stale entries are discarded as soon as data filtered from the new version is cached.
+
+    Regardless of `DataManager.filtered_data_cache_size`, the most recently filtered data of each target is also kept.
+    This means that when only arguments that don't affect the data change, e.g. a parameter that targets a chart's
+    color, the data is not loaded or filtered again. Since this is not opt-in, data taken from it is a writeable copy
+    rather than read-only.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._latest: dict[str, tuple[_FilteredDataKey, pd.DataFrame]] = {}
+
+    def get(self, key: _FilteredDataKey, target: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Returns the data cached for `key`, or None if there is no such data."""
+        read_only_data = self._get(key)
+        if read_only_data is None and target is not None:
+            latest_key, latest_data = self._latest.get(target, (None, None))
+            if latest_key == key:
+                self._count(latest_data)
+                return latest_data.copy()
+        self._count(read_only_data)
+        return _copy_read_only(read_only_data) if read_only_data is not None else None
+
+    def set(
+        self, key: _FilteredDataKey, data: pd.DataFrame, max_bytes: int, target: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Caches `data` for `key`, evicting the least recently used data so that at most `max_bytes` are cached.
+
+        If `target` is given then `data` is also kept as the most recently filtered data of `target`. Returns data
+        equivalent to `data` that can be used in its place. If `max_bytes` is 0 then this is just `data`; otherwise it
+        shares memory with the cached data but cannot be modified in place.
+        """
+        if target is not None:
+            # This is a copy so that modifying the data returned in place does not change it.
+            self._latest[target] = (key, data.copy())
+        if not max_bytes:
+            return data
+
+        read_only_data = _make_read_only(data)
+        self._set(
+            key,
+            read_only_data,
+            nbytes=int(data.memory_usage(index=True, deep=True).sum()),
+            max_bytes=max_bytes,
+            is_stale=lambda old_key: old_key[:2] == key[:2] and old_key.version != key.version,
+        )
+        return _copy_read_only(read_only_data)
+
+
+class _FigureCache(_LeastRecentlyUsedCache):
+    """Cache of the outputs of figure components such as `Graph`, serialized to JSON.
+
+    Serialized outputs are held in the memory of this process, up to `DataManager.figure_cache_size` bytes. If
+    `DataManager.figure_cache` is set then outputs are additionally stored in that cache, which could be shared between
+    processes. Outputs that are found in `DataManager.figure_cache` are then also held in the memory of this process.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the serialized output cached for `key`, or None if there is no such output."""
+        serialized_output = self._get(key)
+        shared_cache = data_manager.figure_cache
+        if serialized_output is None and shared_cache is not None and hasattr(shared_cache, "app"):
+            serialized_output = shared_cache.get(f"vizro_figure_{key}")
+            if serialized_output is not None:
+                self._set(key, serialized_output, len(serialized_output), data_manager.figure_cache_size)
+        self._count(serialized_output)
+        return serialized_output
+
+    def set(self, key: str, serialized_output: str):
+        """Caches `serialized_output` for `key`."""
+        self._set(key, serialized_output, len(serialized_output), data_manager.figure_cache_size)
+        shared_cache = data_manager.figure_cache
+        if shared_cache is not None and hasattr(shared_cache, "app"):
+            shared_cache.set(f"vizro_figure_{key}", serialized_output)
+
+
 class DataManager:
     """Object to handle all data for the `vizro` application.
 
@@ -134,6 +633,10 @@ class DataManager:
         >>>     return pd.read_csv("dynamic_data.csv")
         >>> data_manager["dynamic_data"] = dynamic_data
         >>> data_manager["dynamic_data"].timeout = 5  # if you want to change the cache timeout to 5 seconds
+        >>> # Keep up to 100 MB of filtered data in memory to reuse when the same filters are applied again
+        >>> data_manager.filtered_data_cache_size = 100 * 1024**2
+        >>> # Keep up to 100 MB of rendered charts and tables in memory to reuse when they are rendered again
+        >>> data_manager.figure_cache_size = 100 * 1024**2
 
     """
 
@@ -141,6 +644,15 @@ class DataManager:
         self.__data: dict[DataSourceName, Union[_DynamicData, _StaticData]] = {}
         self._frozen_state = False
         self.cache = Cache(config={"CACHE_TYPE": "NullCache"})
+        # Maximum number of bytes of filtered data to keep in memory so that it does not need to be filtered again when
+        # the same filters are applied again. This is separate from self.cache and is not shared between processes.
+        self.filtered_data_cache_size: int = 0
+        self._filtered_data_cache = _FilteredDataCache()
+        # Rendered outputs of figure components are cached in the memory of this process up to figure_cache_size bytes
+        # and also, if it is set, in figure_cache, which could be shared between processes.
+        self.figure_cache_size: int = 0
+        self.figure_cache: Optional[Cache] = None
+        self._figure_cache = _FigureCache()
         # In future, possibly we will accept just a config dict. Would need to work out whether to handle merging with
         # default values though. We would do this with something like this:
         # def __set_cache(self, cache_config):
@@ -196,6 +708,23 @@ class DataManager:
         except KeyError as exc:
             raise KeyError(f"Data source {name} does not exist.") from exc
 
+    def _get_column_statistics(self, name: DataSourceName) -> dict[str, _ColumnStatistics]:
+        """Returns statistics for each column of the data source `name`, loaded with its default arguments.
+
+        Statistics are computed when first requested and then reused, so that e.g. many `Filter`s that target
+        components using the same data source only need the data to be loaded once. For dynamic data, statistics are
+        recomputed after the data has been reloaded due to its cache entry expiring.
+        """
+        data = self[name]
+        if data._statistics is None:
+            logger.debug("Computing column statistics for data source %s", name)
+            data._statistics = _compute_column_statistics(data.load())
+        return data._statistics
+
+    @property
+    def _figure_cache_enabled(self) -> bool:
+        return bool(self.figure_cache_size) or self.figure_cache is not None
+
     def _clear(self):
         # We do not actually call self.cache.clear() because (a) it would only work when self._cache_has_app is True,
         # which is not the case when e.g. Vizro._reset is called, and (b) because we do not want to accidentally
@@ -2,7 +2,7 @@ import importlib.util
 import logging
 from collections.abc import Collection, Mapping
 from pprint import pformat
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from dash import Input, Output, State, callback, html
 
@@ -11,9 +11,12 @@ try:
 except ImportError:  # pragma: no cov
     from pydantic import Field, validator
 
+from vizro._constants import TARGET_SIGNATURES_PREFIX
+from vizro.managers import model_manager
 from vizro.managers._model_manager import ModelID
 from vizro.models import VizroBaseModel
 from vizro.models._models_utils import _log_call
+from vizro.models._typed_arrays import _encode_callback_outputs
 from vizro.models.types import CapturedCallable
 
 logger = logging.getLogger(__name__)
@@ -97,6 +100,20 @@ class Action(VizroBaseModel):
 
         return callback_inputs, callback_outputs, action_components
 
+    def _get_target_signatures_output(self) -> Optional[Output]:
+        """Gets the output that clears the signatures of the targets on the page of a custom action.
+
+        The signatures record what the page's targets show, so that predefined actions only update targets whose inputs
+        change. A custom action can change any target, either with its outputs or with `dash.set_props`, and so after
+        it runs the signatures are cleared and all targets are updated by the next predefined action.
+        """
+        from vizro.actions._callback_mapping._get_action_callback_mapping import _is_predefined_action
+
+        page_id = model_manager._get_model_page_id(model_id=ModelID(str(self.id)))
+        if page_id is None or _is_predefined_action(action_id=ModelID(str(self.id))):
+            return None
+        return Output(f"{TARGET_SIGNATURES_PREFIX}_{page_id}", "data", allow_duplicate=True)
+
     def _action_callback_function(
         self,
         inputs: Union[dict[str, Any], list[Any]],
@@ -159,6 +176,9 @@ class Action(VizroBaseModel):
         callback_outputs = {
             "internal": {"action_finished": Output("action_finished", "data", allow_duplicate=True)},
         }
+        target_signatures_output = self._get_target_signatures_output()
+        if target_signatures_output is not None:
+            callback_outputs["internal"]["target_signatures"] = target_signatures_output
 
         # If there are no outputs then we don't want the external part of callback_outputs to exist at all.
         # This allows the action function to return None and match correctly on to the callback_outputs dictionary
@@ -180,8 +200,12 @@ class Action(VizroBaseModel):
         @callback(output=callback_outputs, inputs=callback_inputs, prevent_initial_call=True)
         def callback_wrapper(external: Union[list[Any], dict[str, Any]], internal: dict[str, Any]) -> dict[str, Any]:
             return_value = self._action_callback_function(inputs=external, outputs=callback_outputs.get("external"))
+            internal_return_value = {"action_finished": None}
+            if "target_signatures" in callback_outputs["internal"]:
+                internal_return_value["target_signatures"] = {}
             if "external" in callback_outputs:
-                return {"internal": {"action_finished": None}, "external": return_value}
-            return {"internal": {"action_finished": None}}
+                # Figures are sent to the browser with their trace data as typed arrays rather than lists of numbers.
+                return {"internal": internal_return_value, "external": _encode_callback_outputs(return_value)}
+            return {"internal": internal_return_value}
 
         return html.Div(id=f"{self.id}_action_model_components_div", children=action_components, hidden=True)
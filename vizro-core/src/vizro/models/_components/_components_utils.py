@@ -1,7 +1,16 @@
+import hashlib
+import json
 import logging
 import uuid
+from typing import Any, Optional
 
-from vizro.managers import data_manager
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+from vizro.managers import data_manager, model_manager
+from vizro.managers._model_manager import ModelID
+from vizro.models._json_serializer import _json_serializer
+from vizro.models._typed_arrays import _encode_typed_arrays
 
 logger = logging.getLogger(__name__)
 
@@ -33,3 +42,56 @@ def _process_callable_data_frame(captured_callable):
     captured_callable["data_frame"] = data_source_name
 
     return captured_callable
+
+
+def _get_figure_cache_key(model_id: ModelID, kwargs: dict[str, Any]) -> Optional[str]:
+    """Gets a key for the output of the figure component `model_id` called with `kwargs`, or None if there is none.
+
+    The key is a hash of `model_id`, the contents of the data_frame argument and all other arguments.
+    """
+    data_frame = kwargs["data_frame"]
+    other_kwargs = {name: value for name, value in kwargs.items() if name != "data_frame"}
+    hasher = hashlib.sha256(str(model_id).encode())
+    try:
+        hasher.update(pd.util.hash_pandas_object(data_frame, index=True).to_numpy().tobytes())
+        hasher.update(
+            json.dumps(
+                [[repr(column) for column in data_frame.columns], [str(dtype) for dtype in data_frame.dtypes]],
+            ).encode()
+        )
+        hasher.update(json.dumps(other_kwargs, sort_keys=True, cls=PlotlyJSONEncoder).encode())
+    except TypeError:
+        # Data or arguments that cannot be hashed or serialized, e.g. a column containing lists, are not cached.
+        return None
+    return hasher.hexdigest()
+
+
+def _render_with_figure_cache(model_id: ModelID, kwargs: dict[str, Any]) -> Any:
+    """Returns the output of the figure component `model_id` called with `kwargs`, for use as an action output.
+
+    If the figure cache is enabled and the same component has already been rendered with the same data and arguments
+    then the component is not called. Instead, the cached output is returned as a JSON-compatible object that is
+    equivalent to what Dash would have sent to the browser for the output of the component. Calling the component
+    directly always renders it, so this lookup is done only where the output is sent straight to Dash.
+    """
+    figure_component = model_manager[model_id]
+    if not data_manager._figure_cache_enabled:
+        return figure_component(**kwargs)
+
+    key = _get_figure_cache_key(model_id, kwargs)
+    if key is None:
+        return figure_component(**kwargs)
+
+    serialized_output = data_manager._figure_cache.get(key)
+    if serialized_output is not None:
+        logger.debug("Figure cache hit for %s", model_id)
+        # Any side effects of rendering, such as hiding a graph until its theme has been updated, must still happen.
+        if hasattr(figure_component, "_set_render_props"):
+            figure_component._set_render_props()
+        return json.loads(serialized_output)
+
+    output = figure_component(**kwargs)
+    # This uses the same serialization as Dash so that the cached output looks exactly like the output of the component
+    # does when it is sent to the browser, i.e. with trace data encoded as typed arrays.
+    data_manager._figure_cache.set(key, _json_serializer.to_json(_encode_typed_arrays(output)))
+    return output
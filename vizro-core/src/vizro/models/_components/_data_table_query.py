@@ -0,0 +1,118 @@
+"""Paging, sorting and filtering of data on the server for Dash DataTables with custom page, sort and filter actions."""
+
+import math
+import operator
+import re
+from typing import Any, Callable, Optional, Union
+
+import pandas as pd
+
+from vizro.models._components._infinite_row_model import _apply_sort_model
+
+# Relational operators of the DataTable filtering syntax. Each has a symbol and a name, e.g. `{pop} >= 1000` and
+# `{pop} ge 1000` are the same.
+_RELATIONAL_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+_RELATIONAL_OPERATOR_SYMBOLS = {"=": "eq", "!=": "ne", "<": "lt", "<=": "le", ">": "gt", ">=": "ge"}
+
+# A single part of a filter query, e.g. `{country} icontains "united"`. Relational operators and `contains` can be
+# prefixed with `i` or `s` to compare case-insensitively or case-sensitively.
+_FILTER_PART = re.compile(
+    r"""\{(?P<column>[^}]+)\}\s*
+    (?:(?P<unary_operator>is\ blank|is\ nil)
+    |(?P<case>[is]?)(?P<operator>contains|datestartswith|eq|ne|lt|le|gt|ge|!=|<=|>=|=|<|>)\s*(?P<value>.+))""",
+    re.VERBOSE,
+)
+
+
+def _parse_filter_value(value: str) -> Union[str, float]:
+    """Parses the value of a filter query part, which is a string if it's quoted and otherwise a number if possible."""
+    if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'`":
+        return value[1:-1].replace(f"\\{value[0]}", value[0])
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _get_relational_mask(
+    column: pd.Series, operator_name: str, value: Union[str, float], text: str, case_insensitive: bool
+) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(column):
+        # Dates are compared in the local time of their timezone, since that's what is shown in the table.
+        if column.dt.tz is not None:
+            column = column.dt.tz_localize(None)
+        value = pd.to_datetime(text, errors="coerce")
+    elif not (pd.api.types.is_numeric_dtype(column) and isinstance(value, float)):
+        # A string value, or a value that is compared with a column of strings, is compared as text.
+        column, value = column.astype("string"), text
+        if case_insensitive:
+            column, value = column.str.lower(), value.lower()
+    return _RELATIONAL_OPERATORS[operator_name](column, value)
+
+
+def _get_filter_part_mask(column: pd.Series, filter_part: re.Match) -> pd.Series:
+    """Gets a boolean mask of the rows that pass a single part of a DataTable filter query."""
+    if filter_part["unary_operator"] == "is nil":
+        return column.isna()
+    if filter_part["unary_operator"] == "is blank":
+        return column.isna() | (column.astype("string") == "")
+
+    operator_name = _RELATIONAL_OPERATOR_SYMBOLS.get(filter_part["operator"], filter_part["operator"])
+    value = _parse_filter_value(filter_part["value"].strip())
+    # Numbers are compared with text as they are written in the query, e.g. `1` rather than `1.0`.
+    text = value if isinstance(value, str) else filter_part["value"].strip()
+    case_insensitive = filter_part["case"] == "i"
+    if operator_name == "contains":
+        mask = column.astype("string").str.contains(text, case=not case_insensitive, regex=False)
+    elif operator_name == "datestartswith":
+        if pd.api.types.is_datetime64_any_dtype(column):
+            column = column.dt.strftime("%Y-%m-%d %H:%M:%S")
+        mask = column.astype("string").str.startswith(text)
+    else:
+        mask = _get_relational_mask(column, operator_name, value, text, case_insensitive)
+    return mask.fillna(False).astype(bool)
+
+
+def _apply_filter_query(data_frame: pd.DataFrame, filter_query: Optional[str]) -> pd.DataFrame:
+    """Filters `data_frame` with the `filter_query` of a DataTable.
+
+    Parts of the query are joined with `&&`. Like the DataTable itself does, parts that are not valid or that refer to
+    unknown columns are ignored.
+    """
+    columns = {str(column): column for column in data_frame.columns}
+    mask = pd.Series(True, index=data_frame.index)
+    for query_part in (filter_query or "").split(" && "):
+        filter_part = _FILTER_PART.fullmatch(query_part.strip())
+        if filter_part and filter_part["column"] in columns:
+            mask &= _get_filter_part_mask(data_frame[columns[filter_part["column"]]], filter_part)
+    return data_frame[mask]
+
+
+def _apply_sort_by(data_frame: pd.DataFrame, sort_by: Optional[list[dict[str, str]]]) -> pd.DataFrame:
+    """Sorts `data_frame` with the `sort_by` of a DataTable. Sorting by unknown columns is ignored."""
+    sort_model = [{"colId": sort["column_id"], "sort": sort["direction"]} for sort in sort_by or []]
+    return _apply_sort_model(data_frame, sort_model)
+
+
+def _get_page_data(
+    data_frame: pd.DataFrame,
+    page_current: Optional[int],
+    page_size: int,
+    sort_by: Optional[list[dict[str, str]]],
+    filter_query: Optional[str],
+) -> dict[str, Any]:
+    """Gets the `data` of the current page of a DataTable and its `page_count` after filtering and sorting."""
+    data_frame = _apply_sort_by(_apply_filter_query(data_frame, filter_query), sort_by)
+    start_row = (page_current or 0) * page_size
+    return {
+        "data": data_frame.iloc[start_row : start_row + page_size].to_dict("records"),
+        # An empty table still has a single, empty page.
+        "page_count": max(math.ceil(len(data_frame) / page_size), 1),
+    }
@@ -0,0 +1,111 @@
+"""Server-side downsampling of the traces of a figure, used by `Graph.max_points`."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Trace properties that can hold one value per point. These are all indexed in the same way as `x` and `y` when a trace
+# is downsampled.
+_PER_POINT_PROPERTIES = [
+    "x",
+    "y",
+    "text",
+    "hovertext",
+    "customdata",
+    "ids",
+    "marker.size",
+    "marker.color",
+    "marker.opacity",
+    "marker.symbol",
+    "error_x.array",
+    "error_x.arrayminus",
+    "error_y.array",
+    "error_y.arrayminus",
+]
+
+
+def _as_float(values: Any, length: int) -> np.ndarray:
+    """Converts `values` to floats, falling back to the position of each point for values like categories."""
+    values = np.asarray(values) if values is not None else np.arange(length)
+    if values.dtype.kind == "O" and pd.api.types.infer_dtype(values, skipna=True) in {"datetime", "date"}:
+        # Plotly stores datetimes as an object array of datetime.datetime.
+        values = pd.to_datetime(values).to_numpy()
+    if values.dtype.kind in "biuf":
+        return values.astype(float)
+    if values.dtype.kind in "mM":
+        return np.where(np.isnat(values), np.nan, values.astype("int64"))
+    return np.arange(length, dtype=float)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the `n_out` points chosen by the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The remaining points are split into `n_out - 2` buckets and, from each
+    bucket, the point that forms the largest triangle with the previously chosen point and the average of the next
+    bucket is kept. This preserves the visual shape of a line much better than taking every nth point.
+    """
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # Averages of each bucket, followed by the last point which acts as the "next bucket" of the final bucket.
+    counts = np.diff(edges)
+    average_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / counts, x[-1])
+    average_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / counts, y[-1])
+
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    # Each choice depends on the previous one, so only the work within each bucket can be vectorised.
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        area = np.abs(
+            (x[previous] - average_x[bucket + 1]) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (average_y[bucket + 1] - y[previous])
+        )
+        previous = start + np.argmax(np.nan_to_num(area, nan=-1.0))
+        indices[bucket + 1] = previous
+    return indices
+
+
+def _min_max_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the minimum and maximum points in each of `n_out // 2` equally sized buckets, in their original order.
+
+    Unlike LTTB this is fully vectorised, and it keeps every outlier visible when points are not joined by lines.
+    """
+    n = len(y)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(int)
+    buckets = np.repeat(np.arange(len(edges) - 1), np.diff(edges))
+    is_nan = np.isnan(y)
+    # Sorting by y within each bucket puts the minimum first and the maximum last. Missing values are never chosen
+    # unless the whole bucket is missing.
+    by_min = np.lexsort((np.where(is_nan, np.inf, y), buckets))
+    by_max = np.lexsort((np.where(is_nan, -np.inf, y), buckets))
+    return np.unique(np.concatenate([by_min[edges[:-1]], by_max[edges[1:] - 1]]))
+
+
+def _downsample_figure(fig: go.Figure, max_points: int) -> go.Figure:
+    """Downsamples each scatter or line trace of `fig` that has more than `max_points` points.
+
+    Traces drawn with lines use LTTB and traces drawn only with markers use min-max bucketing. Points are bucketed in
+    the order they appear in the trace.
+    """
+    for trace in fig.data:
+        if trace.type not in {"scatter", "scattergl"} or trace.y is None:
+            continue
+        y = np.asarray(trace.y)
+        n = len(y)
+        if n <= max_points or y.dtype.kind not in "biuf":
+            continue
+
+        y = y.astype(float)
+        if trace.mode is not None and "lines" not in trace.mode:
+            indices = _min_max_indices(y, max_points)
+        else:
+            indices = _lttb_indices(_as_float(trace.x, n), y, max_points)
+
+        for path in _PER_POINT_PROPERTIES:
+            value = trace[path]
+            if value is not None and not isinstance(value, str) and np.ndim(value) >= 1 and len(value) == n:
+                trace[path] = np.asarray(value)[indices]
+    return fig
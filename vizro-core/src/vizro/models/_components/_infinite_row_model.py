@@ -0,0 +1,132 @@
+"""Sorting, filtering and slicing of data on the server for AG Grids that use the infinite row model."""
+
+import logging
+import operator
+from typing import Any, Callable
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Comparisons of AG Grid's number and date filters. Note that AG Grid's "inRange" excludes both ends of the range by
+# default.
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "equals": operator.eq,
+    "notEqual": operator.ne,
+    "greaterThan": operator.gt,
+    "greaterThanOrEqual": operator.ge,
+    "lessThan": operator.lt,
+    "lessThanOrEqual": operator.le,
+}
+
+
+def _get_column_filter(column: pd.Series) -> str:
+    """Gets the AG Grid filter that matches the type of `column`.
+
+    With the infinite row model, AG Grid does not have the data to infer column types from, so the filter needs to be
+    set explicitly for number and date filters to be used.
+    """
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return "agDateColumnFilter"
+    if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        return "agNumberColumnFilter"
+    return "agTextColumnFilter"
+
+
+def _get_unfiltered_mask(column: pd.Series, condition: dict[str, Any]) -> pd.Series:
+    """Ignores a condition of an unknown filter type, e.g. from a newer version of AG Grid, rather than failing."""
+    logger.warning("Ignoring unknown AG Grid %s filter type %r.", condition["filterType"], condition["type"])
+    return pd.Series(True, index=column.index)
+
+
+def _get_text_condition_mask(column: pd.Series, condition: dict[str, Any]) -> pd.Series:
+    text = column.astype("string").str.lower()
+    value = str(condition.get("filter", "")).lower()
+    condition_type = condition["type"]
+    if condition_type in {"contains", "notContains"}:
+        mask = text.str.contains(value, regex=False)
+    elif condition_type in {"equals", "notEqual"}:
+        mask = text == value
+    elif condition_type == "startsWith":
+        mask = text.str.startswith(value)
+    elif condition_type == "endsWith":
+        mask = text.str.endswith(value)
+    else:
+        return _get_unfiltered_mask(column, condition)
+    if condition_type in {"notContains", "notEqual"}:
+        # Like AG Grid does itself, missing values are included by negative filters.
+        return ~mask.fillna(False)
+    return mask.fillna(False)
+
+
+def _get_comparison_condition_mask(column: pd.Series, condition: dict[str, Any]) -> pd.Series:
+    if condition["filterType"] == "date":
+        # AG Grid's date filter compares dates without their time of day. Times are compared in the local time of their
+        # timezone, since that's what is shown in the grid.
+        if getattr(column.dtype, "tz", None) is not None:
+            column = column.dt.tz_localize(None)
+        column = column.dt.normalize()
+        value, value_to = pd.Timestamp(condition.get("dateFrom")), pd.Timestamp(condition.get("dateTo"))
+    else:
+        value, value_to = condition.get("filter"), condition.get("filterTo")
+
+    condition_type = condition["type"]
+    if condition_type == "inRange":
+        return (column > value) & (column < value_to)
+    if condition_type not in _COMPARISONS:
+        return _get_unfiltered_mask(column, condition)
+    return _COMPARISONS[condition_type](column, value)
+
+
+def _get_condition_mask(column: pd.Series, condition: dict[str, Any]) -> pd.Series:
+    """Gets a boolean mask of the rows that pass a single condition of an AG Grid column filter."""
+    if condition["filterType"] not in {"text", "number", "date"}:
+        # Other filters, such as the set filter of AG Grid Enterprise, are not supported and so don't filter any rows.
+        return pd.Series(True, index=column.index)
+    if condition["type"] in {"blank", "notBlank"}:
+        mask = column.isna()
+        if condition["filterType"] == "text":
+            mask |= column.astype("string") == ""
+        return mask if condition["type"] == "blank" else ~mask
+    if condition["filterType"] == "text":
+        return _get_text_condition_mask(column, condition)
+    return _get_comparison_condition_mask(column, condition)
+
+
+def _get_column_filter_mask(column: pd.Series, column_filter: dict[str, Any]) -> pd.Series:
+    """Gets a boolean mask of the rows that pass the filter of a single column, which may combine several conditions."""
+    if "operator" not in column_filter:
+        return _get_condition_mask(column, column_filter)
+
+    # Newer versions of AG Grid give a list of conditions and older versions give just condition1 and condition2.
+    conditions = column_filter.get("conditions") or [column_filter["condition1"], column_filter["condition2"]]
+    masks = [_get_condition_mask(column, {"filterType": column_filter["filterType"], **c}) for c in conditions]
+    combine = operator.and_ if column_filter["operator"] == "AND" else operator.or_
+    mask = masks[0]
+    for other_mask in masks[1:]:
+        mask = combine(mask, other_mask)
+    return mask
+
+
+def _apply_filter_model(data_frame: pd.DataFrame, filter_model: dict[str, Any]) -> pd.DataFrame:
+    """Filters `data_frame` with the `filterModel` of an AG Grid. Filters of unknown columns are ignored."""
+    columns = {str(column): column for column in data_frame.columns}
+    mask = pd.Series(True, index=data_frame.index)
+    for col_id, column_filter in filter_model.items():
+        if col_id in columns:
+            mask &= _get_column_filter_mask(data_frame[columns[col_id]], column_filter)
+    return data_frame[mask]
+
+
+def _apply_sort_model(data_frame: pd.DataFrame, sort_model: list[dict[str, Any]]) -> pd.DataFrame:
+    """Sorts `data_frame` with the `sortModel` of an AG Grid. Sorting by unknown columns is ignored."""
+    columns = {str(column): column for column in data_frame.columns}
+    sort_model = [sort for sort in sort_model if sort["colId"] in columns]
+    if not sort_model:
+        return data_frame
+    return data_frame.sort_values(
+        by=[columns[sort["colId"]] for sort in sort_model],
+        ascending=[sort["sort"] == "asc" for sort in sort_model],
+        kind="stable",
+        na_position="first",
+    )
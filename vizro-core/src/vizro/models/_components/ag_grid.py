@@ -1,5 +1,6 @@
 import logging
-from typing import Literal
+from contextlib import suppress
+from typing import Any, Literal
 
 import pandas as pd
 from dash import State, dcc, html
@@ -10,13 +11,17 @@ except ImportError:  # pragma: no cov
     from pydantic import Field, PrivateAttr, validator
 from dash import ClientsideFunction, Input, Output, clientside_callback
 
+from vizro._constants import GET_ROWS_ACTION_PREFIX
 from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions, _get_parent_vizro_model
+from vizro.actions._get_rows_action import _get_rows
 from vizro.managers import data_manager
 from vizro.models import Action, VizroBaseModel
-from vizro.models._action._actions_chain import _action_validator_factory
+from vizro.models._action._actions_chain import ActionsChain, Trigger, _action_validator_factory
 from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._infinite_row_model import _apply_filter_model, _apply_sort_model, _get_column_filter
 from vizro.models._models_utils import _log_call
 from vizro.models.types import CapturedCallable
+from vizro.tables._dash_ag_grid import _get_row_data
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +38,8 @@ class AgGrid(VizroBaseModel):
             Defaults to `""`.
         footer (str): Markdown text positioned below the `AgGrid`. Follows the CommonMark specification.
             Ideal for providing further details such as sources, disclaimers, or additional notes. Defaults to `""`.
+        infinite_scroll (bool): Whether to use AG Grid's infinite row model. Rows are then loaded from the server in
+            blocks as the grid is scrolled, and sorted and filtered on the server. Defaults to `False`.
         actions (list[Action]): See [`Action`][vizro.models.Action]. Defaults to `[]`.
 
     """
@@ -52,6 +59,11 @@ class AgGrid(VizroBaseModel):
         description="Markdown text positioned below the `AgGrid`. Follows the CommonMark specification. Ideal for "
         "providing further details such as sources, disclaimers, or additional notes.",
     )
+    infinite_scroll: bool = Field(
+        False,
+        description="Whether to use AG Grid's infinite row model. Rows are then loaded from the server in blocks as "
+        "the grid is scrolled, and sorted and filtered on the server.",
+    )
     actions: list[Action] = []
 
     _input_component_id: str = PrivateAttr()
@@ -70,10 +82,41 @@ class AgGrid(VizroBaseModel):
         # If the functionality of process_callable_data_frame moves to CapturedCallable then this would move there too.
         if "data_frame" not in kwargs:
             kwargs["data_frame"] = data_manager[self["data_frame"]].load()
-        figure = self.figure(**kwargs)
+        return self._render(**kwargs)
+
+    def _render(self, **kwargs):
+        if not self.infinite_scroll:
+            figure = self.figure(**kwargs)
+        else:
+            # Rows are loaded on demand by the _get_rows action, so the grid itself is made without any rows.
+            figure = self.figure(**{**kwargs, "data_frame": kwargs["data_frame"].iloc[:0]})
+            with suppress(AttributeError):
+                del figure.rowData
+            figure.rowModelType = "infinite"
+            self._set_column_filters(figure, kwargs["data_frame"])
         figure.id = self._input_component_id
         return figure
 
+    @staticmethod
+    def _set_column_filters(figure, data_frame: pd.DataFrame):
+        """Sets the filter of each column that just enables the default filter to the filter for its type of data.
+
+        With the infinite row model, AG Grid cannot infer the type of data in a column, so otherwise every column would
+        get a text filter.
+        """
+        columns = {str(column): column for column in data_frame.columns}
+        default_filter = getattr(figure, "defaultColDef", {}).get("filter")
+        for column_def in getattr(figure, "columnDefs", []):
+            if column_def.get("field") in columns and column_def.get("filter", default_filter) is True:
+                column_def["filter"] = _get_column_filter(data_frame[columns[column_def["field"]]])
+
+    def _get_rows_response(self, data_frame: pd.DataFrame, get_rows_request: dict[str, Any]) -> dict[str, Any]:
+        """Gets the block of rows requested by the grid after applying its column filters and sorting."""
+        data_frame = _apply_filter_model(data_frame, get_rows_request.get("filterModel") or {})
+        data_frame = _apply_sort_model(data_frame, get_rows_request.get("sortModel") or [])
+        rows = data_frame.iloc[get_rows_request["startRow"] : get_rows_request["endRow"]]
+        return {"rowData": _get_row_data(rows), "rowCount": len(data_frame)}
+
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
         # See figure implementation for more details.
@@ -114,6 +157,17 @@ class AgGrid(VizroBaseModel):
     @_log_call
     def pre_build(self):
         self._input_component_id = self.figure._arguments.get("id", f"__input_{self.id}")
+        if self.infinite_scroll:
+            # Load blocks of rows when the grid requests them.
+            self.actions.append(
+                ActionsChain(
+                    id=f"{GET_ROWS_ACTION_PREFIX}_{self.id}",
+                    trigger=Trigger(component_id=self.id, component_property="getRowsRequest"),
+                    actions=[
+                        Action(id=f"{GET_ROWS_ACTION_PREFIX}_action_{self.id}", function=_get_rows(targets=[self.id]))
+                    ],
+                )
+            )
 
     def build(self):
         clientside_callback(
@@ -121,6 +175,16 @@ class AgGrid(VizroBaseModel):
             Output(self._input_component_id, "className"),
             Input("theme_selector", "checked"),
         )
+        if self.infinite_scroll:
+            # When the grid is updated, e.g. because a filter has changed, the rows it has already loaded are dropped
+            # so that they are requested again with the new filter.
+            clientside_callback(
+                ClientsideFunction(namespace="ag_grid", function_name="purge_infinite_cache"),
+                Output(self._input_component_id, "getRowsResponse", allow_duplicate=True),
+                Input(self.id, "children"),
+                State(self._input_component_id, "id"),
+                prevent_initial_call=True,
+            )
 
         return dcc.Loading(
             children=html.Div(
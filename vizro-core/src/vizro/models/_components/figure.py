@@ -42,8 +42,7 @@ class Figure(VizroBaseModel):
         # If the functionality of process_callable_data_frame moves to CapturedCallable then this would move there too.
         if "data_frame" not in kwargs:
             kwargs["data_frame"] = data_manager[self["data_frame"]].load()
-        figure = self.figure(**kwargs)
-        return figure
+        return self.figure(**kwargs)
 
     def __getitem__(self, arg_name: str):
         # pydantic discriminated union validation seems to try Figure["type"], which throws an error unless we
@@ -1,9 +1,10 @@
 import logging
+import re
 import warnings
 from contextlib import suppress
-from typing import Literal
+from typing import Any, Literal, Optional
 
-from dash import ClientsideFunction, Input, Output, State, clientside_callback, dcc, html, set_props
+from dash import ClientsideFunction, Input, Output, Patch, State, clientside_callback, dcc, html, set_props
 from dash.exceptions import MissingCallbackContextException
 from plotly import graph_objects as go
 
@@ -14,17 +15,36 @@ except ImportError:  # pragma: no cov
 
 import pandas as pd
 
+from vizro._constants import ZOOM_ACTION_PREFIX
 from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions
+from vizro.actions._zoom_action import _zoom
 from vizro.managers import data_manager, model_manager
 from vizro.managers._model_manager import ModelID
 from vizro.models import Action, VizroBaseModel
-from vizro.models._action._actions_chain import _action_validator_factory
+from vizro.models._action._actions_chain import ActionsChain, Trigger, _action_validator_factory
 from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._downsampling import _downsample_figure
 from vizro.models._models_utils import _log_call
+from vizro.models._process_pool import _can_import_function, _chart_process_pool
+from vizro.models._typed_arrays import _encode_typed_arrays
 from vizro.models.types import CapturedCallable
 
 logger = logging.getLogger(__name__)
 
+# Arguments of plotly express chart functions that only affect the figure layout and not the trace data, mapped to the
+# layout property that each sets. Properties of an axis are set on every axis of that kind, e.g. xaxis, xaxis2, etc. in
+# a faceted chart. Note that template is not one of these, since plotly express sets the colors of traces from the
+# template's colorway.
+_LAYOUT_ONLY_PX_ARGUMENTS = {
+    "title": ("title",),
+    "width": ("width",),
+    "height": ("height",),
+    "range_x": ("xaxis", "range"),
+    "range_y": ("yaxis", "range"),
+    "log_x": ("xaxis", "type"),
+    "log_y": ("yaxis", "type"),
+}
+
 
 class Graph(VizroBaseModel):
     """Wrapper for `dcc.Graph` to visualize charts in dashboard.
@@ -40,6 +60,9 @@ class Graph(VizroBaseModel):
         footer (str): Markdown text positioned below the `Graph`. Follows the CommonMark specification.
             Ideal for providing further details such as sources, disclaimers, or additional notes. Defaults to `""`.
         actions (list[Action]): See [`Action`][vizro.models.Action]. Defaults to `[]`.
+        max_points (Optional[int]): Maximum number of points sent to the browser for each scatter or line trace. Traces
+            with more points are downsampled. When the graph is zoomed into, data for the zoomed x-axis range is
+            reloaded at up to `max_points`. Defaults to `None`, which does not downsample.
 
     """
 
@@ -59,6 +82,13 @@ class Graph(VizroBaseModel):
         "providing further details such as sources, disclaimers, or additional notes.",
     )
     actions: list[Action] = []
+    max_points: Optional[int] = Field(
+        None,
+        description="Maximum number of points sent to the browser for each scatter or line trace. Traces with more "
+        "points are downsampled. When the graph is zoomed into, data for the zoomed x-axis range is reloaded at up to "
+        "`max_points`. Defaults to `None`, which does not downsample.",
+        ge=3,
+    )
 
     # Component properties for actions and interactions
     _output_component_property: str = PrivateAttr("figure")
@@ -74,9 +104,11 @@ class Graph(VizroBaseModel):
         # If the functionality of process_callable_data_frame moves to CapturedCallable then this would move there too.
         if "data_frame" not in kwargs:
             kwargs["data_frame"] = data_manager[self["data_frame"]].load()
-        fig = self.figure(**kwargs)
-        fig = self._optimise_fig_layout_for_dashboard(fig)
+        fig = self._render(**kwargs)
+        self._set_render_props()
+        return fig
 
+    def _set_render_props(self):
         # Possibly we should enforce that __call__ can only be used within the context of a callback, but it's easy
         # to just swallow up the error here as it doesn't cause any problems.
         with suppress(MissingCallbackContextException):
@@ -87,6 +119,12 @@ class Graph(VizroBaseModel):
             # argument `running` on the clientside callback but this only exists for serverside callbacks, so we do it
             # manually.
             set_props(self.id, {"style": {"visibility": "hidden"}})
+
+    def _render(self, **kwargs) -> go.Figure:
+        fig = self._optimise_fig_layout_for_dashboard(self.figure(**kwargs))
+        if self.max_points is not None:
+            # Only the figure is downsampled. The data itself is unchanged, so export_data still exports all of it.
+            fig = _downsample_figure(fig, self.max_points)
         return fig
 
     # Convenience wrapper/syntactic sugar.
@@ -137,6 +175,87 @@ class Graph(VizroBaseModel):
 
         return data_frame
 
+    def _is_layout_only(self, arg_names: list[str]) -> bool:
+        """Whether changing the figure arguments `arg_names` leaves the trace data of the figure unchanged."""
+        # A custom chart can use its arguments in any way, so only plotly express charts are known to be safe.
+        if "plotly.express" not in self.figure._function.__module__:
+            return False
+        layout_only_arguments = set(_LAYOUT_ONLY_PX_ARGUMENTS)
+        if self.max_points is not None:
+            # After zooming, the browser has trace data only for the zoomed x range, so changing the x range or scale
+            # needs new trace data.
+            layout_only_arguments -= {"range_x", "log_x"}
+        return all(arg_name.split(".")[0] in layout_only_arguments for arg_name in arg_names)
+
+    @staticmethod
+    def _get_layout_patch(fig, arg_names: list[str]) -> Patch:
+        """Returns a `Patch` that updates the layout properties set by figure arguments `arg_names` to those of `fig`.
+
+        All other layout properties of the figure shown in the browser are left unchanged, e.g. the zoomed range of an
+        axis or the drag mode.
+        """
+        # fig is a dictionary rather than a go.Figure when it comes from the figure cache.
+        layout = fig["layout"] if isinstance(fig, dict) else fig.layout.to_plotly_json()
+        patch = Patch()
+        for arg_name in {arg_name.split(".")[0] for arg_name in arg_names}:
+            layout_property, *axis_property = _LAYOUT_ONLY_PX_ARGUMENTS[arg_name]
+            if not axis_property:
+                patch["layout"][layout_property] = layout.get(layout_property)
+                continue
+
+            [axis_property] = axis_property
+            for axis in [key for key in layout if re.fullmatch(rf"{layout_property}\d*", key)]:
+                if axis_property == "range":
+                    if layout[axis].get("matches"):
+                        # The range of an axis that matches another axis follows the range of that axis.
+                        continue
+                    # Without this, an axis that the user has zoomed would not show the new range.
+                    patch["layout"][axis]["autorange"] = layout[axis].get("range") is None
+                patch["layout"][axis][axis_property] = layout[axis].get(axis_property)
+        return patch
+
+    @staticmethod
+    def _select_x_range(data_frame: pd.DataFrame, config: dict[str, Any], x_range: list[Any]) -> pd.DataFrame:
+        """Selects the rows of `data_frame` whose x values are within `x_range`, as given by the graph's relayoutData.
+
+        The points either side of the range are kept too so that lines still reach the edges of the graph.
+        """
+        x = config.get("x")
+        if not isinstance(x, str) or x not in data_frame.columns:
+            return data_frame
+
+        column = data_frame[x]
+        if pd.api.types.is_datetime64_any_dtype(column):
+            # Plotly gives datetime ranges as strings in the timezone of the data.
+            start, end = pd.to_datetime(x_range)
+            if column.dt.tz is not None:
+                start, end = start.tz_localize(column.dt.tz), end.tz_localize(column.dt.tz)
+        elif pd.api.types.is_numeric_dtype(column):
+            start, end = (10**value if config.get("log_x") else value for value in x_range)
+        else:
+            # Category axes give ranges as positions rather than values, so can't be used to select data.
+            return data_frame
+
+        in_range = column.between(start, end)
+        in_range |= in_range.shift(1, fill_value=False) | in_range.shift(-1, fill_value=False)
+        return data_frame[in_range]
+
+    @staticmethod
+    def _get_zoom_patch(fig, x_range: Optional[list[Any]]) -> Patch:
+        """Returns a `Patch` that replaces the traces of the figure shown in the browser and keeps its zoomed x range.
+
+        The x range is set explicitly since otherwise the graph would zoom back out when it is next updated, e.g. when
+        the theme changes. `x_range` of None resets the zoom.
+        """
+        patch = Patch()
+        patch["data"] = _encode_typed_arrays(fig)["data"]
+        if x_range is None:
+            patch["layout"]["xaxis"]["autorange"] = True
+        else:
+            patch["layout"]["xaxis"]["range"] = x_range
+            patch["layout"]["xaxis"]["autorange"] = False
+        return patch
+
     @staticmethod
     def _optimise_fig_layout_for_dashboard(fig):
         """Post layout updates to visually enhance charts used inside dashboard."""
@@ -149,6 +268,26 @@ class Graph(VizroBaseModel):
 
     @_log_call
     def pre_build(self):
+        if _chart_process_pool.use_for(self.figure._executor) and not _can_import_function(self.figure._function):
+            # Fail now rather than when the graph is first rendered in a callback.
+            warnings.warn(
+                f"The chart function {self.figure._function.__qualname__} of Graph {self.id} cannot run in the chart "
+                "process pool since it cannot be imported by its module and name, e.g. because it is a lambda function "
+                "or defined inside another function. It will instead run in the process that handles the callback.",
+                UserWarning,
+            )
+            self.figure._executor = "local"
+
+        if self.max_points is not None:
+            # Reload data at higher resolution when the graph is zoomed into.
+            self.actions.append(
+                ActionsChain(
+                    id=f"{ZOOM_ACTION_PREFIX}_{self.id}",
+                    trigger=Trigger(component_id=self.id, component_property="relayoutData"),
+                    actions=[Action(id=f"{ZOOM_ACTION_PREFIX}_action_{self.id}", function=_zoom(targets=[self.id]))],
+                )
+            )
+
         try:
             self.figure["title"]
         except KeyError:
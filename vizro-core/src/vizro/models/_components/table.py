@@ -1,5 +1,5 @@
 import logging
-from typing import Literal
+from typing import Any, Literal, Optional
 
 import pandas as pd
 from dash import State, dcc, html
@@ -9,16 +9,22 @@ try:
 except ImportError:  # pragma: no cov
     from pydantic import Field, PrivateAttr, validator
 
+from vizro._constants import GET_PAGE_ACTION_PREFIX
 from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions, _get_parent_vizro_model
+from vizro.actions._get_page_action import _get_page
 from vizro.managers import data_manager
 from vizro.models import Action, VizroBaseModel
-from vizro.models._action._actions_chain import _action_validator_factory
+from vizro.models._action._actions_chain import ActionsChain, Trigger, _action_validator_factory
 from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._data_table_query import _get_page_data
 from vizro.models._models_utils import _log_call
 from vizro.models.types import CapturedCallable
 
 logger = logging.getLogger(__name__)
 
+# Number of rows on each page of a DataTable that doesn't set its own page_size, which is the DataTable's own default.
+_DEFAULT_PAGE_SIZE = 250
+
 
 class Table(VizroBaseModel):
     """Wrapper for `dash_table.DataTable` to visualize tables in dashboard.
@@ -32,6 +38,8 @@ class Table(VizroBaseModel):
             Defaults to `""`.
         footer (str): Markdown text positioned below the `Table`. Follows the CommonMark specification.
             Ideal for providing further details such as sources, disclaimers, or additional notes. Defaults to `""`.
+        server_side (bool): Whether to page, sort and filter the table on the server. Only the rows of the current page
+            are then sent to the browser. Defaults to `False`.
         actions (list[Action]): See [`Action`][vizro.models.Action]. Defaults to `[]`.
 
     """
@@ -51,6 +59,11 @@ class Table(VizroBaseModel):
         description="Markdown text positioned below the `Table`. Follows the CommonMark specification. Ideal for "
         "providing further details such as sources, disclaimers, or additional notes.",
     )
+    server_side: bool = Field(
+        False,
+        description="Whether to page, sort and filter the table on the server. Only the rows of the current page are "
+        "then sent to the browser.",
+    )
     actions: list[Action] = []
 
     _input_component_id: str = PrivateAttr()
@@ -69,10 +82,47 @@ class Table(VizroBaseModel):
         # If the functionality of process_callable_data_frame moves to CapturedCallable then this would move there too.
         if "data_frame" not in kwargs:
             kwargs["data_frame"] = data_manager[self["data_frame"]].load()
-        figure = self.figure(**kwargs)
+        return self._render(**kwargs)
+
+    def _render(self, **kwargs):
+        if not self.server_side:
+            figure = self.figure(**kwargs)
+        else:
+            # Pages are loaded by the _get_page action, so the table itself is made without any rows apart from those
+            # of its first page.
+            figure = self.figure(**{**kwargs, "data_frame": kwargs["data_frame"].iloc[:0]})
+            self._set_custom_actions(figure)
+            page = self._get_page_response(
+                kwargs["data_frame"],
+                page_current=getattr(figure, "page_current", 0),
+                page_size=figure.page_size,
+                sort_by=getattr(figure, "sort_by", []),
+                filter_query=getattr(figure, "filter_query", ""),
+            )
+            figure.data, figure.page_count = page["data"], page["page_count"]
         figure.id = self._input_component_id
         return figure
 
+    @staticmethod
+    def _set_custom_actions(figure):
+        """Sets the table to be paged, and sorted and filtered where these are enabled, by the server."""
+        figure.page_action = "custom"
+        figure.page_size = getattr(figure, "page_size", _DEFAULT_PAGE_SIZE)
+        for action in ["sort_action", "filter_action"]:
+            if getattr(figure, action, "none") != "none":
+                setattr(figure, action, "custom")
+
+    def _get_page_response(
+        self,
+        data_frame: pd.DataFrame,
+        page_current: Optional[int],
+        page_size: int,
+        sort_by: Optional[list[dict[str, str]]],
+        filter_query: Optional[str],
+    ) -> dict[str, Any]:
+        """Gets the data of the requested page of the table after applying its filter query and sorting."""
+        return _get_page_data(data_frame, page_current, page_size, sort_by, filter_query)
+
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
         # See figure implementation for more details.
@@ -97,6 +147,8 @@ class Table(VizroBaseModel):
         self, data_frame: pd.DataFrame, target: str, ctd_filter_interaction: dict[str, CallbackTriggerDict]
     ) -> pd.DataFrame:
         """Function to be carried out for pre-defined `filter_interaction`."""
+        # When the table is paged on the server, derived_viewport_data is just the data of the current page, which is
+        # also what the row of active_cell refers to.
         # data_frame is the DF of the target, ie the data to be filtered, hence we cannot get the DF from this model
         ctd_active_cell = ctd_filter_interaction["active_cell"]
         ctd_derived_viewport_data = ctd_filter_interaction["derived_viewport_data"]
@@ -119,6 +171,21 @@ class Table(VizroBaseModel):
     @_log_call
     def pre_build(self):
         self._input_component_id = self.figure._arguments.get("id", f"__input_{self.id}")
+        if self.server_side:
+            # Load the current page when the table changes page or its sorting or filter query changes.
+            for component_property in ["page_current", "sort_by", "filter_query"]:
+                self.actions.append(
+                    ActionsChain(
+                        id=f"{GET_PAGE_ACTION_PREFIX}_{component_property}_{self.id}",
+                        trigger=Trigger(component_id=self.id, component_property=component_property),
+                        actions=[
+                            Action(
+                                id=f"{GET_PAGE_ACTION_PREFIX}_action_{component_property}_{self.id}",
+                                function=_get_page(targets=[self.id]),
+                            )
+                        ],
+                    )
+                )
 
     def build(self):
         return dcc.Loading(
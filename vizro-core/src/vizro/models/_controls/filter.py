@@ -12,6 +12,7 @@ except ImportError:  # pragma: no cov
 
 from vizro._constants import FILTER_ACTION_PREFIX
 from vizro.actions import _filter
+from vizro.actions._actions_utils import _update_filter_plan
 from vizro.managers import data_manager, model_manager
 from vizro.managers._model_manager import ModelID
 from vizro.models import Action, VizroBaseModel
@@ -102,6 +103,7 @@ class Filter(VizroBaseModel):
         self._set_numerical_and_temporal_selectors_values()
         self._set_categorical_selectors_options()
         self._set_actions()
+        _update_filter_plan(self.selector)
 
     @_log_call
     def build(self):
@@ -112,24 +114,21 @@ class Filter(VizroBaseModel):
             for component_id in model_manager._get_page_model_ids_with_figure(
                 page_id=model_manager._get_model_page_id(model_id=ModelID(str(self.id)))
             ):
-                # TODO: consider making a helper method in data_manager or elsewhere to reduce this operation being
-                #  duplicated across Filter so much, and/or consider storing the result to avoid repeating it.
-                #  Need to think about this in connection with how to update filters on the fly and duplicated calls
-                #  issue outlined in https://github.com/mckinsey/vizro/pull/398#discussion_r1559120849.
+                # Column statistics are computed once per data source and shared across all Filters, so the data does
+                # not need to be loaded again for every target of every Filter.
                 data_source_name = model_manager[component_id]["data_frame"]
-                data_frame = data_manager[data_source_name].load()
-                if self.column in data_frame.columns:
+                if self.column in data_manager._get_column_statistics(data_source_name):
                     self.targets.append(component_id)
             if not self.targets:
                 raise ValueError(f"Selected column {self.column} not found in any dataframe on this page.")
 
     def _set_column_type(self):
         data_source_name = model_manager[self.targets[0]]["data_frame"]
-        data_frame = data_manager[data_source_name].load()
+        column_dtype = data_manager._get_column_statistics(data_source_name)[self.column].dtype
 
-        if is_numeric_dtype(data_frame[self.column]):
+        if is_numeric_dtype(column_dtype):
             self._column_type = "numerical"
-        elif is_datetime64_any_dtype(data_frame[self.column]):
+        elif is_datetime64_any_dtype(column_dtype):
             self._column_type = "temporal"
         else:
             self._column_type = "categorical"
@@ -153,9 +152,9 @@ class Filter(VizroBaseModel):
             max_values = []
             for target_id in self.targets:
                 data_source_name = model_manager[target_id]["data_frame"]
-                data_frame = data_manager[data_source_name].load()
-                min_values.append(data_frame[self.column].min())
-                max_values.append(data_frame[self.column].max())
+                column_statistics = data_manager._get_column_statistics(data_source_name)[self.column]
+                min_values.append(column_statistics.min)
+                max_values.append(column_statistics.max)
 
             if not (
                 (is_numeric_dtype(pd.Series(min_values)) and is_numeric_dtype(pd.Series(max_values)))
@@ -179,8 +178,11 @@ class Filter(VizroBaseModel):
             options = set()
             for target_id in self.targets:
                 data_source_name = model_manager[target_id]["data_frame"]
-                data_frame = data_manager[data_source_name].load()
-                options |= set(data_frame[self.column])
+                distinct_values = data_manager._get_column_statistics(data_source_name)[self.column].distinct_values
+                if distinct_values is None:
+                    # The column has too many distinct values to be stored in the column statistics.
+                    distinct_values = data_manager[data_source_name].load()[self.column]
+                options |= set(distinct_values)
 
             self.selector.options = sorted(options)
 
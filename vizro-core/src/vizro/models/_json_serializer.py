@@ -0,0 +1,113 @@
+"""Serialization to JSON of callback responses and cached figures, optionally with orjson."""
+
+import warnings
+from typing import Any, Literal, Optional
+
+import dash
+import flask
+from plotly.io.json import to_json_plotly
+from plotly.utils import PlotlyJSONEncoder
+
+try:
+    from dash._utils import to_json as _dash_to_json
+except ImportError:  # pragma: no cov
+    # This is what Dash's own to_json does.
+    _dash_to_json = to_json_plotly
+
+try:
+    import orjson
+except ImportError:  # pragma: no cov
+    orjson = None
+
+# Dash has no public way to change how callback responses are serialized. In these major versions of Dash, callback
+# responses are serialized with `dash._utils.to_json`, which is looked up in `dash._callback` every time.
+_SUPPORTED_DASH_MAJOR_VERSIONS = {2}
+
+# Dash and plotly serialize dictionaries with non-string keys and NumPy arrays, so orjson needs to do the same.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+
+
+def _to_json_orjson(value: Any) -> str:
+    """Serializes `value` to the same JSON as the standard library with `PlotlyJSONEncoder` but with orjson.
+
+    orjson serializes dictionaries, lists, numbers, strings, datetimes and NumPy arrays itself. Anything else, such as
+    Dash components, plotly objects and pandas timestamps, is converted exactly as Dash does with `PlotlyJSONEncoder`.
+    Unlike plotly's own orjson engine, which cleans the whole of `value` in Python as soon as one item isn't natively
+    serializable, only the items that need it are converted.
+    """
+    try:
+        return orjson.dumps(value, default=PlotlyJSONEncoder().default, option=_ORJSON_OPTIONS).decode()
+    except TypeError:
+        # A few values can't be serialized by orjson even after conversion, e.g. integers bigger than 64 bits.
+        return to_json_plotly(value, engine="json")
+
+
+def _can_replace_dash_to_json() -> bool:
+    """Whether callback responses of this version of Dash can be serialized with `_JsonSerializer`."""
+    return (
+        int(dash.__version__.split(".")[0]) in _SUPPORTED_DASH_MAJOR_VERSIONS
+        and getattr(dash._callback, "to_json", None) is _dash_to_json
+    )
+
+
+class _JsonSerializer:
+    """JSON serializer used for the responses of Vizro's Dash callbacks and for figures in the figure cache.
+
+    With engine `"json"`, values are serialized exactly as Dash serializes them. With engine `"orjson"`, values are
+    serialized with orjson, which is much faster for large figures and `dash_ag_grid` row data. The output can differ
+    from Dash's, e.g. in how dates and 32-bit floats are formatted.
+
+    Only the callbacks of the Dash app given to `configure` are serialized with orjson, so any other Dash app that runs
+    in the same process is not affected.
+    """
+
+    def __init__(self):
+        self.engine: Literal["json", "orjson"] = "json"
+        self._server: Optional[flask.Flask] = None
+
+    def configure(self, engine: Literal["auto", "json", "orjson"], server: flask.Flask):
+        """Sets the engine to use for callbacks of the app with Flask `server`.
+
+        `"auto"` uses orjson if it is installed and otherwise falls back to `"json"`.
+        """
+        self.clear()
+        if engine == "auto":
+            engine = "orjson" if orjson is not None else "json"
+        if engine not in {"json", "orjson"}:
+            raise ValueError(f"Unknown json_engine {engine!r}. Valid JSON engines are 'auto', 'json' and 'orjson'.")
+        if engine == "orjson" and orjson is None:
+            raise ValueError(
+                "json_engine='orjson' requires orjson to be installed, e.g. with `pip install vizro[orjson]`."
+            )
+        if engine == "orjson" and not _can_replace_dash_to_json():
+            warnings.warn(
+                f"json_engine='orjson' is not supported with Dash {dash.__version__}, so callback responses are "
+                "serialized by Dash instead.",
+                UserWarning,
+                stacklevel=3,
+            )
+            return
+
+        self.engine = engine
+        self._server = server
+        if engine == "orjson":
+            dash._callback.to_json = self._to_json_callback_response
+
+    def to_json(self, value: Any) -> str:
+        return _to_json_orjson(value) if self.engine == "orjson" else _dash_to_json(value)
+
+    def _to_json_callback_response(self, value: Any) -> str:
+        # Callbacks of other Dash apps in the same process are serialized as usual by Dash.
+        if flask.has_app_context() and flask.current_app._get_current_object() is self._server:
+            return self.to_json(value)
+        return _dash_to_json(value)
+
+    def clear(self):
+        """Resets the engine to `"json"` and restores Dash's own serialization of callback responses."""
+        self.engine = "json"
+        self._server = None
+        if getattr(dash._callback, "to_json", None) == self._to_json_callback_response:
+            dash._callback.to_json = _dash_to_json
+
+
+_json_serializer = _JsonSerializer()
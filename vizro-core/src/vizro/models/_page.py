@@ -10,7 +10,7 @@ try:
 except ImportError:  # pragma: no cov
     from pydantic import Field, root_validator, validator
 
-from vizro._constants import ON_PAGE_LOAD_ACTION_PREFIX
+from vizro._constants import ON_PAGE_LOAD_ACTION_PREFIX, TARGET_SIGNATURES_PREFIX
 from vizro.actions import _on_page_load
 from vizro.managers import model_manager
 from vizro.managers._model_manager import DuplicateIDError, ModelID
@@ -124,5 +124,6 @@ class Page(VizroBaseModel):
 
         # Page specific CSS ID and Stores
         components_container.children.append(dcc.Store(id=f"{ON_PAGE_LOAD_ACTION_PREFIX}_trigger_{self.id}"))
+        components_container.children.append(dcc.Store(id=f"{TARGET_SIGNATURES_PREFIX}_{self.id}"))
         components_container.id = "page-components"
         return html.Div([control_panel, components_container])
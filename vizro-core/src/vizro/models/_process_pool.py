@@ -0,0 +1,243 @@
+"""Persistent process pool used to run CPU-heavy chart functions outside the process that runs the callback."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing import shared_memory
+from typing import Any, Callable, Literal, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+logger = logging.getLogger(__name__)
+
+# Only columns that are plain NumPy arrays of these kinds can be put in shared memory. Everything else (e.g. strings,
+# categoricals and other extension arrays) is pickled.
+_SHARED_MEMORY_DTYPE_KINDS = "biufcmM"
+
+
+class _SharedColumn(NamedTuple):
+    """Location of a column inside a shared memory block."""
+
+    dtype: str
+    offset: int
+
+
+class _SharedDataFrame(NamedTuple):
+    """Description of a DataFrame whose NumPy columns are stored in shared memory.
+
+    This is what is pickled and sent to a worker instead of the DataFrame itself. Only columns that can't be put in
+    shared memory go in `pickled_columns`.
+    """
+
+    shared_memory_name: Optional[str]
+    columns: list[Any]
+    shared_columns: dict[int, _SharedColumn]
+    pickled_columns: dict[int, Any]
+    index: pd.Index
+
+
+def _to_shared_memory(data_frame: pd.DataFrame) -> tuple[_SharedDataFrame, Optional[shared_memory.SharedMemory]]:
+    """Copies the NumPy columns of `data_frame` into a single shared memory block.
+
+    The caller is responsible for closing and unlinking the returned shared memory block.
+    """
+    shared_columns, pickled_columns, arrays = {}, {}, {}
+    nbytes = 0
+    for position, (_, series) in enumerate(data_frame.items()):
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in _SHARED_MEMORY_DTYPE_KINDS:
+            array = series.to_numpy()
+            shared_columns[position] = _SharedColumn(array.dtype.str, nbytes)
+            arrays[position] = array
+            nbytes += array.nbytes
+        else:
+            pickled_columns[position] = series.array
+
+    if not nbytes:
+        # Shared memory blocks can't be empty, but then there's nothing worth sharing anyway.
+        return _SharedDataFrame(
+            None, list(data_frame.columns), {}, {**pickled_columns, **arrays}, data_frame.index
+        ), None
+
+    block = shared_memory.SharedMemory(create=True, size=nbytes)
+    for position, array in arrays.items():
+        offset = shared_columns[position].offset
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf, offset=offset)[:] = array
+
+    shared_data_frame = _SharedDataFrame(
+        shared_memory_name=block.name,
+        columns=list(data_frame.columns),
+        shared_columns=shared_columns,
+        pickled_columns=pickled_columns,
+        index=data_frame.index,
+    )
+    return shared_data_frame, block
+
+
+def _from_shared_memory(shared_data_frame: _SharedDataFrame) -> pd.DataFrame:
+    """Rebuilds the DataFrame described by `shared_data_frame`, copying its columns out of shared memory."""
+    length = len(shared_data_frame.index)
+    columns = dict(shared_data_frame.pickled_columns)
+    if shared_data_frame.shared_memory_name is not None:
+        # The columns are copied so that the block can be closed straight away, before the chart function runs.
+        block = shared_memory.SharedMemory(name=shared_data_frame.shared_memory_name)
+        try:
+            for position, (dtype, offset) in shared_data_frame.shared_columns.items():
+                columns[position] = np.ndarray(length, dtype=dtype, buffer=block.buf, offset=offset).copy()
+        finally:
+            block.close()
+
+    data_frame = pd.DataFrame(
+        {position: columns[position] for position in range(len(shared_data_frame.columns))},
+        index=shared_data_frame.index,
+    )
+    data_frame.columns = shared_data_frame.columns
+    return data_frame
+
+
+def _import_function(module: str, qualname: str) -> Callable[..., go.Figure]:
+    """Imports the function that was decorated with `capture`.
+
+    The function itself can't be pickled since the name it's imported by refers to the decorated function instead.
+    Only the `capture` decorator is removed, so that the worker runs exactly the function that `capture` wrapped. Any
+    other decorator of the function, e.g. one added by the user or the one that chooses the render_mode of plotly
+    express charts, still runs.
+    """
+    function = importlib.import_module(module)
+    for name in qualname.split("."):
+        function = getattr(function, name)
+    return getattr(function, "_captured_function", function)
+
+
+def _can_import_function(function: Callable[..., go.Figure]) -> bool:
+    """Whether `function` can be imported by its module and qualified name, as is done to run it in a worker.
+
+    This is not possible for e.g. lambda functions and functions defined inside other functions.
+    """
+    try:
+        _import_function(function.__module__, function.__qualname__)
+    except (ImportError, AttributeError):
+        return False
+    return True
+
+
+def _run_chart_function(module: str, qualname: str, kwargs: dict[str, Any], shared_data_frame) -> dict[str, Any]:
+    """Runs in a worker: rebuilds the data, runs the chart function and returns the figure as a dictionary."""
+    function = _import_function(module, qualname)
+    return function(data_frame=_from_shared_memory(shared_data_frame), **kwargs).to_plotly_json()
+
+
+class _ChartProcessPool:
+    """Process pool used for `CapturedCallable`s of mode `"graph"` that run with executor `"process"`.
+
+    The pool is created lazily on first use and persists between callbacks. After `max_tasks_per_worker` tasks per
+    worker, the pool is replaced by a new one so that memory leaked by chart functions is given back. When a chart
+    function does not finish within `timeout` seconds, the pool's workers are killed and the pool is replaced.
+    """
+
+    def __init__(self):
+        self.default: bool = False
+        self.timeout: Optional[float] = None
+        self.max_tasks_per_worker: int = 100
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Number of workers in each pool, which is also used to count when the workers should be replaced.
+        self._max_workers = os.cpu_count() or 1
+        self._tasks = 0
+        self._lock = threading.Lock()
+        # Process id of the process that configured the pool. Workers that were forked from it (e.g. by
+        # Vizro(executor="process")) run chart functions themselves rather than using a copy of the pool.
+        self._pid = os.getpid()
+
+    def configure(self, executor: Optional[Literal["process"]], timeout: Optional[float], max_tasks_per_worker: int):
+        """Sets the options of the pool, shutting down any existing workers."""
+        self.shutdown()
+        if executor not in {None, "process"}:
+            raise ValueError(f"Unknown chart_executor {executor!r}. Valid chart executors are 'process' and None.")
+        if executor == "process" and "fork" not in multiprocessing.get_all_start_methods():
+            # Processes must be forked so that chart functions defined in the dashboard's own modules can be run.
+            raise ValueError("chart_executor='process' is only possible on platforms that support forking.")
+        self.default = executor == "process"
+        self.timeout = timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._pid = os.getpid()
+
+    def use_for(self, executor: Optional[str]) -> bool:
+        """Whether a `CapturedCallable` with the given executor should run in the pool."""
+        if os.getpid() != self._pid:
+            return False
+        return executor == "process" or (executor is None and self.default)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is not None and self._tasks >= self.max_tasks_per_worker * self._max_workers:
+                # Tasks that have already been submitted still run to completion in the old pool.
+                logger.debug("Recycling chart worker processes after %s tasks.", self._tasks)
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers, mp_context=multiprocessing.get_context("fork")
+                )
+                self._tasks = 0
+            self._tasks += 1
+            return self._executor
+
+    def _terminate(self, executor: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        # ProcessPoolExecutor.kill_workers is only available from Python 3.14. Before that there is no public way to
+        # stop a worker that is still running a task, so the worker processes are killed directly as kill_workers does.
+        if hasattr(executor, "kill_workers"):
+            executor.kill_workers()
+            return
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+    def run(self, function: Callable[..., go.Figure], kwargs: dict[str, Any]) -> go.Figure:
+        """Runs `function(**kwargs)` in the pool and returns the figure it produces."""
+        kwargs = dict(kwargs)
+        shared_data_frame, block = _to_shared_memory(kwargs.pop("data_frame"))
+        try:
+            executor = self._get_executor()
+            future = executor.submit(
+                _run_chart_function, function.__module__, function.__qualname__, kwargs, shared_data_frame
+            )
+            try:
+                figure_dict = future.result(timeout=self.timeout)
+            except FutureTimeoutError as exc:
+                self._terminate(executor)
+                raise TimeoutError(
+                    f"Chart function {function.__name__} did not finish within {self.timeout} seconds."
+                ) from exc
+        finally:
+            if block is not None:
+                block.close()
+                block.unlink()
+        # The figure was already validated when it was made in the worker, so it doesn't need to be validated again.
+        return go.Figure(figure_dict, _validate=False)
+
+    def clear(self):
+        """Shuts down any existing workers and resets the options of the pool."""
+        self.shutdown()
+        self.default, self.timeout, self.max_tasks_per_worker = False, None, 100
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+            self._tasks = 0
+
+
+_chart_process_pool = _ChartProcessPool()
@@ -0,0 +1,106 @@
+"""Encoding of figure trace data as plotly.js typed arrays, which are smaller and faster to serialize than lists."""
+
+import base64
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+from _plotly_utils.basevalidators import CompoundValidator, DataArrayValidator
+from plotly.basedatatypes import BasePlotlyType
+
+_INT32_INFO = np.iinfo(np.int32)
+_UINT32_INFO = np.iinfo(np.uint32)
+# Item sizes in bytes of the integer and float types that plotly.js typed arrays support.
+_INT_ITEMSIZES = {1, 2, 4}
+_FLOAT_ITEMSIZES = {4, 8}
+
+# Properties of traces that are encoded as typed arrays, with nested properties given as nested dictionaries. Only
+# coordinates and marker properties are encoded. plotly.js decodes typed arrays without changing the figure it's given,
+# and dcc.Graph builds e.g. `clickData` from that figure, so properties such as `customdata`, `ids` and
+# `selectedpoints` must stay as lists for filter interactions and selections to work.
+_MARKER_PROPERTIES: dict[str, Optional[dict]] = {
+    "color": None,
+    "opacity": None,
+    "size": None,
+    "line": {"color": None, "width": None},
+}
+_TRACE_PROPERTIES: dict[str, Optional[dict]] = {
+    **dict.fromkeys(["x", "y", "z", "a", "b", "c", "r", "theta", "lat", "lon", "u", "v", "w"]),
+    **dict.fromkeys(["open", "high", "low", "close", "values"]),
+    "marker": _MARKER_PROPERTIES,
+}
+
+
+def _to_typed_array(value: Any) -> Any:
+    """Converts a numerical NumPy array to a plotly.js typed array specification, leaving anything else unchanged.
+
+    plotly.js supports only 1 to 4 byte integers and 4 or 8 byte floats, so other integers are converted to 4 byte
+    integers where their values allow and otherwise to floats.
+    """
+    if not isinstance(value, np.ndarray) or value.dtype.kind not in "iuf" or value.ndim not in {1, 2} or not value.size:
+        return value
+
+    if value.dtype.kind in "iu" and value.dtype.itemsize not in _INT_ITEMSIZES:
+        info = _INT32_INFO if value.dtype.kind == "i" else _UINT32_INFO
+        if info.min <= value.min() and value.max() <= info.max:
+            value = value.astype(f"{value.dtype.kind}4")
+        else:
+            value = value.astype("f8")
+    elif value.dtype.kind == "f" and value.dtype.itemsize not in _FLOAT_ITEMSIZES:
+        value = value.astype("f8")
+
+    # plotly.js reads the bytes as little-endian.
+    value = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("<"))
+    typed_array = {"dtype": value.dtype.str.lstrip("<|"), "bdata": base64.b64encode(value.tobytes()).decode()}
+    if value.ndim > 1:
+        typed_array["shape"] = ",".join(map(str, value.shape))
+    return typed_array
+
+
+def _encode_data_arrays(
+    plotly_object: BasePlotlyType, encoded_properties: dict[str, Optional[dict]] = _TRACE_PROPERTIES
+) -> dict[str, Any]:
+    """Gets the properties of `plotly_object` with its `encoded_properties`, including nested ones, as typed arrays.
+
+    Only properties that plotly.js accepts arrays for, i.e. data arrays such as `x` and array-ok properties such as
+    `marker.size`, can be typed arrays; others such as the `domain` of a pie chart must stay as lists.
+    """
+    properties = {}
+    for name, value in plotly_object._props.items():
+        validator = plotly_object._get_validator(name)
+        if name not in encoded_properties:
+            properties[name] = value
+        elif isinstance(validator, DataArrayValidator) or getattr(validator, "array_ok", False):
+            properties[name] = _to_typed_array(value)
+        elif isinstance(validator, CompoundValidator) and encoded_properties[name] is not None:
+            properties[name] = _encode_data_arrays(plotly_object[name], encoded_properties[name])
+        else:
+            properties[name] = value
+    return properties
+
+
+def _encode_typed_arrays(fig: Any) -> Any:
+    """Returns `fig` as a dictionary with its numerical trace data encoded as typed arrays.
+
+    Anything that is not a `go.Figure` (e.g. a figure that has already been serialized) is returned unchanged.
+    """
+    if not isinstance(fig, go.Figure):
+        return fig
+
+    fig_dict = {"data": [_encode_data_arrays(trace) for trace in fig.data], "layout": fig.layout}
+    if fig.frames:
+        fig_dict["frames"] = fig.frames
+    return fig_dict
+
+
+def _encode_callback_outputs(outputs: Any) -> Any:
+    """Encodes the trace data of every `go.Figure` in the outputs of a callback as typed arrays.
+
+    `outputs` has the same form as the return value of an action function: a dictionary, list or single value.
+    """
+    if isinstance(outputs, Mapping):
+        return {key: _encode_typed_arrays(value) for key, value in outputs.items()}
+    if isinstance(outputs, (list, tuple)):
+        return [_encode_typed_arrays(value) for value in outputs]
+    return _encode_typed_arrays(outputs)
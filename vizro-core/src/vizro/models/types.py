@@ -8,8 +8,9 @@ import importlib
 import inspect
 from contextlib import contextmanager
 from datetime import date
-from typing import Any, Literal, Protocol, Union, runtime_checkable
+from typing import Any, Literal, Optional, Protocol, Union, runtime_checkable
 
+import pandas as pd
 import plotly.io as pio
 
 try:
@@ -115,6 +116,8 @@ class CapturedCallable:
         # Used in later validations of the captured callable.
         self._mode = None
         self._model_example = None
+        # Where to run the function in a dashboard. None means use the default set by Vizro(chart_executor=...).
+        self._executor = None
 
     def __call__(self, *args, **kwargs):
         """Run the `function` with the initially bound arguments overridden by `**kwargs`.
@@ -150,7 +153,14 @@ class CapturedCallable:
             # since this will already raise error in the following function call.
             return self.__function(**dict(zip(unbound_positional_arguments, args)), **self.__bound_arguments)
 
-        return self.__function(**{**self.__bound_arguments, **kwargs})
+        arguments = {**self.__bound_arguments, **kwargs}
+        if self._mode == "graph" and isinstance(arguments.get("data_frame"), pd.DataFrame):
+            from vizro.models._process_pool import _chart_process_pool
+
+            if _chart_process_pool.use_for(self._executor):
+                return _chart_process_pool.run(self.__function, arguments)
+
+        return self.__function(**arguments)
 
     def __getitem__(self, arg_name: str):
         """Gets the value of a bound argument."""
@@ -316,11 +326,18 @@ class capture:
     Args:
         mode: The mode of the captured callable. Valid modes are `"graph"`, `"table"`, `"ag_grid"`,
             `"figure"` and `"action"`.
+        executor: Only for `mode="graph"`. Where to run the function in a dashboard. With `"process"`, the function
+            runs in a persistent pool of worker processes, which helps for CPU-heavy charts that hold the GIL. With
+            `"local"`, the function runs in the process that handles the callback. Defaults to `None`, which uses the
+            `chart_executor` given to [`Vizro`][vizro.Vizro].
 
     Examples:
         >>> @capture("graph")
         >>> def graph_function():
         >>>     ...
+        >>> @capture("graph", executor="process")
+        >>> def heavy_graph_function():
+        >>>     ...
         >>> @capture("table")
         >>> def table_function():
         >>>     ...
@@ -345,8 +362,18 @@ class capture:
 
     """
 
-    def __init__(self, mode: Literal["graph", "action", "table", "ag_grid", "figure"]):
+    def __init__(
+        self,
+        mode: Literal["graph", "action", "table", "ag_grid", "figure"],
+        *,
+        executor: Optional[Literal["process", "local"]] = None,
+    ):
         """Decorator to capture a function call."""
+        if executor is not None and mode != "graph":
+            raise ValueError("The executor argument of the capture decorator can only be used with mode 'graph'.")
+        if executor not in {None, "process", "local"}:
+            raise ValueError(f"Unknown executor {executor!r}. Valid executors are 'process', 'local' and None.")
+        self._executor = executor
         # mode and model_example are used in later validations of the captured callable.
         self._mode = mode
         model_examples = {
@@ -381,6 +408,7 @@ class capture:
                 captured_callable: CapturedCallable = CapturedCallable(func, *args, **kwargs)
                 captured_callable._mode = self._mode
                 captured_callable._model_example = self._model_example
+                captured_callable._executor = self._executor
 
                 try:
                     captured_callable["data_frame"]
@@ -415,6 +443,9 @@ class capture:
                 fig._captured_callable = captured_callable
                 return fig
 
+            # The function that was captured, which is what the chart process pool runs. Unlike __wrapped__, this is
+            # only set by capture and so distinguishes the capture decorator from any other decorator of func.
+            wrapped._captured_function = func
             return wrapped
         elif self._mode == "action":
             # The "normal" case where we just capture the function call.
@@ -4,12 +4,43 @@ Makes them compatible with the dashboard when you do `import vizro.plotly.expres
 Only plotly figures are wrapped; everything else is passed through unmodified, e.g. px.data.
 """
 
-from typing import Any
+import functools
+import inspect
+from typing import Any, Callable
 
+import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 
 from vizro.models.types import capture
 
+# Charts whose data_frame has more rows than this are drawn with WebGL rather than SVG when render_mode is not given.
+# WebGL is much faster for large numbers of points, but browsers limit how many WebGL graphs can be shown at once.
+webgl_threshold: int = 1000
+
+
+def _choose_render_mode(px_function: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """Wraps a plotly express function so that its `render_mode` is chosen by `webgl_threshold` unless given."""
+
+    @functools.wraps(px_function)
+    def wrapped(*args, **kwargs) -> go.Figure:
+        arguments = inspect.signature(px_function).bind(*args, **kwargs).arguments
+        data_frame = arguments.get("data_frame")
+        if arguments.get("render_mode", "auto") == "auto" and isinstance(data_frame, pd.DataFrame):
+            # Like plotly's own "auto" render mode, WebGL is not used for spline lines or animations, which it
+            # doesn't support.
+            use_webgl = (
+                len(data_frame) > webgl_threshold
+                and arguments.get("line_shape") != "spline"
+                and arguments.get("animation_frame") is None
+            )
+            arguments["render_mode"] = "webgl" if use_webgl else "svg"
+        return px_function(**arguments)
+
+    # The wrapped function is imported from here rather than from plotly, e.g. when it runs in a worker process.
+    wrapped.__module__ = __name__
+    return wrapped
+
 
 # TODO: is there a better way to see if the import is a graph? Don't want to check return type though. -> MS
 # Might also want to define __dir__ or __all__ in order to facilitate IDE completion etc.
@@ -17,6 +48,10 @@ from vizro.models.types import capture
 def __getattr__(name: str) -> Any:
     px_name = getattr(px, name)
     try:
-        return capture(mode="graph")(px_name) if px_name.__module__ == "plotly.express._chart_types" else px_name
+        if px_name.__module__ != "plotly.express._chart_types":
+            return px_name
     except AttributeError:
         return px_name
+    if "render_mode" in inspect.signature(px_name).parameters:
+        px_name = _choose_render_mode(px_name)
+    return capture(mode="graph")(px_name)
@@ -0,0 +1,19 @@
+// Grid APIs of AG Grids with infinite row model that have already loaded their first block of rows.
+const infinite_grid_apis = new WeakSet();
+
+function purge_infinite_cache(children, grid_id) {
+  dash_ag_grid.getApiAsync(grid_id).then((grid_api) => {
+    // A grid that has just been created requests its first block of rows itself, so there is nothing to purge.
+    if (infinite_grid_apis.has(grid_api)) {
+      grid_api.purgeInfiniteCache();
+    } else {
+      infinite_grid_apis.add(grid_api);
+    }
+  });
+  return dash_clientside.no_update;
+}
+
+window.dash_clientside = {
+  ...window.dash_clientside,
+  ag_grid: { purge_infinite_cache: purge_infinite_cache },
+};
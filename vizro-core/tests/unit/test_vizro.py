@@ -1,10 +1,12 @@
 import operator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import dash
 import pytest
 
 import vizro
 from vizro._constants import VIZRO_ASSETS_PATH
+from vizro.actions._actions_utils import _target_executors
 
 _git_branch = vizro.__version__ if "dev" not in vizro.__version__ else "main"
 
@@ -100,3 +102,39 @@ class TestDashResources:
                 library_scripts.append({"namespace": "vizro", resource_key: resource[resource_key]})
 
         assert app.scripts.get_library_scripts("vizro") == library_scripts
+
+
+class TestVizroExecutor:
+    def test_default(self):
+        vizro.Vizro()
+        assert _target_executors.thread_executor is _target_executors.render_executor is None
+
+    def test_thread(self):
+        vizro.Vizro(executor="thread")
+        assert isinstance(_target_executors.thread_executor, ThreadPoolExecutor)
+        assert _target_executors.render_executor is _target_executors.thread_executor
+
+    def test_process(self):
+        vizro.Vizro(executor="process")
+        assert isinstance(_target_executors.thread_executor, ThreadPoolExecutor)
+        assert isinstance(_target_executors.render_executor, ProcessPoolExecutor)
+
+    def test_none(self):
+        vizro.Vizro(executor="thread")
+        vizro.Vizro(executor=None)
+        assert _target_executors.thread_executor is _target_executors.render_executor is None
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Unknown executor 'invalid'"):
+            vizro.Vizro(executor="invalid")
+
+    def test_previous_executor_shut_down(self):
+        executor = ThreadPoolExecutor()
+        vizro.Vizro(executor=executor)
+        vizro.Vizro()
+        with pytest.raises(RuntimeError, match="cannot schedule new futures after shutdown"):
+            executor.submit(print)
+
+    def test_invalid_chart_executor(self):
+        with pytest.raises(ValueError, match="Unknown chart_executor 'thread'"):
+            vizro.Vizro(chart_executor="thread")
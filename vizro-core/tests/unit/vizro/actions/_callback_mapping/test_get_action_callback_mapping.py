@@ -141,6 +141,7 @@ def action_callback_inputs_expected():
                 "modelID": dash.State("vizro_table", "id"),
             },
         ],
+        "target_signatures": dash.State("target_signatures_test_page", "data"),
     }
 
 
@@ -148,7 +149,11 @@ def action_callback_inputs_expected():
 def action_callback_outputs_expected(request):
     targets = request.param
     return {
-        target["component_id"]: dash.Output(target["component_id"], target["component_property"]) for target in targets
+        **{
+            target["component_id"]: dash.Output(target["component_id"], target["component_property"])
+            for target in targets
+        },
+        "target_signatures_test_page": dash.Output("target_signatures_test_page", "data"),
     }
 
 
@@ -1,6 +1,34 @@
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import dash
+import pandas as pd
 import pytest
+from flask_caching import Cache
+from pandas.testing import assert_frame_equal
+from plotly.io.json import to_json_plotly
 
-from vizro.actions._actions_utils import _create_target_arg_mapping, _update_nested_graph_properties
+import vizro.actions._actions_utils as actions_utils
+import vizro.figures._kpi_cards as kpi_cards
+import vizro.models as vm
+import vizro.plotly.express as px
+from vizro import Vizro
+from vizro.actions._actions_utils import (
+    CallbackTriggerDict,
+    _apply_filters,
+    _create_target_arg_mapping,
+    _DataLoadMemo,
+    _estimate_filter_selectivity,
+    _get_modified_page_figures,
+    _get_targets_data_and_config,
+    _map,
+    _update_nested_graph_properties,
+)
+from vizro.figures import kpi_card, kpi_card_reference
+from vizro.managers import data_manager, model_manager
+from vizro.managers._data_manager import _ColumnIndexes
+from vizro.tables import dash_ag_grid
 
 
 class TestUpdateNestedGraphProperties:
@@ -94,3 +122,571 @@ class TestCreateTargetArgMapping:
         input_strings = ["component1.argument1.extra", "component2.argument2.extra"]
         expected = {"component1": ["argument1.extra"], "component2": ["argument2.extra"]}
         assert _create_target_arg_mapping(input_strings) == expected
+
+
+class TestDataLoadMemo:
+    def test_static_data_loaded_once(self, gapminder, mocker):
+        data_manager["gapminder"] = gapminder
+        load_spy = mocker.spy(data_manager["gapminder"], "load")
+        memo = _DataLoadMemo()
+
+        data_frame_1 = memo.load("gapminder")
+        data_frame_2 = memo.load("gapminder")
+
+        assert load_spy.call_count == 1
+        assert (memo.loads, memo.hits) == (1, 1)
+        assert_frame_equal(data_frame_1, gapminder)
+        assert_frame_equal(data_frame_2, gapminder)
+        # Each load gives a separate object, so adding a column for one target does not affect another.
+        assert data_frame_1 is not data_frame_2
+        data_frame_1["new_column"] = 1
+        assert "new_column" not in data_frame_2
+
+    def test_column_indexes(self, gapminder):
+        data_manager["gapminder"] = gapminder
+        data_manager["gapminder"].indexed_columns = ["continent"]
+        memo = _DataLoadMemo()
+
+        assert memo.get_column_indexes("gapminder") is None
+        memo.load("gapminder")
+        assert memo.get_column_indexes("gapminder").columns == {"continent"}
+        # Column indexes are reused between callbacks for as long as the data does not change.
+        assert _DataLoadMemo().get_column_indexes("gapminder") is None
+        new_memo = _DataLoadMemo()
+        new_memo.load("gapminder")
+        assert new_memo.get_column_indexes("gapminder") is memo.get_column_indexes("gapminder")
+
+    def test_dynamic_data_loaded_once_per_arguments(self, gapminder_dynamic_first_n_last_n_function, mocker):
+        data_manager["gapminder"] = gapminder_dynamic_first_n_last_n_function
+        load_spy = mocker.spy(data_manager["gapminder"], "_load_with_version")
+        memo = _DataLoadMemo()
+
+        memo.load("gapminder", first_n=10)
+        memo.load("gapminder", first_n=10)
+        memo.load("gapminder", first_n=20)
+        memo.load("gapminder", first_n=10, last_n=5)
+
+        assert load_spy.call_count == 3
+        assert (memo.loads, memo.hits) == (3, 1)
+
+    def test_unhashable_arguments_not_memoized(self, mocker):
+        data_manager["data"] = lambda arg=None: pd.DataFrame()
+        load_spy = mocker.spy(data_manager["data"], "load")
+        memo = _DataLoadMemo()
+
+        memo.load("data", arg=pd.Series([1]))
+        memo.load("data", arg=pd.Series([1]))
+
+        assert load_spy.call_count == 2
+        assert (memo.loads, memo.hits) == (2, 0)
+
+
+class TestGetTargetsDataAndConfig:
+    def test_targets_with_same_data_source_loaded_once(self, gapminder, mocker):
+        data_manager["gapminder"] = gapminder
+        vm.Page(
+            title="Page",
+            components=[
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp")),
+                vm.Graph(id="box_chart", figure=px.box("gapminder", x="continent", y="lifeExp")),
+            ],
+        )
+        load_spy = mocker.spy(data_manager["gapminder"], "load")
+
+        filtered_data, _ = _get_targets_data_and_config(
+            ctds_filter=[], ctds_filter_interaction=[], ctds_parameters=[], targets=["scatter_chart", "box_chart"]
+        )
+
+        assert load_spy.call_count == 1
+        assert_frame_equal(filtered_data["scatter_chart"], gapminder)
+        assert_frame_equal(filtered_data["box_chart"], gapminder)
+
+    @pytest.mark.parametrize(
+        "filter_targets, filtered_targets, expected_filter_count",
+        [
+            ([], ["scatter_chart", "box_chart"], 1),
+            (["scatter_chart"], ["scatter_chart"], 2),
+            (["scatter_chart", "box_chart"], ["scatter_chart", "box_chart"], 1),
+        ],
+    )
+    def test_targets_with_same_filters_filtered_once(
+        self, gapminder, mocker, filter_targets, filtered_targets, expected_filter_count
+    ):
+        data_manager["gapminder"] = gapminder
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp")),
+                vm.Graph(id="box_chart", figure=px.box("gapminder", x="continent", y="lifeExp")),
+            ],
+            controls=[
+                vm.Filter(column="continent", targets=filter_targets, selector=vm.Checklist(id="continent_filter"))
+            ],
+        )
+        Vizro._pre_build()
+        apply_filters_spy = mocker.spy(actions_utils, "_apply_filters")
+        ctds_filter = [
+            CallbackTriggerDict(
+                id="continent_filter", property="value", value=["Europe"], str_id="continent_filter", triggered=False
+            )
+        ]
+
+        filtered_data, _ = _get_targets_data_and_config(
+            ctds_filter=ctds_filter,
+            ctds_filter_interaction=[],
+            ctds_parameters=[],
+            targets=["scatter_chart", "box_chart"],
+        )
+
+        assert apply_filters_spy.call_count == expected_filter_count
+        for target in ["scatter_chart", "box_chart"]:
+            expected_data = gapminder[gapminder["continent"] == "Europe"] if target in filtered_targets else gapminder
+            assert_frame_equal(filtered_data[target], expected_data)
+        # Each target gets a separate object even when the filtered data is shared.
+        assert filtered_data["scatter_chart"] is not filtered_data["box_chart"]
+
+
+class TestFilteredDataCache:
+    @pytest.fixture
+    def managers_one_page_with_filter(self, gapminder):
+        data_manager["gapminder"] = gapminder
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp"))],
+            controls=[vm.Filter(column="continent", selector=vm.Checklist(id="continent_filter"))],
+        )
+        Vizro._pre_build()
+
+    @staticmethod
+    def get_filtered_data(continent):
+        ctds_filter = [
+            CallbackTriggerDict(
+                id="continent_filter", property="value", value=continent, str_id="continent_filter", triggered=False
+            )
+        ]
+        filtered_data, _ = _get_targets_data_and_config(
+            ctds_filter=ctds_filter, ctds_filter_interaction=[], ctds_parameters=[], targets=["scatter_chart"]
+        )
+        return filtered_data["scatter_chart"]
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter")
+    def test_disabled_by_default(self, mocker):
+        apply_filters_spy = mocker.spy(actions_utils, "_apply_filters")
+        self.get_filtered_data(["Europe"])
+        self.get_filtered_data(["Asia"])
+        self.get_filtered_data(["Europe"])
+        assert apply_filters_spy.call_count == 3
+        assert len(data_manager._filtered_data_cache) == 0
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter")
+    def test_latest_filtered_data_reused_by_default(self, gapminder, mocker):
+        apply_filters_spy = mocker.spy(actions_utils, "_apply_filters")
+        filtered_data_1 = self.get_filtered_data(["Europe"])
+        filtered_data_1.loc[filtered_data_1.index[0], "lifeExp"] = 0
+        filtered_data_2 = self.get_filtered_data(["Europe"])
+
+        assert apply_filters_spy.call_count == 1
+        # The reused data is a copy that can be modified in place without affecting the data that is kept.
+        assert_frame_equal(filtered_data_2, gapminder[gapminder["continent"] == "Europe"])
+        filtered_data_2.loc[filtered_data_2.index[0], "lifeExp"] = 0
+        assert_frame_equal(self.get_filtered_data(["Europe"]), gapminder[gapminder["continent"] == "Europe"])
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter")
+    def test_same_filters_filtered_once(self, gapminder, mocker):
+        data_manager.filtered_data_cache_size = 10 * 1024**2
+        apply_filters_spy = mocker.spy(actions_utils, "_apply_filters")
+
+        filtered_data_1 = self.get_filtered_data(["Europe", "Asia"])
+        # The order of selected values does not matter.
+        filtered_data_2 = self.get_filtered_data(["Asia", "Europe"])
+        filtered_data_3 = self.get_filtered_data(["Europe"])
+
+        assert apply_filters_spy.call_count == 2
+        assert (data_manager._filtered_data_cache.hits, data_manager._filtered_data_cache.misses) == (1, 2)
+        expected_data = gapminder[gapminder["continent"].isin(["Europe", "Asia"])]
+        assert_frame_equal(filtered_data_1, expected_data)
+        assert_frame_equal(filtered_data_2, expected_data)
+        assert_frame_equal(filtered_data_3, gapminder[gapminder["continent"] == "Europe"])
+        # Data given to different callbacks can't be modified in place so that the cached data stays unchanged.
+        with pytest.raises(ValueError, match="read-only"):
+            filtered_data_2.loc[filtered_data_2.index[0], "lifeExp"] = 0
+
+    def test_dynamic_data_not_cached_without_cache(self, gapminder, mocker):
+        data_manager["gapminder"] = lambda: gapminder
+        data_manager.filtered_data_cache_size = 10 * 1024**2
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp"))],
+            controls=[vm.Filter(column="continent", selector=vm.Checklist(id="continent_filter"))],
+        )
+        Vizro._pre_build()
+        apply_filters_spy = mocker.spy(actions_utils, "_apply_filters")
+
+        self.get_filtered_data(["Europe"])
+        self.get_filtered_data(["Europe"])
+
+        # Dynamic data that is not cached could be different every time it's loaded.
+        assert apply_filters_spy.call_count == 2
+
+    @pytest.mark.parametrize("filtered_data_cache_size", [0, 10 * 1024**2])
+    @pytest.mark.parametrize("data_source", ["static", "dynamic"])
+    def test_data_not_loaded_when_filtered_data_cached(self, gapminder, data_source, filtered_data_cache_size, mocker):
+        if data_source == "static":
+            data_manager["gapminder"] = gapminder
+        else:
+            data_manager["gapminder"] = lambda: gapminder
+            data_manager.cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+            Vizro()
+        # The latest filtered data of each target is reused even when filtered_data_cache_size is 0.
+        data_manager.filtered_data_cache_size = filtered_data_cache_size
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp"))],
+            controls=[
+                vm.Filter(column="continent", selector=vm.Checklist(id="continent_filter")),
+                vm.Parameter(
+                    targets=["scatter_chart.color"], selector=vm.RadioItems(id="color_parameter", options=["a", "b"])
+                ),
+            ],
+        )
+        Vizro._pre_build()
+        load_spy = mocker.spy(type(data_manager["gapminder"]), "_load_with_version")
+
+        for color in ["continent", "country"]:
+            filtered_data, parameterized_config = _get_targets_data_and_config(
+                ctds_filter=[
+                    CallbackTriggerDict(
+                        id="continent_filter",
+                        property="value",
+                        value=["Europe"],
+                        str_id="continent_filter",
+                        triggered=False,
+                    )
+                ],
+                ctds_filter_interaction=[],
+                ctds_parameters=[
+                    CallbackTriggerDict(
+                        id="color_parameter", property="value", value=color, str_id="color_parameter", triggered=False
+                    )
+                ],
+                targets=["scatter_chart"],
+            )
+            assert parameterized_config["scatter_chart"]["color"] == color
+            assert_frame_equal(filtered_data["scatter_chart"], gapminder[gapminder["continent"] == "Europe"])
+
+        # Only the color changed, so the filtered data is reused without loading the data again.
+        assert load_spy.call_count == 1
+
+
+class TestMap:
+    @pytest.fixture
+    def thread_executor(self):
+        executor = ThreadPoolExecutor(max_workers=4)
+        yield executor
+        executor.shutdown()
+
+    @pytest.mark.parametrize("use_executor", [False, True])
+    def test_order(self, use_executor, thread_executor):
+        # Earlier calls take longer so that they complete last when run concurrently.
+        def slow_square(value):
+            time.sleep((5 - value) / 100)
+            return value**2
+
+        executor = thread_executor if use_executor else None
+        assert _map(executor, slow_square, range(5)) == [0, 1, 4, 9, 16]
+
+    def test_context_copied_to_threads(self, thread_executor):
+        variable = contextvars.ContextVar("variable")
+        variable.set("value")
+        assert _map(thread_executor, lambda _: variable.get(), range(2)) == ["value", "value"]
+
+
+class TestGetModifiedPageFigures:
+    @pytest.fixture
+    def managers_one_page_with_filter(self, gapminder):
+        data_manager["gapminder"] = gapminder
+        data_manager["gapminder_dynamic"] = lambda: gapminder
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp")),
+                vm.Graph(id="box_chart", figure=px.box("gapminder_dynamic", x="continent", y="lifeExp")),
+                vm.AgGrid(id="ag_grid", figure=dash_ag_grid("gapminder")),
+            ],
+            controls=[vm.Filter(column="continent", selector=vm.Checklist(id="continent_filter"))],
+        )
+        Vizro._pre_build()
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter")
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_executor(self, executor):
+        ctds_filter = [
+            CallbackTriggerDict(
+                id="continent_filter", property="value", value=["Europe"], str_id="continent_filter", triggered=False
+            )
+        ]
+        targets = ["scatter_chart", "box_chart", "ag_grid"]
+        Vizro(executor=None)
+        expected_outputs = _get_modified_page_figures(
+            ctds_filter=ctds_filter, ctds_filter_interaction=[], ctds_parameters=[], targets=targets
+        )
+
+        Vizro(executor=executor)
+        outputs = _get_modified_page_figures(
+            ctds_filter=ctds_filter, ctds_filter_interaction=[], ctds_parameters=[], targets=targets
+        )
+
+        assert list(outputs) == targets
+        assert outputs["scatter_chart"] == expected_outputs["scatter_chart"]
+        assert outputs["box_chart"] == expected_outputs["box_chart"]
+        assert outputs["ag_grid"].to_plotly_json() == expected_outputs["ag_grid"].to_plotly_json()
+
+    @pytest.fixture
+    def managers_one_page_with_kpi_cards(self, gapminder):
+        data_manager["gapminder"] = gapminder
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[
+                vm.Figure(id="kpi_sum", figure=kpi_card("gapminder", value_column="pop")),
+                vm.Figure(id="kpi_sum_titled", figure=kpi_card("gapminder", value_column="pop", title="Population")),
+                vm.Figure(id="kpi_mean", figure=kpi_card("gapminder", value_column="lifeExp", agg_func="mean")),
+                vm.Figure(
+                    id="kpi_reference",
+                    figure=kpi_card_reference("gapminder", value_column="lifeExp", reference_column="gdpPercap"),
+                ),
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp")),
+            ],
+            controls=[vm.Filter(column="continent", selector=vm.Checklist(id="continent_filter"))],
+        )
+        Vizro._pre_build()
+
+    @pytest.mark.usefixtures("managers_one_page_with_kpi_cards")
+    def test_kpi_card_aggregations_shared(self, gapminder, mocker):
+        ctds_filter = [
+            CallbackTriggerDict(
+                id="continent_filter", property="value", value=["Europe"], str_id="continent_filter", triggered=False
+            )
+        ]
+        kpi_card_targets = ["kpi_sum", "kpi_sum_titled", "kpi_mean", "kpi_reference"]
+        batch_aggregate_spy = mocker.spy(actions_utils, "_aggregate")
+        card_aggregate_spy = mocker.spy(kpi_cards, "_aggregate")
+
+        outputs = _get_modified_page_figures(
+            ctds_filter=ctds_filter,
+            ctds_filter_interaction=[],
+            ctds_parameters=[],
+            targets=[*kpi_card_targets, "scatter_chart"],
+        )
+
+        # The two cards that sum pop share an aggregation, and the cards don't need to aggregate anything themselves.
+        assert batch_aggregate_spy.call_count == 3
+        assert card_aggregate_spy.call_count == 0
+        europe = gapminder[gapminder["continent"] == "Europe"]
+        for target in kpi_card_targets:
+            expected_output = model_manager[target].figure(data_frame=europe)
+            assert to_json_plotly(outputs[target]) == to_json_plotly(expected_output)
+        assert card_aggregate_spy.call_count == len(kpi_card_targets)
+
+    @pytest.mark.usefixtures("managers_one_page_with_kpi_cards")
+    def test_kpi_card_aggregations_with_process_executor(self):
+        targets = ["kpi_sum", "kpi_reference"]
+        expected_outputs = _get_modified_page_figures(
+            ctds_filter=[], ctds_filter_interaction=[], ctds_parameters=[], targets=targets
+        )
+
+        Vizro(executor="process")
+        outputs = _get_modified_page_figures(
+            ctds_filter=[], ctds_filter_interaction=[], ctds_parameters=[], targets=targets
+        )
+
+        for target in targets:
+            assert to_json_plotly(outputs[target]) == to_json_plotly(expected_outputs[target])
+
+
+class TestTargetSignatures:
+    @pytest.fixture
+    def managers_one_page_with_filter_and_parameter(self, gapminder):
+        data_manager["gapminder"] = gapminder
+        data_manager["gapminder_dynamic"] = lambda: gapminder
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp")),
+                vm.Graph(id="box_chart", figure=px.box("gapminder_dynamic", x="continent", y="lifeExp")),
+                vm.AgGrid(id="ag_grid", figure=dash_ag_grid("gapminder")),
+            ],
+            controls=[
+                vm.Filter(column="continent", selector=vm.Checklist(id="continent_filter")),
+                vm.Parameter(
+                    targets=["scatter_chart.x"], selector=vm.RadioItems(id="x_parameter", options=["gdpPercap", "pop"])
+                ),
+            ],
+        )
+        Vizro._pre_build()
+
+    @staticmethod
+    def get_modified_page_figures(continent, x, target_signatures):
+        return _get_modified_page_figures(
+            ctds_filter=[
+                CallbackTriggerDict(
+                    id="continent_filter", property="value", value=continent, str_id="continent_filter", triggered=False
+                )
+            ],
+            ctds_filter_interaction=[],
+            ctds_parameters=[
+                CallbackTriggerDict(id="x_parameter", property="value", value=x, str_id="x_parameter", triggered=False)
+            ],
+            targets=["scatter_chart", "box_chart", "ag_grid"],
+            ctd_target_signatures=CallbackTriggerDict(
+                id="target_signatures_test_page",
+                property="data",
+                value=target_signatures,
+                str_id="target_signatures_test_page",
+                triggered=False,
+            ),
+        )
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter_and_parameter")
+    def test_unchanged_targets_not_updated(self, mocker):
+        render_target = mocker.spy(actions_utils, "_render_target")
+        outputs = self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=None)
+
+        assert list(outputs) == ["scatter_chart", "box_chart", "ag_grid", "target_signatures_test_page"]
+        assert render_target.call_count == 3
+        # Dynamic data has no version without a cache, so box_chart has no signature and is always updated.
+        target_signatures = outputs["target_signatures_test_page"]
+        assert set(target_signatures) == {"scatter_chart", "ag_grid"}
+
+        render_target.reset_mock()
+        outputs = self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=target_signatures)
+
+        assert outputs["scatter_chart"] is dash.no_update
+        assert outputs["ag_grid"] is dash.no_update
+        assert [call.args[0] for call in render_target.call_args_list] == ["box_chart"]
+        assert outputs["target_signatures_test_page"] == target_signatures
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter_and_parameter")
+    def test_parametrized_config_built_once(self, mocker):
+        get_parametrized_config_spy = mocker.spy(actions_utils, "_get_parametrized_config")
+        self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=None)
+
+        assert [call.kwargs["target"] for call in get_parametrized_config_spy.call_args_list] == [
+            "scatter_chart",
+            "box_chart",
+            "ag_grid",
+        ]
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter_and_parameter")
+    def test_parameter_changed(self, mocker):
+        target_signatures = self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=None)[
+            "target_signatures_test_page"
+        ]
+        render_target = mocker.spy(actions_utils, "_render_target")
+        outputs = self.get_modified_page_figures(["Europe"], "pop", target_signatures=target_signatures)
+
+        assert outputs["ag_grid"] is dash.no_update
+        assert [call.args[0] for call in render_target.call_args_list] == ["scatter_chart", "box_chart"]
+        assert outputs["target_signatures_test_page"]["scatter_chart"] != target_signatures["scatter_chart"]
+        assert outputs["target_signatures_test_page"]["ag_grid"] == target_signatures["ag_grid"]
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter_and_parameter")
+    def test_filter_changed(self, mocker):
+        target_signatures = self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=None)[
+            "target_signatures_test_page"
+        ]
+        render_target = mocker.spy(actions_utils, "_render_target")
+        self.get_modified_page_figures(["Europe", "Asia"], "gdpPercap", target_signatures=target_signatures)
+        assert render_target.call_count == 3
+
+        # The order in which options are selected does not matter.
+        render_target.reset_mock()
+        target_signatures = self.get_modified_page_figures(["Europe", "Asia"], "gdpPercap", target_signatures=None)[
+            "target_signatures_test_page"
+        ]
+        self.get_modified_page_figures(["Asia", "Europe"], "gdpPercap", target_signatures=target_signatures)
+        assert [call.args[0] for call in render_target.call_args_list][3:] == ["box_chart"]
+
+    @pytest.mark.usefixtures("managers_one_page_with_filter_and_parameter")
+    def test_dynamic_data_with_cache(self, mocker):
+        data_manager.cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+        Vizro()
+        target_signatures = self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=None)[
+            "target_signatures_test_page"
+        ]
+        assert "box_chart" in target_signatures
+
+        render_target = mocker.spy(actions_utils, "_render_target")
+        self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=target_signatures)
+        assert render_target.call_count == 0
+
+        # When the data is reloaded it has a new version and so box_chart is updated.
+        data_manager.cache.clear()
+        self.get_modified_page_figures(["Europe"], "gdpPercap", target_signatures=target_signatures)
+        assert [call.args[0] for call in render_target.call_args_list] == ["box_chart"]
+
+
+class TestEstimateFilterSelectivity:
+    @pytest.mark.parametrize(
+        "selector, value, expected",
+        [
+            (vm.Checklist(options=["A", "B", "C", "D"]), ["A"], 0.25),
+            (vm.Dropdown(options=["A", "B"]), ["A", "B"], 1.0),
+            (vm.RangeSlider(min=0, max=100), [10, 30], 0.2),
+            (vm.DatePicker(min="2024-01-01", max="2024-01-11"), ["2024-01-02", "2024-01-03"], 0.1),
+            (vm.Slider(min=0, max=100), [10], 1.0),
+            (vm.RangeSlider(), [10, 30], 1.0),
+        ],
+    )
+    def test_estimate_filter_selectivity(self, selector, value, expected):
+        assert _estimate_filter_selectivity(selector, value) == pytest.approx(expected)
+
+
+class TestApplyFilters:
+    @pytest.fixture
+    def managers_one_page_with_filters(self, gapminder):
+        data_manager["gapminder"] = gapminder
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="gdpPercap", y="lifeExp"))],
+            controls=[
+                vm.Filter(column="continent", selector=vm.Checklist(id="continent_filter")),
+                vm.Filter(column="pop", selector=vm.RangeSlider(id="pop_filter")),
+                vm.Filter(column="year", selector=vm.DatePicker(id="year_filter")),
+            ],
+        )
+        Vizro._pre_build()
+
+    @pytest.mark.usefixtures("managers_one_page_with_filters")
+    @pytest.mark.parametrize(
+        "continent, pop, year",
+        [
+            (["Europe"], [0, 1e7], ["1952-01-01", "2007-01-01"]),
+            (["Europe", "Asia", "Africa"], [1e6, 1e10], ["1990-01-01", "2000-01-01"]),
+            (["Oceania"], [1e9, 1e10], ["1952-01-01", "2007-01-01"]),
+            (["ALL"], [0, 1e10], ["1952-01-01", "2007-01-01"]),
+        ],
+    )
+    @pytest.mark.parametrize("indexed_columns", [None, [], ["continent"], ["continent", "pop", "year"]])
+    def test_apply_filters(self, gapminder, continent, pop, year, indexed_columns):
+        column_indexes = _ColumnIndexes(indexed_columns) if indexed_columns is not None else None
+        ctds_filter = [
+            CallbackTriggerDict(id=selector_id, property="value", value=value, str_id=selector_id, triggered=False)
+            for selector_id, value in [("continent_filter", continent), ("pop_filter", pop), ("year_filter", year)]
+        ]
+
+        result = _apply_filters(
+            data_frame=gapminder, ctds_filters=ctds_filter, target="scatter_chart", column_indexes=column_indexes
+        )
+
+        expected = gapminder[gapminder["pop"].between(*pop) & gapminder["year"].between(*year)]
+        if continent != ["ALL"]:
+            expected = expected[expected["continent"].isin(continent)]
+        assert_frame_equal(result, expected)
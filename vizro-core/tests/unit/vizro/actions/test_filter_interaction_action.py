@@ -4,9 +4,12 @@ from dash._callback_context import context_value
 from dash._utils import AttributeDict
 
 import vizro.models as vm
+import vizro.plotly.express as vpx
+from vizro import Vizro
 from vizro.actions import filter_interaction
 from vizro.actions._actions_utils import CallbackTriggerDict
 from vizro.managers import model_manager
+from vizro.models._typed_arrays import _encode_callback_outputs
 
 
 @pytest.fixture
@@ -316,3 +319,61 @@ class TestFilterInteraction:
     # TODO: Eliminate above xfails
     # TODO: Complement tests above with backend tests (currently the targets are also taken from model_manager!
     # see _get_action_callback_mapping eg.)
+
+
+@pytest.fixture
+def managers_one_page_two_graphs_numeric_custom_data():
+    gapminder = px.data.gapminder()
+    vm.Page(
+        id="test_page",
+        title="My first dashboard",
+        components=[
+            vm.Graph(
+                id="source_chart",
+                figure=vpx.scatter(gapminder, x="gdpPercap", y="lifeExp", custom_data=["year"]),
+                actions=[vm.Action(id="test_action", function=filter_interaction(targets=["target_chart"]))],
+            ),
+            vm.Graph(id="target_chart", figure=vpx.scatter(gapminder, x="gdpPercap", y="lifeExp")),
+        ],
+    )
+    Vizro._pre_build()
+
+
+@pytest.mark.usefixtures("managers_one_page_two_graphs_numeric_custom_data")
+class TestFilterInteractionTypedArrays:
+    def test_numeric_custom_data(self):
+        # dcc.Graph builds clickData from the figure as it is sent to the browser, with its trace data encoded.
+        [trace] = _encode_callback_outputs({"source_chart": model_manager["source_chart"]()})["source_chart"]["data"]
+        click_data = {"points": [{"customdata": trace["customdata"][0].tolist()}]}
+        mock_ctx = {
+            "args_grouping": {
+                "external": {
+                    "filters": [],
+                    "filter_interaction": [
+                        {
+                            "clickData": CallbackTriggerDict(
+                                id="source_chart",
+                                property="clickData",
+                                value=click_data,
+                                str_id="source_chart",
+                                triggered=False,
+                            ),
+                            "modelID": CallbackTriggerDict(
+                                id="source_chart",
+                                property="id",
+                                value="source_chart",
+                                str_id="source_chart",
+                                triggered=False,
+                            ),
+                        }
+                    ],
+                    "parameters": [],
+                }
+            }
+        }
+        context_value.set(AttributeDict(**mock_ctx))
+
+        result = model_manager["test_action"].function()
+
+        assert click_data == {"points": [{"customdata": [1952]}]}
+        assert len(result["target_chart"].data[0]["x"]) == (px.data.gapminder()["year"] == 1952).sum()
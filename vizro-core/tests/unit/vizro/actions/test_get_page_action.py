@@ -0,0 +1,165 @@
+import pandas as pd
+import pytest
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+import vizro.models as vm
+import vizro.plotly.express as px
+from vizro import Vizro
+from vizro._constants import GET_PAGE_ACTION_PREFIX
+from vizro.actions import filter_interaction
+from vizro.actions._actions_utils import CallbackTriggerDict
+from vizro.managers import data_manager, model_manager
+from vizro.tables import dash_data_table
+
+
+@pytest.fixture
+def orders():
+    return pd.DataFrame(
+        {
+            "order": range(1000),
+            "region": ["north", "south"] * 500,
+            "date": pd.date_range("2024-01-01", periods=1000, freq="h"),
+        }
+    )
+
+
+@pytest.fixture
+def managers_one_page_one_server_side_table_one_graph(orders):
+    data_manager["orders"] = orders
+    vm.Page(
+        id="test_page",
+        title="My first dashboard",
+        components=[
+            vm.Table(
+                id="table",
+                figure=dash_data_table("orders", page_size=100, sort_action="native", filter_action="native"),
+                server_side=True,
+                actions=[vm.Action(id="filter_interaction_action", function=filter_interaction(targets=["graph"]))],
+            ),
+            vm.Graph(id="graph", figure=px.scatter("orders", x="date", y="order")),
+        ],
+        controls=[vm.Filter(column="region", selector=vm.Dropdown(id="region_filter"))],
+    )
+    Vizro._pre_build()
+
+
+@pytest.fixture
+def ctx_get_page(request):
+    """Mock dash.ctx that represents a table requesting a page while a region is selected."""
+    region, page_current, sort_by, filter_query = request.param
+    page_request = {"page_current": page_current, "page_size": 100, "sort_by": sort_by, "filter_query": filter_query}
+    mock_ctx = {
+        "args_grouping": {
+            "external": {
+                "filter_interaction": [],
+                "filters": [
+                    CallbackTriggerDict(
+                        id="region_filter", property="value", value=region, str_id="region_filter", triggered=False
+                    )
+                ],
+                "parameters": [],
+                **{
+                    argument: CallbackTriggerDict(
+                        id="__input_table", property=argument, value=value, str_id="__input_table", triggered=False
+                    )
+                    for argument, value in page_request.items()
+                },
+            }
+        }
+    }
+    context_value.set(AttributeDict(**mock_ctx))
+    return context_value
+
+
+@pytest.fixture
+def ctx_filter_interaction(request):
+    """Mock dash.ctx that represents a click on a cell of the current page of a table that is paged on the server."""
+    page_data, row = request.param
+    mock_ctx = {
+        "args_grouping": {
+            "external": {
+                "filters": [],
+                "filter_interaction": [
+                    {
+                        "active_cell": CallbackTriggerDict(
+                            id="__input_table",
+                            property="active_cell",
+                            value={"row": row, "column": 0, "column_id": "order"},
+                            str_id="__input_table",
+                            triggered=False,
+                        ),
+                        "derived_viewport_data": CallbackTriggerDict(
+                            id="__input_table",
+                            property="derived_viewport_data",
+                            value=page_data,
+                            str_id="__input_table",
+                            triggered=False,
+                        ),
+                        "modelID": CallbackTriggerDict(
+                            id="table", property="id", value="table", str_id="table", triggered=False
+                        ),
+                    }
+                ],
+                "parameters": [],
+            }
+        }
+    }
+    context_value.set(AttributeDict(**mock_ctx))
+    return context_value
+
+
+@pytest.mark.usefixtures("managers_one_page_one_server_side_table_one_graph")
+class TestGetPage:
+    @pytest.mark.parametrize("ctx_get_page", [(["south"], 2, [], "")], indirect=True)
+    def test_page(self, ctx_get_page):
+        result = model_manager[f"{GET_PAGE_ACTION_PREFIX}_action_page_current_table"].function()
+
+        page = result["table"]
+        assert page["page_count"] == 5
+        assert [row["order"] for row in page["data"]] == list(range(401, 601, 2))
+        assert page["data"][0] == {"order": 401, "region": "south", "date": pd.Timestamp("2024-01-17 17:00")}
+
+    @pytest.mark.parametrize(
+        "ctx_get_page",
+        [(["north", "south"], 0, [{"column_id": "order", "direction": "desc"}], "{order} < 10")],
+        indirect=True,
+    )
+    def test_sort_by_and_filter_query(self, ctx_get_page):
+        result = model_manager[f"{GET_PAGE_ACTION_PREFIX}_action_sort_by_table"].function()
+
+        page = result["table"]
+        assert page["page_count"] == 1
+        assert [row["order"] for row in page["data"]] == [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+
+    @pytest.mark.parametrize(
+        "ctx_filter_interaction",
+        [([{"order": 300, "region": "north"}, {"order": 301, "region": "south"}], 1)],
+        indirect=True,
+    )
+    def test_filter_interaction_with_current_page(self, ctx_filter_interaction):
+        # active_cell refers to a row of derived_viewport_data, which is just the current page of the table.
+        result = model_manager["filter_interaction_action"].function()
+        assert result["graph"].data[0]["y"].tolist() == [301]
+
+
+class TestGetPageActionsChains:
+    def test_added_with_server_side(self, orders):
+        table = vm.Table(id="table", figure=dash_data_table(orders), server_side=True)
+        table.pre_build()
+
+        assert [actions_chain.trigger.component_property for actions_chain in table.actions] == [
+            "page_current",
+            "sort_by",
+            "filter_query",
+        ]
+        assert [actions_chain.actions[0].id for actions_chain in table.actions] == [
+            f"{GET_PAGE_ACTION_PREFIX}_action_page_current_table",
+            f"{GET_PAGE_ACTION_PREFIX}_action_sort_by_table",
+            f"{GET_PAGE_ACTION_PREFIX}_action_filter_query_table",
+        ]
+
+    def test_not_added_without_server_side(self, orders):
+        table = vm.Table(figure=dash_data_table(orders))
+        table.pre_build()
+        assert table.actions == []
@@ -0,0 +1,121 @@
+import pandas as pd
+import pytest
+from dash import no_update
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+import vizro.models as vm
+from vizro import Vizro
+from vizro._constants import GET_ROWS_ACTION_PREFIX
+from vizro.actions._actions_utils import CallbackTriggerDict
+from vizro.managers import data_manager, model_manager
+from vizro.tables import dash_ag_grid
+
+
+@pytest.fixture
+def orders():
+    return pd.DataFrame(
+        {
+            "order": range(1000),
+            "region": ["north", "south"] * 500,
+            "date": pd.date_range("2024-01-01", periods=1000, freq="h"),
+        }
+    )
+
+
+@pytest.fixture
+def managers_one_page_one_infinite_ag_grid(orders):
+    data_manager["orders"] = orders
+    vm.Page(
+        id="test_page",
+        title="My first dashboard",
+        components=[vm.AgGrid(id="ag_grid", figure=dash_ag_grid("orders"), infinite_scroll=True)],
+        controls=[vm.Filter(column="region", selector=vm.Dropdown(id="region_filter"))],
+    )
+    Vizro._pre_build()
+
+
+@pytest.fixture
+def ctx_get_rows(request):
+    """Mock dash.ctx that represents an AG Grid requesting a block of rows while a region is selected."""
+    region, get_rows_request = request.param
+    mock_ctx = {
+        "args_grouping": {
+            "external": {
+                "filter_interaction": [],
+                "filters": [
+                    CallbackTriggerDict(
+                        id="region_filter", property="value", value=region, str_id="region_filter", triggered=False
+                    )
+                ],
+                "parameters": [],
+                "get_rows_request": CallbackTriggerDict(
+                    id="__input_ag_grid",
+                    property="getRowsRequest",
+                    value=get_rows_request,
+                    str_id="__input_ag_grid",
+                    triggered=False,
+                ),
+            }
+        }
+    }
+    context_value.set(AttributeDict(**mock_ctx))
+    return context_value
+
+
+@pytest.mark.usefixtures("managers_one_page_one_infinite_ag_grid")
+class TestGetRows:
+    @pytest.mark.parametrize(
+        "ctx_get_rows",
+        [(["south"], {"startRow": 100, "endRow": 200, "sortModel": [], "filterModel": {}})],
+        indirect=True,
+    )
+    def test_block(self, ctx_get_rows):
+        result = model_manager[f"{GET_ROWS_ACTION_PREFIX}_action_ag_grid"].function()
+
+        response = result["ag_grid"]
+        assert response["rowCount"] == 500
+        assert [row["order"] for row in response["rowData"]] == list(range(201, 401, 2))
+        assert response["rowData"][0] == {"order": 201, "region": "south", "date": "2024-01-09"}
+
+    @pytest.mark.parametrize(
+        "ctx_get_rows",
+        [
+            (
+                ["north", "south"],
+                {
+                    "startRow": 0,
+                    "endRow": 3,
+                    "sortModel": [{"colId": "order", "sort": "desc"}],
+                    "filterModel": {"order": {"filterType": "number", "type": "lessThan", "filter": 10}},
+                },
+            )
+        ],
+        indirect=True,
+    )
+    def test_sort_and_filter_model(self, ctx_get_rows):
+        result = model_manager[f"{GET_ROWS_ACTION_PREFIX}_action_ag_grid"].function()
+
+        response = result["ag_grid"]
+        assert response["rowCount"] == 10
+        assert [row["order"] for row in response["rowData"]] == [9, 8, 7]
+
+    @pytest.mark.parametrize("ctx_get_rows", [(["north"], None)], indirect=True)
+    def test_no_request(self, ctx_get_rows):
+        result = model_manager[f"{GET_ROWS_ACTION_PREFIX}_action_ag_grid"].function()
+        assert result == {"ag_grid": no_update}
+
+
+class TestGetRowsActionsChain:
+    def test_added_with_infinite_scroll(self, orders):
+        ag_grid = vm.AgGrid(id="ag_grid", figure=dash_ag_grid(orders), infinite_scroll=True)
+        ag_grid.pre_build()
+
+        [actions_chain] = ag_grid.actions
+        assert actions_chain.trigger.component_property == "getRowsRequest"
+        assert actions_chain.actions[0].id == f"{GET_ROWS_ACTION_PREFIX}_action_ag_grid"
+
+    def test_not_added_without_infinite_scroll(self, orders):
+        ag_grid = vm.AgGrid(figure=dash_ag_grid(orders))
+        ag_grid.pre_build()
+        assert ag_grid.actions == []
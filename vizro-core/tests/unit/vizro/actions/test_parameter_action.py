@@ -1,4 +1,5 @@
 import pytest
+from dash import Patch
 from dash._callback_context import context_value
 from dash._utils import AttributeDict
 
@@ -142,6 +143,56 @@ def ctx_parameter_hover_data(request):
     return context_value
 
 
+@pytest.fixture
+def ctx_parameter_title(request):
+    """Mock dash.ctx that represents title Parameter value selection."""
+    title = request.param
+    mock_ctx = {
+        "args_grouping": {
+            "external": {
+                "filter_interaction": [],
+                "filters": [],
+                "parameters": [
+                    CallbackTriggerDict(
+                        id="title_parameter",
+                        property="value",
+                        value=title,
+                        str_id="title_parameter",
+                        triggered=False,
+                    )
+                ],
+            }
+        }
+    }
+    context_value.set(AttributeDict(**mock_ctx))
+    return context_value
+
+
+@pytest.fixture
+def ctx_parameter_template(request):
+    """Mock dash.ctx that represents template Parameter value selection."""
+    template = request.param
+    mock_ctx = {
+        "args_grouping": {
+            "external": {
+                "filter_interaction": [],
+                "filters": [],
+                "parameters": [
+                    CallbackTriggerDict(
+                        id="template_parameter",
+                        property="value",
+                        value=template,
+                        str_id="template_parameter",
+                        triggered=False,
+                    )
+                ],
+            }
+        }
+    }
+    context_value.set(AttributeDict(**mock_ctx))
+    return context_value
+
+
 @pytest.fixture
 def ctx_parameter_y_and_x(request):
     """Mock dash.ctx that represents y-axis Parameter value selection."""
@@ -538,3 +589,44 @@ class TestParameter:
         expected = {"scatter_matrix_chart": target_scatter_matrix_parameter_dimensions}
 
         assert result == expected
+
+    @pytest.mark.usefixtures("managers_one_page_two_graphs_one_button")
+    @pytest.mark.parametrize("ctx_parameter_title", ["pop"], indirect=True)
+    def test_layout_only_parameter_returns_patch(self, ctx_parameter_title, gapminder_2007, box_params):
+        # The same value is used as the title of one chart and the y-axis column of the other.
+        title_parameter = vm.Parameter(
+            id="test_parameter",
+            targets=["scatter_chart.title", "box_chart.y"],
+            selector=vm.RadioItems(id="title_parameter", options=["lifeExp", "pop"], value="lifeExp"),
+        )
+        model_manager["test_page"].controls = [title_parameter]
+        title_parameter.pre_build()
+
+        result = model_manager[f"{PARAMETER_ACTION_PREFIX}_test_parameter"].function()
+
+        # Only the layout of scatter_chart is sent, but box_chart has new trace data so is sent in full.
+        assert isinstance(result["scatter_chart"], Patch)
+        [operation] = result["scatter_chart"].to_plotly_json()["operations"]
+        assert operation["location"] == ["layout", "title"]
+        assert operation["params"]["value"]["text"] == "pop"
+        box_params["y"] = "pop"
+        assert result["box_chart"] == px.box(gapminder_2007, **box_params)
+
+    @pytest.mark.usefixtures("managers_one_page_two_graphs_one_button")
+    @pytest.mark.parametrize("ctx_parameter_template", ["ggplot2"], indirect=True)
+    def test_template_parameter_returns_figure(self, ctx_parameter_template, gapminder_2007, scatter_params):
+        # Plotly Express sets the colors of traces from the template, so changing it changes the trace data too.
+        template_parameter = vm.Parameter(
+            id="test_parameter",
+            targets=["scatter_chart.template"],
+            selector=vm.RadioItems(id="template_parameter", options=["plotly", "ggplot2"], value="plotly"),
+        )
+        model_manager["test_page"].controls = [template_parameter]
+        template_parameter.pre_build()
+
+        result = model_manager[f"{PARAMETER_ACTION_PREFIX}_test_parameter"].function()
+
+        assert not isinstance(result["scatter_chart"], Patch)
+        expected = px.scatter(gapminder_2007, **scatter_params, template="ggplot2")
+        assert result["scatter_chart"].data == expected.data
+        assert result["scatter_chart"].data[0].marker.color == expected.data[0].marker.color == "#F8766D"
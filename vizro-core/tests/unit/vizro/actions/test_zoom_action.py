@@ -0,0 +1,202 @@
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import pytest
+from dash import Patch, no_update
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+import vizro.models as vm
+import vizro.plotly.express as px
+from vizro import Vizro
+from vizro._constants import PARAMETER_ACTION_PREFIX, ZOOM_ACTION_PREFIX
+from vizro.actions._actions_utils import CallbackTriggerDict
+from vizro.managers import data_manager, model_manager
+
+
+@pytest.fixture
+def time_series():
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=10_000, freq="min"),
+            "value": np.sin(np.linspace(0, 100, 10_000)),
+        }
+    )
+
+
+@pytest.fixture
+def managers_one_page_one_downsampled_graph(time_series):
+    data_manager["time_series"] = time_series
+    vm.Page(
+        id="test_page",
+        title="My first dashboard",
+        components=[vm.Graph(id="line_chart", figure=px.line("time_series", x="time", y="value"), max_points=100)],
+    )
+    Vizro._pre_build()
+
+
+@pytest.fixture
+def ctx_zoom(request):
+    """Mock dash.ctx that represents zooming into a graph."""
+    relayout_data = request.param
+    mock_ctx = {
+        "args_grouping": {
+            "external": {
+                "filter_interaction": [],
+                "filters": [],
+                "parameters": [],
+                "relayout_data": CallbackTriggerDict(
+                    id="line_chart",
+                    property="relayoutData",
+                    value=relayout_data,
+                    str_id="line_chart",
+                    triggered=False,
+                ),
+            }
+        }
+    }
+    context_value.set(AttributeDict(**mock_ctx))
+    return context_value
+
+
+def _get_patch_operations(patch):
+    return {
+        tuple(operation["location"]): operation["params"]["value"] for operation in patch.to_plotly_json()["operations"]
+    }
+
+
+@pytest.mark.usefixtures("managers_one_page_one_downsampled_graph")
+class TestZoom:
+    @pytest.fixture(autouse=True)
+    def mock_set_props(self, mocker):
+        # Mock out set_props so we don't need to supply full mock callback context for these tests.
+        return mocker.patch("vizro.models._components.graph.set_props")
+
+    @pytest.mark.parametrize(
+        "ctx_zoom",
+        [
+            {"xaxis.range[0]": "2024-01-02 00:00:00", "xaxis.range[1]": "2024-01-02 01:00:00"},
+            {"xaxis.range": ["2024-01-02 00:00:00", "2024-01-02 01:00:00"]},
+        ],
+        indirect=True,
+    )
+    def test_zoom_in(self, ctx_zoom):
+        result = model_manager[f"{ZOOM_ACTION_PREFIX}_action_line_chart"].function()
+
+        assert isinstance(result["line_chart"], Patch)
+        operations = _get_patch_operations(result["line_chart"])
+        assert operations[("layout", "xaxis", "range")] == ["2024-01-02 00:00:00", "2024-01-02 01:00:00"]
+        assert operations[("layout", "xaxis", "autorange")] is False
+        [trace] = operations[("data",)]
+        # The hour contains 61 points, plus one point either side of it. This is fewer than max_points so the data is
+        # at full resolution.
+        assert len(trace["x"]) == 63
+        assert (trace["x"][0], trace["x"][-1]) == (
+            pd.Timestamp("2024-01-01 23:59:00"),
+            pd.Timestamp("2024-01-02 01:01:00"),
+        )
+        # Numerical trace data is sent as a typed array.
+        assert trace["y"]["dtype"] == "f8"
+
+    @pytest.mark.parametrize("ctx_zoom", [{"xaxis.autorange": True, "yaxis.autorange": True}], indirect=True)
+    def test_zoom_reset(self, ctx_zoom):
+        result = model_manager[f"{ZOOM_ACTION_PREFIX}_action_line_chart"].function()
+
+        operations = _get_patch_operations(result["line_chart"])
+        assert operations[("layout", "xaxis", "autorange")] is True
+        [trace] = operations[("data",)]
+        assert len(trace["x"]) == 100
+
+    @pytest.mark.parametrize(
+        "ctx_zoom", [None, {"autosize": True}, {"yaxis.range[0]": 0, "yaxis.range[1]": 1}], indirect=True
+    )
+    def test_no_x_zoom(self, ctx_zoom):
+        result = model_manager[f"{ZOOM_ACTION_PREFIX}_action_line_chart"].function()
+        assert result == {"line_chart": no_update}
+
+
+def _apply_patch(figure, patch):
+    """Applies the assignments of `patch` to `figure` in the same way as the browser does."""
+    for operation in patch.to_plotly_json()["operations"]:
+        assert operation["operation"] == "Assign"
+        *parents, key = operation["location"]
+        reduce(lambda parent, location: parent.setdefault(location, {}), parents, figure)[key] = operation["params"][
+            "value"
+        ]
+
+
+@pytest.mark.usefixtures("managers_one_page_one_downsampled_graph")
+class TestZoomThenParameter:
+    @pytest.fixture(autouse=True)
+    def mock_set_props(self, mocker):
+        return mocker.patch("vizro.models._components.graph.set_props")
+
+    @pytest.mark.parametrize(
+        "ctx_zoom", [{"xaxis.range": ["2024-01-02 00:00:00", "2024-01-02 01:00:00"]}], indirect=True
+    )
+    def test_layout_only_parameter_keeps_zoom(self, ctx_zoom, time_series):
+        title_parameter = vm.Parameter(
+            id="test_parameter",
+            targets=["line_chart.title"],
+            selector=vm.RadioItems(id="title_parameter", options=["Title", "New title"]),
+        )
+        model_manager["test_page"].controls = [title_parameter]
+        title_parameter.pre_build()
+        figure = model_manager["line_chart"](data_frame=time_series).to_dict()
+
+        _apply_patch(figure, model_manager[f"{ZOOM_ACTION_PREFIX}_action_line_chart"].function()["line_chart"])
+        zoomed_data = figure["data"]
+        # Mock dash.ctx that represents selecting a new title.
+        ctd_parameter = CallbackTriggerDict(
+            id="title_parameter", property="value", value="New title", str_id="title_parameter", triggered=False
+        )
+        context_value.set(
+            AttributeDict(
+                args_grouping={"external": {"filter_interaction": [], "filters": [], "parameters": [ctd_parameter]}}
+            )
+        )
+        _apply_patch(figure, model_manager[f"{PARAMETER_ACTION_PREFIX}_test_parameter"].function()["line_chart"])
+
+        # The title is updated but the graph still shows the zoomed data with its pinned x range.
+        assert figure["layout"]["title"]["text"] == "New title"
+        assert figure["data"] is zoomed_data
+        assert figure["layout"]["xaxis"]["range"] == ["2024-01-02 00:00:00", "2024-01-02 01:00:00"]
+        assert figure["layout"]["xaxis"]["autorange"] is False
+
+
+class TestSelectXRange:
+    def test_numeric(self):
+        data_frame = pd.DataFrame({"x": np.arange(10)})
+        result = vm.Graph._select_x_range(data_frame, {"x": "x"}, [3.5, 6.5])
+        assert list(result["x"]) == [3, 4, 5, 6, 7]
+
+    def test_log_x(self):
+        data_frame = pd.DataFrame({"x": [1, 10, 100, 1000, 10000]})
+        result = vm.Graph._select_x_range(data_frame, {"x": "x", "log_x": True}, [1.5, 2.5])
+        assert list(result["x"]) == [10, 100, 1000]
+
+    def test_timezone(self):
+        data_frame = pd.DataFrame({"x": pd.date_range("2024-01-01", periods=10, freq="h", tz="Europe/London")})
+        result = vm.Graph._select_x_range(data_frame, {"x": "x"}, ["2024-01-01 03:00", "2024-01-01 04:00"])
+        assert len(result) == 4
+
+    @pytest.mark.parametrize("config", [{}, {"x": "missing"}, {"x": "category"}, {"x": ["x", "category"]}])
+    def test_not_selected(self, config):
+        data_frame = pd.DataFrame({"x": np.arange(10), "category": list("abcdefghij")})
+        assert vm.Graph._select_x_range(data_frame, config, [1, 2]) is data_frame
+
+
+class TestZoomActionsChain:
+    def test_added_with_max_points(self, time_series):
+        graph = vm.Graph(id="line_chart", figure=px.line(time_series, x="time", y="value"), max_points=100)
+        graph.pre_build()
+
+        [actions_chain] = graph.actions
+        assert actions_chain.trigger.component_property == "relayoutData"
+        assert actions_chain.actions[0].id == f"{ZOOM_ACTION_PREFIX}_action_line_chart"
+
+    def test_not_added_without_max_points(self, time_series):
+        graph = vm.Graph(figure=px.line(time_series, x="time", y="value"))
+        graph.pre_build()
+        assert graph.actions == []
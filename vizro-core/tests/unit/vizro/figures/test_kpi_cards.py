@@ -5,6 +5,8 @@ from asserts import assert_component_equal
 from dash import html
 
 from vizro.figures import kpi_card, kpi_card_reference
+from vizro.figures._kpi_cards import _get_kpi_card_aggregation, _precomputed_aggregations
+from vizro.tables import dash_ag_grid
 
 df = pd.DataFrame({"Actual": [1, 2, 3], "Reference": [2, 4, 6], "Reference Zero": [0, 0, 0]})
 
@@ -181,3 +183,29 @@ class TestKPICardReference:
                 reference_column="Reference",
                 reference_format="{delta_absolute.2f}}",
             )()
+
+
+class TestKPICardAggregation:
+    @pytest.mark.parametrize(
+        "figure, expected_aggregation",
+        [
+            (kpi_card(data_frame=df, value_column="Actual"), ("sum", ("Actual",))),
+            (kpi_card(df, "Actual", agg_func="mean"), ("mean", ("Actual",))),
+            (
+                kpi_card_reference(data_frame=df, value_column="Actual", reference_column="Reference"),
+                ("sum", ("Actual", "Reference")),
+            ),
+            (dash_ag_grid(data_frame=df), None),
+        ],
+    )
+    def test_get_kpi_card_aggregation(self, figure, expected_aggregation):
+        config = {key: value for key, value in figure._arguments.items() if key != "data_frame"}
+        assert _get_kpi_card_aggregation(figure, config) == expected_aggregation
+
+    def test_precomputed_aggregation_used(self):
+        token = _precomputed_aggregations.set({("sum", ("Actual",)): 100})
+        try:
+            result = kpi_card(data_frame=df, value_column="Actual")()
+        finally:
+            _precomputed_aggregations.reset(token)
+        assert_component_equal(result.children[1], dbc.CardBody("100"))
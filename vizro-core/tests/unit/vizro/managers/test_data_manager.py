@@ -1,5 +1,6 @@
 """Unit tests for vizro.managers.data_manager."""
 
+import threading
 from contextlib import suppress
 from functools import partial
 
@@ -11,8 +12,11 @@ from flask_caching import Cache
 from freezegun import freeze_time
 from pandas.testing import assert_frame_equal
 
+import vizro.managers._data_manager
 from vizro import Vizro
 from vizro.managers import data_manager
+from vizro.managers._data_manager import _ColumnIndexes, _FilteredDataCache, _FilteredDataKey
+from vizro.models._controls.filter import _filter_between, _filter_isin
 
 
 # Fixture that freezes the time so that tests involving time.sleep can run quickly. Instead of time.sleep,
@@ -68,6 +72,55 @@ class TestLoad:
         assert loaded_data is not data()
 
 
+class TestStaticReadOnly:
+    def test_load(self):
+        data = make_fixed_data()
+        data_manager["data"] = data
+        data_manager["data"].read_only = True
+        loaded_data = data_manager["data"].load()
+        assert_frame_equal(loaded_data, data)
+        assert loaded_data is not data
+        # Make sure loaded_data shares memory with the original data rather than being a copy.
+        assert np.shares_memory(loaded_data[0].to_numpy(), data[0].to_numpy())
+
+    def test_inplace_modification_raises(self):
+        data = make_fixed_data()
+        data_manager["data"] = data
+        data_manager["data"].read_only = True
+        loaded_data = data_manager["data"].load()
+        with pytest.raises(ValueError, match="assignment destination is read-only"):
+            loaded_data.loc[0, 0] = 10
+        assert_frame_equal(data_manager["data"].load(), make_fixed_data())
+
+    def test_new_objects_are_writeable(self):
+        data = make_fixed_data()
+        data_manager["data"] = data
+        data_manager["data"].read_only = True
+        loaded_data = data_manager["data"].load()
+        loaded_data["new_column"] = loaded_data[0] * 2
+        filtered_data = loaded_data[loaded_data[0] > 1].copy()
+        filtered_data.loc[1, 0] = 10
+        assert_frame_equal(data_manager["data"].load(), make_fixed_data())
+
+    def test_extension_array_columns_copied(self):
+        data = pd.DataFrame({"x": pd.array([1, 2, 3], dtype="Int64"), "y": pd.Categorical(["a", "b", "a"])})
+        data_manager["data"] = data
+        data_manager["data"].read_only = True
+        loaded_data = data_manager["data"].load()
+        assert_frame_equal(loaded_data, data)
+        loaded_data.loc[0, "x"] = 10
+        assert_frame_equal(data_manager["data"].load(), data)
+
+    def test_no_columns_copied(self):
+        data = pd.DataFrame(np.zeros((100, 10)))
+        data_manager["data"] = data
+        copied_data = data_manager["data"].load()
+        data_manager["data"].read_only = True
+        loaded_data = data_manager["data"].load()
+        assert not any(np.shares_memory(copied_data[column], data[column]) for column in data)
+        assert all(np.shares_memory(loaded_data[column], data[column]) for column in data)
+
+
 class TestInvalid:
     def test_static_data_does_not_support_timeout(self):
         data = make_fixed_data()
@@ -77,6 +130,15 @@ class TestInvalid:
         ):
             data_manager["data"].timeout = 10
 
+    def test_static_data_does_not_support_stale_while_revalidate(self):
+        data = make_fixed_data()
+        data_manager["data"] = data
+        with pytest.raises(
+            AttributeError,
+            match="Static data that is a pandas.DataFrame itself does not support stale_while_revalidate",
+        ):
+            data_manager["data"].stale_while_revalidate = 10
+
     def test_setitem_invalid_type(self):
         with pytest.raises(
             TypeError, match="Data source data must be a pandas DataFrame or function that returns a pandas DataFrame."
@@ -340,6 +402,182 @@ class TestCacheWithArguments:
         assert_frame_equal(loaded_data_x_2, loaded_data_x_3)
 
 
+class TestGetVersion:
+    def test_static_data(self):
+        data_manager["data"] = make_fixed_data()
+        assert data_manager["data"]._get_version() == data_manager["data"]._load_with_version()[1] == 0
+
+    def test_null_cache(self):
+        data_manager["data"] = make_random_data
+        Vizro()
+        data_manager["data"].load()
+        assert data_manager["data"]._get_version() is None
+
+    @pytest.mark.usefixtures("simple_cache")
+    def test_version_without_loading(self, mocker):
+        data_manager["data"] = make_random_data_with_args
+        assert data_manager["data"]._get_version("x") is None
+
+        _, version = data_manager["data"]._load_with_version("x")
+        load_spy = mocker.spy(data_manager["data"], "_load_with_version")
+        assert data_manager["data"]._get_version("x") == version
+        assert data_manager["data"]._get_version(label="x") == version
+        assert data_manager["data"]._get_version("y") is None
+        load_spy.assert_not_called()
+
+    @pytest.mark.usefixtures("simple_cache")
+    def test_version_expires_with_data(self, freezer):
+        data_manager["data"] = make_random_data_with_args
+        data_manager["data"].load("x")
+        freezer.tick(150 + 50)
+        _, version_y = data_manager["data"]._load_with_version("y")
+        freezer.tick(150 + 50)
+
+        assert data_manager["data"]._get_version("x") is None
+        _, version_x = data_manager["data"]._load_with_version("x")
+        assert data_manager["data"]._get_version("x") == version_x
+        # Reloading x invalidates the cache entry for y too (see TestCacheWithArguments.test_timeout_expires_all) and
+        # so also its version.
+        assert data_manager["data"]._get_version("y") is None
+        assert data_manager["data"]._load_with_version("y")[1] != version_y
+
+
+def join_revalidation_threads():
+    for thread in threading.enumerate():
+        if thread.name == "vizro_revalidate":
+            thread.join()
+
+
+@pytest.fixture
+def counted_random_data():
+    # Loading can be blocked by clearing loading_allowed, e.g. to mimic data that takes a long time to load.
+    load_calls = []
+    loading_allowed = threading.Event()
+    loading_allowed.set()
+
+    def load_data():
+        loading_allowed.wait()
+        load_calls.append(1)
+        return make_random_data()
+
+    return load_data, load_calls, loading_allowed
+
+
+@pytest.mark.usefixtures("simple_cache")
+class TestStaleWhileRevalidate:
+    def test_stale_data_served_while_reloading(self, counted_random_data, freezer):
+        load_data, load_calls, _ = counted_random_data
+        data_manager["data"] = load_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].stale_while_revalidate = 200
+
+        loaded_data_1 = data_manager["data"].load()
+        freezer.tick(100 + 50)
+        loaded_data_2 = data_manager["data"].load()
+        join_revalidation_threads()
+        loaded_data_3 = data_manager["data"].load()
+        loaded_data_4 = data_manager["data"].load()
+
+        # Expired data is served once while it's reloaded in the background, after which the reloaded data is served.
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+        assert_frame_not_equal(loaded_data_2, loaded_data_3)
+        assert_frame_equal(loaded_data_3, loaded_data_4)
+        assert len(load_calls) == 2
+
+    def test_default_timeout(self, counted_random_data, freezer):
+        load_data, load_calls, _ = counted_random_data
+        data_manager["data"] = load_data
+        data_manager["data"].stale_while_revalidate = 200
+
+        loaded_data_1 = data_manager["data"].load()
+        # Default timeout is 300, so wait for longer than that.
+        freezer.tick(300 + 50)
+        loaded_data_2 = data_manager["data"].load()
+        join_revalidation_threads()
+        loaded_data_3 = data_manager["data"].load()
+
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+        assert_frame_not_equal(loaded_data_2, loaded_data_3)
+        assert len(load_calls) == 2
+
+    def test_reloaded_once(self, counted_random_data, freezer):
+        load_data, load_calls, loading_allowed = counted_random_data
+        data_manager["data"] = load_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].stale_while_revalidate = 200
+
+        loaded_data_1 = data_manager["data"].load()
+        freezer.tick(100 + 50)
+        loading_allowed.clear()
+        loaded_data_2 = data_manager["data"].load()
+        loaded_data_3 = data_manager["data"].load()
+        loading_allowed.set()
+        join_revalidation_threads()
+
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+        assert_frame_equal(loaded_data_1, loaded_data_3)
+        assert len(load_calls) == 2
+
+    def test_reloaded_synchronously_after_stale_period(self, counted_random_data, freezer):
+        load_data, load_calls, _ = counted_random_data
+        data_manager["data"] = load_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].stale_while_revalidate = 200
+
+        loaded_data_1 = data_manager["data"].load()
+        freezer.tick(100 + 200 + 50)
+        loaded_data_2 = data_manager["data"].load()
+        join_revalidation_threads()
+        loaded_data_3 = data_manager["data"].load()
+
+        assert_frame_not_equal(loaded_data_1, loaded_data_2)
+        assert_frame_equal(loaded_data_2, loaded_data_3)
+        assert len(load_calls) == 2
+
+    def test_reload_fails(self, freezer, caplog):
+        loaded_once = threading.Event()
+
+        def load_data():
+            if loaded_once.is_set():
+                raise ValueError("Loading failed")
+            loaded_once.set()
+            return make_fixed_data()
+
+        data_manager["data"] = load_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].stale_while_revalidate = 200
+
+        data_manager["data"].load()
+        freezer.tick(100 + 50)
+        loaded_data_1 = data_manager["data"].load()
+        join_revalidation_threads()
+        # Reloading is tried again next time the data is loaded.
+        loaded_data_2 = data_manager["data"].load()
+        join_revalidation_threads()
+
+        assert_frame_equal(loaded_data_1, make_fixed_data())
+        assert_frame_equal(loaded_data_2, make_fixed_data())
+        assert caplog.text.count("Reloading stale data failed") == 2
+
+    def test_get_version_revalidates(self, counted_random_data, freezer):
+        load_data, load_calls, _ = counted_random_data
+        data_manager["data"] = load_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].stale_while_revalidate = 200
+
+        _, version_1 = data_manager["data"]._load_with_version()
+        freezer.tick(100 + 50)
+        # Stale data is reloaded even if just its version is looked up, e.g. because data filtered from it is cached.
+        version_2 = data_manager["data"]._get_version()
+        join_revalidation_threads()
+        version_3 = data_manager["data"]._get_version()
+
+        assert version_1 == version_2
+        assert version_3 not in {None, version_2}
+        assert data_manager["data"]._load_with_version()[1] == version_3
+        assert len(load_calls) == 2
+
+
 class TestCacheIndependence:
     # Test both data callable with and without args in one test. The ones which don't take args are just passed an
     # empty dictionary so it's like doing data_manager["data_x"].load() with no arguments.
@@ -450,3 +688,280 @@ class TestCacheIndependence:
         # Cache has expired for data_y but not data_x.
         assert_frame_equal(loaded_data_x_1, loaded_data_x_2)
         assert_frame_not_equal(loaded_data_y_1, loaded_data_y_2)
+
+
+class TestColumnStatistics:
+    def test_statistics(self):
+        data_manager["data"] = pd.DataFrame(
+            {
+                "number": [3.0, 1.0, None, 2.0],
+                "date": pd.to_datetime(["2024-01-02", "2024-01-01", "2024-01-03", "2024-01-03"]),
+                "category": ["a", "b", "a", None],
+                "mixed": [1, "a", 2, "b"],
+            }
+        )
+        statistics = data_manager._get_column_statistics("data")
+
+        assert list(statistics) == ["number", "date", "category", "mixed"]
+        assert statistics["number"].dtype == np.dtype("float64")
+        assert (statistics["number"].min, statistics["number"].max) == (1.0, 3.0)
+        assert statistics["number"].null_count == 1
+        assert statistics["date"].min == pd.Timestamp("2024-01-01")
+        assert statistics["date"].max == pd.Timestamp("2024-01-03")
+        assert statistics["date"].distinct_values == pd.to_datetime(["2024-01-02", "2024-01-01", "2024-01-03"]).tolist()
+        assert statistics["category"].distinct_values == ["a", "b", None]
+        assert (statistics["mixed"].min, statistics["mixed"].max) == (None, None)
+
+    def test_distinct_values_cap(self, mocker):
+        mocker.patch("vizro.managers._data_manager.DISTINCT_VALUES_CAP", 2)
+        data_manager["data"] = pd.DataFrame({"low": [1, 1, 2], "high": [1, 2, 3]})
+        statistics = data_manager._get_column_statistics("data")
+        assert statistics["low"].distinct_values == [1, 2]
+        assert statistics["high"].distinct_values is None
+
+    def test_static_data_loaded_once(self, mocker):
+        data_manager["data"] = make_fixed_data()
+        load_spy = mocker.spy(data_manager["data"], "load")
+        statistics_1 = data_manager._get_column_statistics("data")
+        statistics_2 = data_manager._get_column_statistics("data")
+        assert load_spy.call_count == 1
+        assert statistics_1 is statistics_2
+
+    def test_dynamic_data_null_cache_loaded_once(self, mocker):
+        data_manager["data"] = make_random_data
+        Vizro()
+        load_spy = mocker.spy(data_manager["data"], "load")
+        statistics_1 = data_manager._get_column_statistics("data")
+        # Loading the data reruns the function since the cache is NullCache.
+        data_manager["data"].load()
+        statistics_2 = data_manager._get_column_statistics("data")
+        assert load_spy.call_count == 2
+        assert statistics_1 is statistics_2
+
+    def test_dynamic_data_recomputed_after_reload(self, simple_cache, freezer):
+        data_manager["data"] = make_random_data
+        statistics_1 = data_manager._get_column_statistics("data")
+        statistics_2 = data_manager._get_column_statistics("data")
+        freezer.tick(300 + 50)
+        data_manager["data"].load()
+        statistics_3 = data_manager._get_column_statistics("data")
+
+        # Statistics are reused until the cache entry expires and the data is reloaded.
+        assert statistics_1 is statistics_2
+        assert statistics_3 is not statistics_2
+        assert statistics_3[0].min != statistics_2[0].min
+
+
+class TestColumnIndexes:
+    @pytest.mark.parametrize(
+        "series",
+        [
+            pd.Series(["a", "b", "a", "c", None, "b"]),
+            pd.Series([1, 2, 2, 3, 1, 1]),
+            pd.Series([1.0, np.nan, 2.0, 1.0, 3.0, 2.0]),
+            pd.Series(pd.Categorical(["x", "y", "x", "z", "y", "x"])),
+            pd.Series([True, False, True, True, False, False]),
+        ],
+    )
+    @pytest.mark.parametrize("values", [[], ["a", "c"], [1, 3], [1.0], ["x", "z"], [True], ["missing"]])
+    def test_isin(self, series, values):
+        column_indexes = _ColumnIndexes(["column"])
+        np.testing.assert_array_equal(column_indexes.isin("column", series, values), series.isin(values))
+
+    @pytest.mark.parametrize(
+        "column, series, values",
+        [
+            ("other", pd.Series([1, 2]), [1]),
+            ("column", pd.Series([1.0, np.nan]), [np.nan]),
+            ("column", pd.Series(["a", None]), [None]),
+        ],
+    )
+    def test_isin_not_indexed(self, column, series, values):
+        assert _ColumnIndexes(["column"]).isin(column, series, values) is None
+
+    @pytest.mark.parametrize("indexed_columns", [[], ["column"]])
+    @pytest.mark.parametrize("values", [["2024-01-02"], ["2024-01-01", "2024-01-04"], ["2024-01-05"]])
+    def test_isin_dates(self, indexed_columns, values):
+        series = pd.Series(pd.to_datetime(["2024-01-02 12:00", "2024-01-01 00:00", None, "2024-01-04 23:59"]))
+        column_indexes = _ColumnIndexes(indexed_columns)
+        np.testing.assert_array_equal(column_indexes.isin("column", series, values), _filter_isin(series, values))
+
+    @pytest.mark.parametrize(
+        "series, values",
+        [
+            (pd.Series([3, 1, 2, 5, 4, 2]), [2, 4]),
+            (pd.Series([3, 1, 2, 5, 4, 2]), [2.5, 10]),
+            (pd.Series([3, 1, 2, 5, 4, 2]), [4, 2]),
+            (pd.Series([1.5, np.nan, 2.0, -1.0, np.nan, 2.5]), [0, 2]),
+            (pd.Series([1.5, np.nan, 2.0, -1.0, np.nan, 2.5]), [-5, 5]),
+            (
+                pd.Series(
+                    pd.to_datetime(
+                        ["2024-01-02 12:00", "2024-01-01 00:00", None, "2024-01-03 23:59", "2024-01-04 00:00"]
+                    )
+                ),
+                ["2024-01-02", "2024-01-03"],
+            ),
+            (
+                pd.Series(
+                    pd.to_datetime(
+                        ["2024-01-02 12:00", "2024-01-01 00:00", None, "2024-01-03 23:59", "2024-01-04 00:00"]
+                    )
+                ),
+                ["2024-01-05", "2024-01-06"],
+            ),
+        ],
+    )
+    def test_between(self, series, values):
+        column_indexes = _ColumnIndexes(["column"])
+        np.testing.assert_array_equal(column_indexes.between("column", series, values), _filter_between(series, values))
+
+    @pytest.mark.parametrize(
+        "column, series, values",
+        [
+            ("other", pd.Series([1, 2]), [1, 2]),
+            ("column", pd.Series(["a", "b"]), ["a", "b"]),
+            ("column", pd.Series([1, None], dtype="Int64"), [1, 2]),
+        ],
+    )
+    def test_between_not_indexed(self, column, series, values):
+        assert _ColumnIndexes(["column"]).between(column, series, values) is None
+
+    @pytest.mark.parametrize("values", [["2024-01-02", "2024-01-03"], ["2024-01-05", "2024-01-06"]])
+    def test_between_dates_not_indexed(self, values):
+        series = pd.Series(pd.to_datetime(["2024-01-02 12:00", "2024-01-01 00:00", None, "2024-01-03 23:59"]))
+        column_indexes = _ColumnIndexes([])
+        np.testing.assert_array_equal(column_indexes.between("column", series, values), _filter_between(series, values))
+
+    @pytest.mark.parametrize("indexed_columns", [[], ["column"]])
+    def test_dates_normalized_once(self, indexed_columns, mocker):
+        normalize_dates_spy = mocker.spy(vizro.managers._data_manager, "_normalize_dates")
+        column_indexes = _ColumnIndexes(indexed_columns)
+        series = pd.Series(pd.to_datetime(["2024-01-02 12:00", "2024-01-01 00:00"]))
+        column_indexes.between("column", series, ["2024-01-01", "2024-01-01"])
+        column_indexes.between("column", series, ["2024-01-02", "2024-01-03"])
+        column_indexes.isin("column", series, ["2024-01-02"])
+        assert normalize_dates_spy.call_count == 1
+
+    def test_sorted_index_built_once(self, mocker):
+        argsort_spy = mocker.spy(np, "argsort")
+        column_indexes = _ColumnIndexes(["column"])
+        series = pd.Series(pd.to_datetime(["2024-01-02", "2024-01-01"]))
+        column_indexes.between("column", series, ["2024-01-01", "2024-01-01"])
+        column_indexes.between("column", series, ["2024-01-02", "2024-01-03"])
+        assert argsort_spy.call_count == 1
+
+    def test_index_built_once(self, mocker):
+        factorize_spy = mocker.spy(pd, "factorize")
+        column_indexes = _ColumnIndexes(["column"])
+        series = pd.Series(["a", "b", "a"])
+        column_indexes.isin("column", series, ["a"])
+        column_indexes.isin("column", series, ["b"])
+        assert factorize_spy.call_count == 1
+
+    def test_no_indexed_columns(self):
+        data_manager["data"] = make_fixed_data()
+        _, version = data_manager["data"]._load_with_version()
+        # Column indexes are still used to normalize dates just once.
+        assert data_manager["data"]._get_column_indexes(version).columns == frozenset()
+
+    def test_static_data(self):
+        data_manager["data"] = make_fixed_data()
+        data_manager["data"].indexed_columns = [0]
+        _, version_1 = data_manager["data"]._load_with_version()
+        _, version_2 = data_manager["data"]._load_with_version()
+        assert data_manager["data"]._get_column_indexes(version_1) is data_manager["data"]._get_column_indexes(
+            version_2
+        )
+
+    def test_dynamic_data_null_cache(self):
+        data_manager["data"] = make_random_data
+        data_manager["data"].indexed_columns = [0]
+        Vizro()
+        _, version = data_manager["data"]._load_with_version()
+        assert version is None
+        assert data_manager["data"]._get_column_indexes(version) is None
+
+    def test_dynamic_data_invalidated_after_reload(self, simple_cache, freezer):
+        data_manager["data"] = make_random_data
+        data_manager["data"].indexed_columns = [0]
+        data_1, version_1 = data_manager["data"]._load_with_version()
+        data_2, version_2 = data_manager["data"]._load_with_version()
+        freezer.tick(300 + 50)
+        data_3, version_3 = data_manager["data"]._load_with_version()
+
+        # The version changes only when the cache entry expires and the data is reloaded.
+        assert_frame_equal(data_1, data_2)
+        assert_frame_not_equal(data_2, data_3)
+        assert version_1 == version_2 != version_3
+        assert data_manager["data"]._get_column_indexes(version_1) is data_manager["data"]._get_column_indexes(
+            version_2
+        )
+        assert data_manager["data"]._get_column_indexes(version_3) is not data_manager["data"]._get_column_indexes(
+            version_2
+        )
+
+    def test_versions_capped(self, mocker):
+        mocker.patch("vizro.managers._data_manager._COLUMN_INDEXES_CAP", 2)
+        data_manager["data"] = make_fixed_data()
+        data_manager["data"].indexed_columns = [0]
+        column_indexes_1 = data_manager["data"]._get_column_indexes("1")
+        data_manager["data"]._get_column_indexes("2")
+        data_manager["data"]._get_column_indexes("3")
+        assert list(data_manager["data"]._column_indexes) == ["2", "3"]
+        assert data_manager["data"]._get_column_indexes("1") is not column_indexes_1
+
+
+def make_filtered_data_key(controls, version=0, load_arguments=()):
+    return _FilteredDataKey(data_source_name="data", load_arguments=load_arguments, version=version, controls=controls)
+
+
+class TestFilteredDataCache:
+    def test_get_and_set(self):
+        cache = _FilteredDataCache()
+        data = pd.DataFrame({"a": [1, 2, 3]})
+        assert cache.get(make_filtered_data_key("x")) is None
+
+        cache.set(make_filtered_data_key("x"), data, max_bytes=1024)
+        cached_data = cache.get(make_filtered_data_key("x"))
+
+        assert_frame_equal(cached_data, data)
+        assert (cache.hits, cache.misses) == (1, 1)
+        with pytest.raises(ValueError, match="read-only"):
+            cached_data.iloc[0, 0] = 0
+        # The data given to set remains writeable.
+        data.iloc[0, 0] = 0
+
+    def test_least_recently_used_evicted(self):
+        cache = _FilteredDataCache()
+        data = pd.DataFrame({"a": range(10)})
+        nbytes = int(data.memory_usage(index=True, deep=True).sum())
+        cache.set(make_filtered_data_key("x"), data, max_bytes=2 * nbytes)
+        cache.set(make_filtered_data_key("y"), data, max_bytes=2 * nbytes)
+        cache.get(make_filtered_data_key("x"))
+        cache.set(make_filtered_data_key("z"), data, max_bytes=2 * nbytes)
+
+        assert cache.get(make_filtered_data_key("y")) is None
+        assert cache.get(make_filtered_data_key("x")) is not None
+        assert cache.get(make_filtered_data_key("z")) is not None
+        assert cache.nbytes == 2 * nbytes
+
+    def test_too_large_not_cached(self):
+        cache = _FilteredDataCache()
+        result = cache.set(make_filtered_data_key("x"), pd.DataFrame({"a": range(10)}), max_bytes=10)
+        assert_frame_equal(result, pd.DataFrame({"a": range(10)}))
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+    def test_old_version_discarded(self):
+        cache = _FilteredDataCache()
+        data = pd.DataFrame({"a": [1, 2, 3]})
+        cache.set(make_filtered_data_key("x", version=1), data, max_bytes=1024)
+        cache.set(make_filtered_data_key("y", version=1), data, max_bytes=1024)
+        cache.set(make_filtered_data_key("x", version=1, load_arguments=(("arg", 1),)), data, max_bytes=1024)
+        cache.set(make_filtered_data_key("x", version=2), data, max_bytes=1024)
+
+        # Only data filtered from the old version of the data loaded with the same arguments is discarded.
+        assert len(cache) == 2
+        assert cache.get(make_filtered_data_key("x", version=1)) is None
+        assert cache.get(make_filtered_data_key("x", version=1, load_arguments=(("arg", 1),))) is not None
@@ -176,6 +176,24 @@ class TestActionBuild:
 class TestActionPrivateMethods:
     """Test action private methods."""
 
+    def test_get_target_signatures_output_custom_action(self, identity_action_function):
+        vm.Page(
+            id="test_page",
+            title="Test page",
+            components=[vm.Button(actions=[vm.Action(id="custom_action", function=identity_action_function())])],
+        )
+        assert model_manager["custom_action"]._get_target_signatures_output() == Output(
+            "target_signatures_test_page", "data", allow_duplicate=True
+        )
+
+    @pytest.mark.usefixtures("managers_one_page_without_graphs_one_button")
+    def test_get_target_signatures_output_predefined_action(self):
+        predefined_filter_action = model_manager["test_page"].controls[0].selector.actions[0].actions[0]
+        assert predefined_filter_action._get_target_signatures_output() is None
+
+    def test_get_target_signatures_output_not_on_page(self, identity_action_function):
+        assert Action(function=identity_action_function())._get_target_signatures_output() is None
+
     def test_get_callback_mapping_no_inputs_no_outputs(self, identity_action_function):
         action = Action(function=identity_action_function())
         callback_inputs, callback_outputs, action_components = action._get_callback_mapping()
@@ -1,10 +1,12 @@
 """Unit tests for vizro.models.AgGrid."""
 
+import json
 import re
 
 import pytest
 from asserts import assert_component_equal
 from dash import dcc, html
+from plotly.io.json import to_json_plotly
 
 try:
     from pydantic.v1 import ValidationError
@@ -13,6 +15,7 @@ except ImportError:  # pragma: no cov
 
 import vizro.models as vm
 import vizro.plotly.express as px
+from vizro.actions._actions_utils import _render_target
 from vizro.managers import data_manager
 from vizro.models._action._action import Action
 from vizro.tables import dash_ag_grid
@@ -114,6 +117,42 @@ class TestDunderMethodsAgGrid:
         # ag_grid() is the same as ag_grid.__call__()
         assert ag_grid().id == "underlying_table_id"
 
+    def test_figure_cache(self, dash_ag_grid_with_id, mocker):
+        data_manager.figure_cache_size = 10 * 1024**2
+        ag_grid = vm.AgGrid(id="ag_grid", figure=dash_ag_grid_with_id)
+        ag_grid.pre_build()
+        render_spy = mocker.spy(vm.AgGrid, "_render")
+        data_frame = data_manager[ag_grid["data_frame"]].load()
+
+        ag_grid_component = _render_target("ag_grid", data_frame, {})
+        cached_ag_grid_component = _render_target("ag_grid", data_frame, {})
+
+        assert render_spy.call_count == 1
+        assert cached_ag_grid_component == json.loads(to_json_plotly(ag_grid_component))
+        assert cached_ag_grid_component["props"]["id"] == "underlying_table_id"
+
+    def test_infinite_scroll(self, gapminder):
+        ag_grid = vm.AgGrid(
+            figure=dash_ag_grid(gapminder, columnDefs=[{"field": "country"}, {"field": "pop"}]), infinite_scroll=True
+        )
+        ag_grid.pre_build()
+        ag_grid_component = ag_grid()
+
+        assert ag_grid_component.rowModelType == "infinite"
+        assert not hasattr(ag_grid_component, "rowData")
+        assert ag_grid_component.columnDefs == [
+            {"field": "country", "filter": "agTextColumnFilter"},
+            {"field": "pop", "filter": "agNumberColumnFilter"},
+        ]
+
+    def test_infinite_scroll_filter_disabled(self, gapminder):
+        ag_grid = vm.AgGrid(
+            figure=dash_ag_grid(gapminder, columnDefs=[{"field": "pop"}], defaultColDef={"filter": False}),
+            infinite_scroll=True,
+        )
+        ag_grid.pre_build()
+        assert ag_grid().columnDefs == [{"field": "pop"}]
+
 
 class TestAttributesAgGrid:
     # Testing at this low implementation level as mocking callback contexts skips checking for creation of these objects
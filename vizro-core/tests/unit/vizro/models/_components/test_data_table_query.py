@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizro.models._components._data_table_query import _apply_filter_query, _apply_sort_by, _get_page_data
+
+
+@pytest.fixture
+def data_frame():
+    return pd.DataFrame(
+        {
+            "name": ["Apple", "banana", "Cherry", None, ""],
+            "price": [1.0, 2.5, 4.0, np.nan, 3.0],
+            "date": pd.to_datetime(
+                ["2024-01-01 10:00", "2024-01-02 00:00", "2024-01-03 00:00", None, "2024-01-05 00:00"]
+            ),
+        }
+    )
+
+
+class TestApplyFilterQuery:
+    @pytest.mark.parametrize(
+        "filter_query, expected_index",
+        [
+            ("{name} contains an", [1]),
+            ('{name} contains "an"', [1]),
+            ("{name} icontains AN", [1]),
+            ("{name} scontains AN", []),
+            ("{name} = Apple", [0]),
+            ("{name} eq apple", []),
+            ("{name} ieq apple", [0]),
+            ("{name} != Apple", [1, 2, 4]),
+            ("{name} is blank", [3, 4]),
+            ("{name} is nil", [3]),
+        ],
+    )
+    def test_text(self, data_frame, filter_query, expected_index):
+        assert list(_apply_filter_query(data_frame, filter_query).index) == expected_index
+
+    @pytest.mark.parametrize(
+        "filter_query, expected_index",
+        [
+            ("{price} = 2.5", [1]),
+            ("{price} >= 3", [2, 4]),
+            ("{price} ge 3", [2, 4]),
+            ("{price} < 3", [0, 1]),
+            ("{price} contains 2", [1]),
+            ('{price} = "abc"', []),
+        ],
+    )
+    def test_number(self, data_frame, filter_query, expected_index):
+        assert list(_apply_filter_query(data_frame, filter_query).index) == expected_index
+
+    @pytest.mark.parametrize(
+        "filter_query, expected_index",
+        [
+            ("{date} datestartswith 2024-01-0", [0, 1, 2, 4]),
+            ('{date} datestartswith "2024-01-01 10"', [0]),
+            ("{date} > 2024-01-02", [2, 4]),
+            ("{date} <= 2024-01-02", [0, 1]),
+        ],
+    )
+    def test_date(self, data_frame, filter_query, expected_index):
+        assert list(_apply_filter_query(data_frame, filter_query).index) == expected_index
+
+    def test_date_with_timezone(self):
+        data_frame = pd.DataFrame({"date": pd.to_datetime(["2024-01-01 23:00"]).tz_localize("America/New_York")})
+        assert len(_apply_filter_query(data_frame, "{date} datestartswith 2024-01-01")) == 1
+        assert len(_apply_filter_query(data_frame, "{date} < 2024-01-02")) == 1
+
+    def test_multiple_parts(self, data_frame):
+        assert list(_apply_filter_query(data_frame, "{name} is blank && {price} > 2").index) == [4]
+
+    @pytest.mark.parametrize("filter_query", [None, "", "{unknown} = 1", "{name} unknown a", "not a query"])
+    def test_not_filtered(self, data_frame, filter_query):
+        assert list(_apply_filter_query(data_frame, filter_query).index) == [0, 1, 2, 3, 4]
+
+
+class TestApplySortBy:
+    def test_sort(self, data_frame):
+        result = _apply_sort_by(data_frame, [{"column_id": "price", "direction": "desc"}])
+        assert list(result.index) == [3, 2, 4, 1, 0]
+
+    @pytest.mark.parametrize("sort_by", [None, [], [{"column_id": "unknown", "direction": "asc"}]])
+    def test_not_sorted(self, data_frame, sort_by):
+        assert _apply_sort_by(data_frame, sort_by) is data_frame
+
+
+class TestGetPageData:
+    @pytest.mark.parametrize(
+        "page_current, expected_prices",
+        [(None, [4.0, 3.0]), (0, [4.0, 3.0]), (1, [2.5, 1.0]), (2, [])],
+    )
+    def test_page(self, data_frame, page_current, expected_prices):
+        page = _get_page_data(
+            data_frame,
+            page_current=page_current,
+            page_size=2,
+            sort_by=[{"column_id": "price", "direction": "desc"}],
+            filter_query="{price} > 0",
+        )
+        assert [row["price"] for row in page["data"]] == expected_prices
+        assert page["page_count"] == 2
+
+    def test_no_rows(self, data_frame):
+        page = _get_page_data(data_frame, page_current=0, page_size=2, sort_by=[], filter_query="{price} > 10")
+        assert page == {"data": [], "page_count": 1}
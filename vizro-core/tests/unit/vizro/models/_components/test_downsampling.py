@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+import vizro.models as vm
+import vizro.plotly.express as px
+from vizro.models._components._downsampling import _as_float, _downsample_figure, _lttb_indices, _min_max_indices
+
+
+@pytest.fixture
+def time_series():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=10_000, freq="min"),
+            "value": rng.normal(size=10_000).cumsum(),
+            "group": np.repeat(["a", "b"], 5_000),
+        }
+    )
+
+
+class TestLTTB:
+    def test_keeps_first_last_and_peaks(self):
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[[123, 456, 789]] = [10.0, -10.0, 5.0]
+        indices = _lttb_indices(x, y, 50)
+
+        assert len(indices) == 50
+        assert indices[0] == 0 and indices[-1] == 999
+        assert np.all(np.diff(indices) > 0)
+        assert {123, 456, 789} <= set(indices)
+
+    def test_missing_values(self):
+        y = np.sin(np.linspace(0, 10, 1000))
+        y[100:300] = np.nan
+        indices = _lttb_indices(np.arange(1000, dtype=float), y, 100)
+        assert len(indices) == 100
+        assert np.all(np.diff(indices) > 0)
+
+
+class TestMinMax:
+    def test_keeps_extremes_in_order(self):
+        y = np.zeros(1000)
+        y[[10, 500, 990]] = [-3.0, 7.0, 2.0]
+        indices = _min_max_indices(y, 20)
+
+        assert len(indices) <= 20
+        assert np.all(np.diff(indices) > 0)
+        assert {10, 500, 990} <= set(indices)
+
+    def test_missing_values_not_chosen(self):
+        y = np.arange(100, dtype=float)
+        y[::2] = np.nan
+        assert not np.isnan(y[_min_max_indices(y, 10)]).any()
+
+
+class TestAsFloat:
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            (None, [0.0, 1.0]),
+            ([3, 5], [3.0, 5.0]),
+            (["a", "b"], [0.0, 1.0]),
+            (np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[ns]"), [1.7040672e18, 1.7041536e18]),
+            (pd.to_datetime(["2024-01-01", "2024-01-02"]).to_pydatetime(), [1.7040672e18, 1.7041536e18]),
+        ],
+    )
+    def test_as_float(self, values, expected):
+        np.testing.assert_allclose(_as_float(values, 2), expected)
+
+
+class TestDownsampleFigure:
+    def test_line_and_marker_traces(self, time_series):
+        fig = go.Figure(
+            [
+                go.Scatter(
+                    x=time_series["time"], y=time_series["value"], mode="lines", customdata=time_series[["group"]]
+                ),
+                go.Scattergl(
+                    x=time_series["time"],
+                    y=time_series["value"],
+                    mode="markers",
+                    marker_size=time_series["value"].abs(),
+                ),
+            ]
+        )
+        fig = _downsample_figure(fig, 500)
+
+        line, markers = fig.data
+        assert len(line.x) == len(line.y) == len(line.customdata) == 500
+        assert len(markers.x) == len(markers.y) == len(markers.marker.size) <= 500
+        np.testing.assert_array_equal(markers.marker.size, np.abs(markers.y))
+        assert max(markers.y) == time_series["value"].max()
+
+    def test_small_and_other_traces_unchanged(self, time_series):
+        fig = go.Figure(
+            [
+                go.Scatter(x=time_series["time"][:100], y=time_series["value"][:100]),
+                go.Bar(x=time_series["time"], y=time_series["value"]),
+                go.Scatter(x=time_series["value"], y=time_series["group"], mode="markers"),
+            ]
+        )
+        fig = _downsample_figure(fig, 500)
+        assert [len(trace.x) for trace in fig.data] == [100, 10_000, 10_000]
+
+
+class TestGraphMaxPoints:
+    @pytest.fixture(autouse=True)
+    def mock_set_props(self, mocker):
+        # Mock out set_props so we don't need to supply mock callback context for these tests.
+        return mocker.patch("vizro.models._components.graph.set_props")
+
+    def test_disabled_by_default(self, time_series):
+        fig = vm.Graph(figure=px.line(time_series, x="time", y="value", color="group"))(data_frame=time_series)
+        assert [len(trace.y) for trace in fig.data] == [5_000, 5_000]
+
+    def test_downsampled_per_trace(self, time_series):
+        graph = vm.Graph(figure=px.line(time_series, x="time", y="value", color="group"), max_points=1000)
+        fig = graph(data_frame=time_series)
+        assert [len(trace.y) for trace in fig.data] == [1000, 1000]
+
+    def test_invalid_max_points(self, standard_px_chart):
+        with pytest.raises(ValueError, match="ensure this value is greater than or equal to 3"):
+            vm.Graph(figure=standard_px_chart, max_points=2)
@@ -1,12 +1,16 @@
 """Unit tests for vizro.models.Graph."""
 
+import json
 import re
 
+import pandas as pd
 import plotly.graph_objects as go
 import pytest
 from asserts import assert_component_equal
 from dash import dcc, html
 from dash.exceptions import MissingCallbackContextException
+from flask_caching import Cache
+from plotly.io.json import to_json_plotly
 
 try:
     from pydantic.v1 import ValidationError
@@ -15,8 +19,13 @@ except ImportError:  # pragma: no cov
 
 import vizro.models as vm
 import vizro.plotly.express as px
+from vizro import Vizro
+from vizro.actions._actions_utils import _render_target
 from vizro.managers import data_manager
+from vizro.managers._data_manager import _FigureCache
 from vizro.models._action._action import Action
+from vizro.models._typed_arrays import _encode_typed_arrays
+from vizro.models.types import capture
 
 
 @pytest.fixture
@@ -137,6 +146,81 @@ class TestDunderMethodsGraph:
         assert actions_chain.trigger.component_property == "clickData"
 
 
+class TestFigureCacheGraph:
+    @pytest.fixture(autouse=True)
+    def mock_set_props(self, mocker):
+        # Mock out set_props so we don't need to supply mock callback context for these tests.
+        return mocker.patch("vizro.models._components.graph.set_props")
+
+    @pytest.fixture
+    def graph(self, gapminder, mocker):
+        render_spy = mocker.Mock()
+
+        @capture("graph")
+        def scatter(data_frame):
+            render_spy()
+            return px.scatter(data_frame, x="gdpPercap", y="lifeExp")
+
+        graph = vm.Graph(id="graph", figure=scatter(gapminder))
+        # Capturing the chart function calls it, so this call should not be counted.
+        render_spy.reset_mock()
+        return graph, render_spy
+
+    def test_disabled_by_default(self, graph, gapminder):
+        graph, render_spy = graph
+        _render_target("graph", gapminder, {})
+        _render_target("graph", gapminder, {})
+        assert render_spy.call_count == 2
+
+    def test_same_data_rendered_once(self, graph, gapminder, mock_set_props):
+        graph, render_spy = graph
+        data_manager.figure_cache_size = 10 * 1024**2
+        figure = _render_target("graph", gapminder, {})
+        cached_figure = _render_target("graph", gapminder.copy(), {})
+
+        assert render_spy.call_count == 1
+        assert isinstance(figure, go.Figure)
+        assert cached_figure == json.loads(to_json_plotly(_encode_typed_arrays(figure)))
+        assert (data_manager._figure_cache.hits, data_manager._figure_cache.misses) == (1, 1)
+        # The graph is still hidden until its theme has been updated.
+        assert mock_set_props.call_count == 2
+
+    def test_call_always_renders(self, graph, gapminder, mock_set_props):
+        graph, render_spy = graph
+        data_manager.figure_cache_size = 10 * 1024**2
+        _render_target("graph", gapminder, {})
+
+        assert isinstance(graph(data_frame=gapminder), go.Figure)
+        assert render_spy.call_count == 2
+        assert data_manager._figure_cache.hits == 0
+
+    @pytest.mark.parametrize(
+        "changed_data_frame",
+        [
+            pd.DataFrame({"gdpPercap": [1, 2], "lifeExp": [3, 5]}),
+            pd.DataFrame({"gdpPercap": [1, 2], "lifeExp": [3, 4]}, index=[1, 2]),
+            pd.DataFrame({"gdpPercap": [1.0, 2.0], "lifeExp": [3, 4]}),
+        ],
+    )
+    def test_different_data_rendered_again(self, graph, changed_data_frame):
+        graph, render_spy = graph
+        data_manager.figure_cache_size = 10 * 1024**2
+        _render_target("graph", pd.DataFrame({"gdpPercap": [1, 2], "lifeExp": [3, 4]}), {})
+        _render_target("graph", changed_data_frame, {})
+        assert render_spy.call_count == 2
+
+    def test_shared_cache(self, graph, gapminder):
+        graph, render_spy = graph
+        data_manager.figure_cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+        Vizro()
+        _render_target("graph", gapminder, {})
+        # Discard outputs cached in the memory of this process, as if the graph were rendered by another process.
+        data_manager._figure_cache = _FigureCache()
+        _render_target("graph", gapminder, {})
+        assert render_spy.call_count == 1
+        assert data_manager._figure_cache.hits == 1
+
+
 class TestAttributesGraph:
     # Testing at this low implementation level as mocking callback contexts skips checking for creation of these objects
     def test_graph_filter_interaction_attributes(self, standard_px_chart):
@@ -145,6 +229,63 @@ class TestAttributesGraph:
         assert "modelID" in graph._filter_interaction_input
 
 
+class TestLayoutPatchGraph:
+    @pytest.mark.parametrize(
+        "arg_names, expected",
+        [
+            (["title"], True),
+            (["range_x", "log_y"], True),
+            (["template"], False),
+            (["title.text"], True),
+            (["y"], False),
+            (["title", "y"], False),
+        ],
+    )
+    def test_is_layout_only_px_chart(self, standard_px_chart, arg_names, expected):
+        assert vm.Graph(figure=standard_px_chart)._is_layout_only(arg_names) == expected
+
+    @pytest.mark.parametrize(
+        "arg_names, expected",
+        [(["title"], True), (["log_y", "range_y"], True), (["range_x"], False), (["log_x"], False)],
+    )
+    def test_is_layout_only_max_points(self, standard_px_chart, arg_names, expected):
+        # The x range and scale of a zoomed graph with max_points need new trace data.
+        assert vm.Graph(figure=standard_px_chart, max_points=100)._is_layout_only(arg_names) == expected
+
+    def test_is_layout_only_custom_chart(self):
+        @capture("graph")
+        def custom_chart(data_frame, title):
+            return go.Figure(go.Bar(x=[title]))
+
+        # Custom charts could use any argument to produce trace data.
+        assert not vm.Graph(figure=custom_chart("gapminder", title="Title"))._is_layout_only(["title"])
+
+    @pytest.mark.parametrize("to_dict", [False, True])
+    def test_get_layout_patch(self, standard_px_chart, gapminder, to_dict):
+        fig = vm.Graph(figure=standard_px_chart).figure(data_frame=gapminder, title="New title")
+        patch = vm.Graph._get_layout_patch(fig.to_dict() if to_dict else fig, ["title"])
+        operations = patch.to_plotly_json()["operations"]
+
+        assert len(operations) == 1
+        assert operations[0]["location"] == ["layout", "title"]
+        assert json.loads(to_json_plotly(operations[0]["params"]["value"]))["text"] == "New title"
+
+    def test_get_layout_patch_axes(self, gapminder):
+        fig = px.scatter(gapminder, x="gdpPercap", y="lifeExp", facet_col="continent", log_x=True, range_y=[0, 100])
+        patch = vm.Graph._get_layout_patch(fig, ["log_x", "range_y"])
+        operations = {
+            tuple(operation["location"]): operation["params"]["value"]
+            for operation in patch.to_plotly_json()["operations"]
+        }
+
+        # Every x-axis of the faceted chart is patched. The other y-axes match yaxis and so follow its range.
+        assert operations == {
+            **{("layout", f"xaxis{i}", "type"): "log" for i in ["", 2, 3, 4, 5]},
+            ("layout", "yaxis", "range"): [0, 100],
+            ("layout", "yaxis", "autorange"): False,
+        }
+
+
 class TestProcessGraphDataFrame:
     def test_process_figure_data_frame_str_df(self, standard_px_chart_with_str_dataframe, gapminder):
         data_manager["gapminder"] = gapminder
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vizro.models._components._infinite_row_model import _apply_filter_model, _apply_sort_model, _get_column_filter
+
+
+@pytest.fixture
+def data_frame():
+    return pd.DataFrame(
+        {
+            "name": ["Apple", "banana", "Cherry", None, ""],
+            "price": [1.0, 2.5, 4.0, np.nan, 3.0],
+            "date": pd.to_datetime(
+                ["2024-01-01 10:00", "2024-01-02 00:00", "2024-01-03 00:00", None, "2024-01-05 00:00"]
+            ),
+        }
+    )
+
+
+class TestGetColumnFilter:
+    @pytest.mark.parametrize(
+        "column, expected_filter",
+        [
+            (pd.Series([1, 2]), "agNumberColumnFilter"),
+            (pd.Series([1.5, 2.5]), "agNumberColumnFilter"),
+            (pd.Series(pd.date_range("2024-01-01", periods=2, tz="UTC")), "agDateColumnFilter"),
+            (pd.Series(["a", "b"]), "agTextColumnFilter"),
+            (pd.Series([True, False]), "agTextColumnFilter"),
+        ],
+    )
+    def test_column_filter(self, column, expected_filter):
+        assert _get_column_filter(column) == expected_filter
+
+
+class TestApplyFilterModel:
+    @pytest.mark.parametrize(
+        "column_filter, expected_index",
+        [
+            ({"filterType": "text", "type": "contains", "filter": "AN"}, [1]),
+            ({"filterType": "text", "type": "notContains", "filter": "an"}, [0, 2, 3, 4]),
+            ({"filterType": "text", "type": "equals", "filter": "apple"}, [0]),
+            ({"filterType": "text", "type": "notEqual", "filter": "apple"}, [1, 2, 3, 4]),
+            ({"filterType": "text", "type": "startsWith", "filter": "ch"}, [2]),
+            ({"filterType": "text", "type": "endsWith", "filter": "E"}, [0]),
+            ({"filterType": "text", "type": "blank"}, [3, 4]),
+            ({"filterType": "text", "type": "notBlank"}, [0, 1, 2]),
+        ],
+    )
+    def test_text(self, data_frame, column_filter, expected_index):
+        assert list(_apply_filter_model(data_frame, {"name": column_filter}).index) == expected_index
+
+    @pytest.mark.parametrize(
+        "column_filter, expected_index",
+        [
+            ({"filterType": "number", "type": "equals", "filter": 2.5}, [1]),
+            ({"filterType": "number", "type": "greaterThanOrEqual", "filter": 3}, [2, 4]),
+            ({"filterType": "number", "type": "lessThan", "filter": 3}, [0, 1]),
+            ({"filterType": "number", "type": "inRange", "filter": 1, "filterTo": 4}, [1, 4]),
+            ({"filterType": "number", "type": "blank"}, [3]),
+        ],
+    )
+    def test_number(self, data_frame, column_filter, expected_index):
+        assert list(_apply_filter_model(data_frame, {"price": column_filter}).index) == expected_index
+
+    @pytest.mark.parametrize(
+        "column_filter, expected_index",
+        [
+            ({"filterType": "date", "type": "equals", "dateFrom": "2024-01-01 00:00:00", "dateTo": None}, [0]),
+            ({"filterType": "date", "type": "greaterThan", "dateFrom": "2024-01-02 00:00:00", "dateTo": None}, [2, 4]),
+            (
+                {"filterType": "date", "type": "inRange", "dateFrom": "2024-01-01 00:00:00", "dateTo": "2024-01-05"},
+                [1, 2],
+            ),
+        ],
+    )
+    def test_date(self, data_frame, column_filter, expected_index):
+        assert list(_apply_filter_model(data_frame, {"date": column_filter}).index) == expected_index
+
+    def test_date_with_timezone(self):
+        data_frame = pd.DataFrame({"date": pd.to_datetime(["2024-01-01 23:00"]).tz_localize("America/New_York")})
+        column_filter = {"filterType": "date", "type": "equals", "dateFrom": "2024-01-01 00:00:00", "dateTo": None}
+        assert len(_apply_filter_model(data_frame, {"date": column_filter})) == 1
+
+    @pytest.mark.parametrize(
+        "conditions_key, operator, expected_index", [("conditions", "AND", [1]), ("condition1", "OR", [0, 1, 2, 4])]
+    )
+    def test_combined_conditions(self, data_frame, conditions_key, operator, expected_index):
+        conditions = [{"type": "greaterThan", "filter": 1}, {"type": "lessThan", "filter": 3}]
+        column_filter = {"filterType": "number", "operator": operator}
+        if conditions_key == "conditions":
+            column_filter["conditions"] = conditions
+        else:
+            column_filter["condition1"], column_filter["condition2"] = conditions
+        assert list(_apply_filter_model(data_frame, {"price": column_filter}).index) == expected_index
+
+    def test_multiple_columns(self, data_frame):
+        filter_model = {
+            "name": {"filterType": "text", "type": "notBlank"},
+            "price": {"filterType": "number", "type": "greaterThan", "filter": 2},
+        }
+        assert list(_apply_filter_model(data_frame, filter_model).index) == [1, 2]
+
+    @pytest.mark.parametrize(
+        "filter_model",
+        [{}, {"unknown": {"filterType": "text", "type": "contains", "filter": "a"}}, {"name": {"filterType": "set"}}],
+    )
+    def test_not_filtered(self, data_frame, filter_model):
+        assert list(_apply_filter_model(data_frame, filter_model).index) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.parametrize(
+        "column, column_filter",
+        [
+            ("name", {"filterType": "text", "type": "unknown", "filter": "a"}),
+            ("price", {"filterType": "number", "type": "unknown", "filter": 2}),
+            ("date", {"filterType": "date", "type": "unknown", "dateFrom": "2024-01-01 00:00:00", "dateTo": None}),
+        ],
+    )
+    def test_unknown_filter_type(self, data_frame, column, column_filter, caplog):
+        assert list(_apply_filter_model(data_frame, {column: column_filter}).index) == [0, 1, 2, 3, 4]
+        assert f"Ignoring unknown AG Grid {column_filter['filterType']} filter type 'unknown'" in caplog.text
+
+
+class TestApplySortModel:
+    def test_sort(self, data_frame):
+        result = _apply_sort_model(data_frame, [{"colId": "price", "sort": "desc"}])
+        assert list(result.index) == [3, 2, 4, 1, 0]
+
+    def test_multiple_columns(self):
+        data_frame = pd.DataFrame({"a": [1, 1, 0], "b": [1, 2, 3]})
+        result = _apply_sort_model(data_frame, [{"colId": "a", "sort": "asc"}, {"colId": "b", "sort": "desc"}])
+        assert list(result.index) == [2, 1, 0]
+
+    @pytest.mark.parametrize("sort_model", [[], [{"colId": "unknown", "sort": "asc"}]])
+    def test_not_sorted(self, data_frame, sort_model):
+        assert _apply_sort_model(data_frame, sort_model) is data_frame
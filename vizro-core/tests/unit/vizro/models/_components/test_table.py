@@ -109,6 +109,26 @@ class TestDunderMethodsTable:
         # table() is the same as table.__call__()
         assert table().id == "underlying_table_id"
 
+    def test_server_side(self, gapminder):
+        table = vm.Table(figure=dash_data_table(gapminder, page_size=10, sort_action="native"), server_side=True)
+        table.pre_build()
+        table_component = table()
+
+        assert table_component.page_action == "custom"
+        assert table_component.sort_action == "custom"
+        assert not hasattr(table_component, "filter_action")
+        assert table_component.page_count == 171
+        assert table_component.data == gapminder.iloc[:10].to_dict("records")
+
+    def test_server_side_default_page_size(self, gapminder):
+        table = vm.Table(figure=dash_data_table(gapminder, filter_query="{continent} = Europe"), server_side=True)
+        table.pre_build()
+        table_component = table()
+
+        assert table_component.page_size == 250
+        assert table_component.page_count == 2
+        assert table_component.data == gapminder[gapminder["continent"] == "Europe"].iloc[:250].to_dict("records")
+
 
 class TestAttributesTable:
     def test_table_filter_interaction_attributes(self, dash_data_table_with_id):
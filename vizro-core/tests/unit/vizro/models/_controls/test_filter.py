@@ -7,7 +7,10 @@ import pytest
 from asserts import assert_component_equal
 
 import vizro.models as vm
-from vizro.managers import model_manager
+import vizro.plotly.express as px
+from vizro import Vizro
+from vizro.actions._actions_utils import _filter_plan, _FilterPlanEntry
+from vizro.managers import data_manager, model_manager
 from vizro.models._action._actions_chain import ActionsChain
 from vizro.models._controls.filter import Filter, _filter_between, _filter_isin
 from vizro.models.types import CapturedCallable
@@ -376,6 +379,37 @@ class TestPreBuildMethod:
         assert default_action.actions[0].function["filter_function"] == filter_function
         assert default_action.actions[0].id == f"filter_action_{filter.id}"
 
+    def test_data_loaded_once_per_data_source(self, gapminder, mocker):
+        data_manager["gapminder"] = gapminder
+        vm.Page(
+            id="test_page",
+            title="Page",
+            components=[
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder", x="lifeExp", y="gdpPercap")),
+                vm.Graph(id="bar_chart", figure=px.bar("gapminder", x="country", y="gdpPercap")),
+            ],
+            controls=[vm.Filter(column="continent"), vm.Filter(column="lifeExp"), vm.Filter(column="year")],
+        )
+        load_spy = mocker.spy(data_manager["gapminder"], "load")
+        Vizro._pre_build()
+        assert load_spy.call_count == 1
+
+    @pytest.mark.parametrize(
+        "targets, expected_targets", [([], ["scatter_chart", "bar_chart"]), (["scatter_chart"], ["scatter_chart"])]
+    )
+    def test_update_filter_plan(self, targets, expected_targets, managers_one_page_two_graphs):
+        filter = vm.Filter(column="continent", targets=targets, selector=vm.Checklist(id="continent_filter"))
+        model_manager["test_page"].controls = [filter]
+        filter.pre_build()
+        # Running pre_build again should not duplicate entries in the filter plan.
+        filter.pre_build()
+
+        assert set(_filter_plan) == set(expected_targets)
+        for target in expected_targets:
+            assert _filter_plan[target] == {
+                "continent_filter": [_FilterPlanEntry(filter_column="continent", filter_function=_filter_isin)]
+            }
+
     # TODO: Add tests for custom temporal and categorical selectors too. Probably inside the conftest file and reused in
     #       all other tests. Also add tests for the custom selector that is an entirely new component and adjust docs.
     # This test does add_type so ideally we would clean up after this to restore vizro.models to its previous state.
@@ -0,0 +1,122 @@
+import json
+
+import dash
+import dash_ag_grid as dag
+import flask
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from dash._utils import to_json as dash_to_json
+
+from vizro import Vizro
+from vizro.models._json_serializer import _can_replace_dash_to_json, _json_serializer, _to_json_orjson
+from vizro.models._typed_arrays import _encode_typed_arrays
+
+
+@pytest.fixture
+def response():
+    data_frame = pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=3, freq="h", tz="Europe/London"),
+            "value": [1.5, np.nan, 3.5],
+            "count": np.array([1, 2, 3], dtype="i8"),
+            "category": ["a", "b", None],
+        }
+    )
+    figure = go.Figure(go.Scatter(x=data_frame["time"], y=data_frame["value"]), layout={"title": "Title"})
+    return {
+        "multi": True,
+        "response": {
+            "graph": {"figure": figure},
+            "encoded_graph": {"figure": _encode_typed_arrays(figure)},
+            "ag_grid": {"children": dag.AgGrid(rowData=data_frame.to_dict("records"))},
+            "array": {"value": np.arange(3.0)},
+            "non_str_keys": {"value": {1: "a"}},
+        },
+    }
+
+
+class TestToJsonOrjson:
+    def test_same_as_json(self, response):
+        assert json.loads(_to_json_orjson(response)) == json.loads(dash_to_json(response))
+
+    def test_fallback(self):
+        # orjson can't serialize integers bigger than 64 bits but the standard library can.
+        assert _to_json_orjson({"value": 2**70}) == '{"value":1180591620717411303424}'
+
+    def test_not_serializable(self):
+        with pytest.raises(TypeError):
+            _to_json_orjson({"value": object()})
+
+
+class TestJsonSerializer:
+    @pytest.fixture
+    def server(self):
+        return flask.Flask(__name__)
+
+    def test_installed_dash_supported(self):
+        # If this fails then a new version of Dash has changed how it serializes callback responses.
+        assert _can_replace_dash_to_json()
+
+    def test_default(self):
+        Vizro()
+        assert _json_serializer.engine == "json"
+        assert dash._callback.to_json is dash_to_json
+
+    @pytest.mark.parametrize("engine", ["auto", "orjson"])
+    def test_configure_orjson(self, engine, server):
+        _json_serializer.configure(engine, server=server)
+        assert _json_serializer.engine == "orjson"
+        assert dash._callback.to_json == _json_serializer._to_json_callback_response
+
+    def test_configure_json(self, server):
+        _json_serializer.configure("orjson", server=server)
+        _json_serializer.configure("json", server=server)
+        assert _json_serializer.engine == "json"
+        # Dash's own serialization is used without any change.
+        assert dash._callback.to_json is dash_to_json
+
+    def test_auto_without_orjson(self, mocker, server):
+        mocker.patch("vizro.models._json_serializer.orjson", None)
+        _json_serializer.configure("auto", server=server)
+        assert _json_serializer.engine == "json"
+
+    def test_orjson_not_installed(self, mocker, server):
+        mocker.patch("vizro.models._json_serializer.orjson", None)
+        with pytest.raises(ValueError, match="json_engine='orjson' requires orjson to be installed"):
+            _json_serializer.configure("orjson", server=server)
+
+    def test_unknown_engine(self, server):
+        with pytest.raises(ValueError, match="Unknown json_engine 'ujson'"):
+            _json_serializer.configure("ujson", server=server)
+
+    @pytest.mark.parametrize(
+        "patched_attribute, value", [("dash.__version__", "3.0.0"), ("dash._callback.to_json", json.dumps)]
+    )
+    def test_unsupported_dash(self, mocker, server, patched_attribute, value):
+        mocker.patch(patched_attribute, value)
+        with pytest.warns(UserWarning, match="json_engine='orjson' is not supported with Dash"):
+            _json_serializer.configure("orjson", server=server)
+        assert _json_serializer.engine == "json"
+        assert dash._callback.to_json != _json_serializer._to_json_callback_response
+
+    @pytest.mark.parametrize("engine", ["json", "orjson"])
+    def test_to_json(self, engine, response, server):
+        _json_serializer.configure(engine, server=server)
+        assert json.loads(_json_serializer.to_json(response)) == json.loads(dash_to_json(response))
+
+    def test_other_app_not_affected(self, response, server):
+        _json_serializer.configure("orjson", server=server)
+
+        with server.app_context():
+            assert dash._callback.to_json(response) == _to_json_orjson(response)
+        with flask.Flask("other_app").app_context():
+            assert dash._callback.to_json(response) == dash_to_json(response)
+        assert dash._callback.to_json(response) == dash_to_json(response)
+
+    def test_reset(self):
+        Vizro(json_engine="orjson")
+        Vizro._reset()
+        assert _json_serializer.engine == "json"
+        assert dash._callback.to_json is dash_to_json
@@ -0,0 +1,227 @@
+import functools
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import pytest
+from pandas.testing import assert_frame_equal
+
+import vizro.models as vm
+from vizro.models._process_pool import _chart_process_pool, _from_shared_memory, _to_shared_memory
+from vizro.models.types import capture
+
+
+def _pid_figure(data_frame, title_prefix=""):
+    return go.Figure(go.Bar(x=data_frame["x"], y=data_frame["y"]), layout={"title": f"{title_prefix}{os.getpid()}"})
+
+
+@capture("graph")
+def default_chart(data_frame, title_prefix=""):
+    return _pid_figure(data_frame, title_prefix)
+
+
+@capture("graph", executor="process")
+def process_chart(data_frame, title_prefix=""):
+    return _pid_figure(data_frame, title_prefix)
+
+
+@capture("graph", executor="local")
+def local_chart(data_frame, title_prefix=""):
+    return _pid_figure(data_frame, title_prefix)
+
+
+@capture("graph", executor="process")
+def scatter_chart(data_frame):
+    return px.scatter(data_frame, x="date", y="y", color="x", template="vizro_dark")
+
+
+@capture("graph", executor="process")
+def slow_chart(data_frame):
+    time.sleep(3)
+    return go.Figure()
+
+
+def _title_suffix(function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        figure = function(*args, **kwargs)
+        return figure.update_layout(title=f"{figure.layout.title.text}-decorated")
+
+    return wrapper
+
+
+@_title_suffix
+def decorated_chart(data_frame, title_prefix=""):
+    return _pid_figure(data_frame, title_prefix)
+
+
+@capture("graph", executor="process")
+@_title_suffix
+def captured_decorated_chart(data_frame, title_prefix=""):
+    return _pid_figure(data_frame, title_prefix)
+
+
+@pytest.fixture
+def chart_data():
+    return pd.DataFrame({"x": ["a", "b", "c"], "y": [1.0, 2.0, 3.0]})
+
+
+def _figure_pid(figure):
+    return int(figure.layout.title.text.rpartition("-")[2])
+
+
+class TestSharedMemory:
+    def test_round_trip(self):
+        data_frame = pd.DataFrame(
+            {
+                "int": [1, 2, 3],
+                "float": [1.5, np.nan, 3.5],
+                "bool": [True, False, True],
+                "datetime": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]),
+                "timezone": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]).tz_localize("UTC"),
+                "string": ["a", "b", None],
+                "category": pd.Categorical(["x", "y", "x"]),
+                "nullable_int": pd.array([1, None, 3], dtype="Int64"),
+            },
+            index=pd.Index(["r1", "r2", "r3"], name="row"),
+        )
+        shared_data_frame, block = _to_shared_memory(data_frame)
+        try:
+            assert set(shared_data_frame.shared_columns) == {0, 1, 2, 3}
+            assert_frame_equal(_from_shared_memory(shared_data_frame), data_frame)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_duplicate_column_names(self):
+        data_frame = pd.DataFrame([[1, 2.0, "a"]], columns=["x", "x", "y"])
+        shared_data_frame, block = _to_shared_memory(data_frame)
+        try:
+            assert_frame_equal(_from_shared_memory(shared_data_frame), data_frame)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_no_shared_columns(self):
+        data_frame = pd.DataFrame({"string": ["a", "b"]})
+        shared_data_frame, block = _to_shared_memory(data_frame)
+        assert block is None
+        assert_frame_equal(_from_shared_memory(shared_data_frame), data_frame)
+
+    def test_empty(self):
+        data_frame = pd.DataFrame({"int": pd.Series([], dtype=int)})
+        shared_data_frame, block = _to_shared_memory(data_frame)
+        assert block is None
+        assert_frame_equal(_from_shared_memory(shared_data_frame), data_frame)
+
+
+class TestChartProcessPool:
+    @pytest.mark.parametrize(
+        "chart_executor, chart, runs_in_pool",
+        [
+            (None, default_chart, False),
+            (None, process_chart, True),
+            (None, local_chart, False),
+            ("process", default_chart, True),
+            ("process", process_chart, True),
+            ("process", local_chart, False),
+        ],
+    )
+    def test_executor(self, chart_data, chart_executor, chart, runs_in_pool):
+        _chart_process_pool.configure(chart_executor, timeout=None, max_tasks_per_worker=100)
+        graph = vm.Graph(figure=chart(chart_data, title_prefix="pid-"))
+        figure = graph.figure(data_frame=chart_data)
+
+        assert isinstance(figure, go.Figure)
+        assert (_figure_pid(figure) != os.getpid()) == runs_in_pool
+        assert list(figure.data[0].y) == [1.0, 2.0, 3.0]
+
+    def test_same_figure_as_local(self, chart_data):
+        chart_data["date"] = pd.date_range("2024-01-01", periods=3)
+        graph = vm.Graph(figure=scatter_chart(chart_data))
+
+        figure = graph.figure(data_frame=chart_data)
+
+        assert isinstance(figure, go.Figure)
+        assert figure == scatter_chart.__wrapped__(chart_data)
+
+    def test_bound_and_overridden_arguments(self, chart_data):
+        graph = vm.Graph(figure=process_chart(chart_data, title_prefix="bound-"))
+        assert graph.figure(data_frame=chart_data).layout.title.text.startswith("bound-")
+        assert graph.figure(data_frame=chart_data, title_prefix="new-").layout.title.text.startswith("new-")
+
+    def test_timeout(self, chart_data, mocker):
+        _chart_process_pool.configure(None, timeout=0.5, max_tasks_per_worker=100)
+        # Data is given by name so that the function does not run when the figure is captured.
+        graph = vm.Graph(figure=slow_chart("chart_data"))
+        workers = []
+        terminate = _chart_process_pool._terminate
+
+        def _record_workers_and_terminate(executor):
+            workers.extend(executor._processes.values())
+            terminate(executor)
+
+        mocker.patch.object(_chart_process_pool, "_terminate", side_effect=_record_workers_and_terminate)
+
+        with pytest.raises(TimeoutError, match="Chart function slow_chart did not finish within 0.5 seconds"):
+            graph.figure(data_frame=chart_data)
+
+        # The stuck worker is killed rather than left to finish its task, and a new pool is used for the next call.
+        for worker in workers:
+            worker.join(timeout=1)
+        assert workers and not any(worker.is_alive() for worker in workers)
+        graph = vm.Graph(figure=process_chart(chart_data, title_prefix="pid-"))
+        assert _figure_pid(graph.figure(data_frame=chart_data)) != os.getpid()
+
+    def test_worker_recycling(self):
+        _chart_process_pool.configure(None, timeout=None, max_tasks_per_worker=2)
+        executor = _chart_process_pool._get_executor()
+        for _ in range(2 * _chart_process_pool._max_workers - 1):
+            assert _chart_process_pool._get_executor() is executor
+        assert _chart_process_pool._get_executor() is not executor
+
+    def test_function_not_importable(self, chart_data):
+        @capture("graph", executor="process")
+        def nested_chart(data_frame, title_prefix=""):
+            return _pid_figure(data_frame, title_prefix)
+
+        graph = vm.Graph(id="graph", figure=nested_chart(chart_data, title_prefix="pid-"))
+        with pytest.warns(UserWarning, match="nested_chart of Graph graph cannot run in the chart process pool"):
+            graph.pre_build()
+
+        assert _figure_pid(graph.figure(data_frame=chart_data)) == os.getpid()
+
+    def test_function_importable(self, chart_data):
+        graph = vm.Graph(figure=process_chart(chart_data, title_prefix="pid-"))
+        graph.pre_build()
+
+        assert _figure_pid(graph.figure(data_frame=chart_data)) != os.getpid()
+
+    @pytest.mark.parametrize(
+        "chart",
+        [captured_decorated_chart, capture("graph", executor="process")(decorated_chart)],
+    )
+    def test_user_decorator_runs(self, chart_data, chart):
+        graph = vm.Graph(figure=chart(chart_data, title_prefix="pid-"))
+        graph.pre_build()
+        title = graph.figure(data_frame=chart_data).layout.title.text
+
+        assert title.endswith("-decorated")
+        assert int(title.split("-")[1]) != os.getpid()
+
+    def test_unknown_chart_executor(self):
+        with pytest.raises(ValueError, match="Unknown chart_executor 'thread'"):
+            _chart_process_pool.configure("thread", timeout=None, max_tasks_per_worker=100)
+
+
+class TestCaptureExecutor:
+    def test_executor_not_graph(self):
+        with pytest.raises(ValueError, match="can only be used with mode 'graph'"):
+            capture("table", executor="process")
+
+    def test_unknown_executor(self):
+        with pytest.raises(ValueError, match="Unknown executor 'thread'"):
+            capture("graph", executor="thread")
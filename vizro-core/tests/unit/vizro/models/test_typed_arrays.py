@@ -0,0 +1,115 @@
+import base64
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from vizro.models._typed_arrays import _encode_callback_outputs, _encode_typed_arrays, _to_typed_array
+
+
+def _decode(typed_array):
+    array = np.frombuffer(base64.b64decode(typed_array["bdata"]), dtype=typed_array["dtype"])
+    if "shape" in typed_array:
+        array = array.reshape([int(size) for size in typed_array["shape"].split(",")])
+    return array
+
+
+class TestToTypedArray:
+    @pytest.mark.parametrize(
+        "value, expected_dtype",
+        [
+            (np.array([1.5, 2.5], dtype="f8"), "f8"),
+            (np.array([1.5, 2.5], dtype="f4"), "f4"),
+            (np.array([1.5, 2.5], dtype="f2"), "f8"),
+            (np.array([1, 2], dtype="i1"), "i1"),
+            (np.array([1, 2], dtype="u2"), "u2"),
+            (np.array([1, 2], dtype="i8"), "i4"),
+            (np.array([1, 2], dtype="u8"), "u4"),
+            (np.array([1, 2**40], dtype="i8"), "f8"),
+            (np.array([1.5, 2.5], dtype=">f8"), "f8"),
+        ],
+    )
+    def test_round_trip(self, value, expected_dtype):
+        typed_array = _to_typed_array(value)
+        assert typed_array["dtype"] == expected_dtype
+        np.testing.assert_array_equal(_decode(typed_array), value)
+
+    def test_2d(self):
+        value = np.arange(6, dtype="f8").reshape(2, 3)
+        typed_array = _to_typed_array(value)
+        assert typed_array["shape"] == "2,3"
+        np.testing.assert_array_equal(_decode(typed_array), value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [1, 2, 3],
+            np.array(["a", "b"]),
+            np.array([True, False]),
+            np.array(["2024-01-01"], dtype="datetime64[ns]"),
+            np.array([], dtype="f8"),
+            np.float64(1.5),
+        ],
+    )
+    def test_not_encoded(self, value):
+        assert _to_typed_array(value) is value
+
+
+class TestEncodeTypedArrays:
+    def test_figure(self):
+        fig = go.Figure(
+            go.Scatter(x=np.arange(3), y=np.array([1.5, 2.5, 3.5]), text=np.array(["a", "b", "c"])),
+            layout={"title": "Title"},
+        )
+        fig_dict = _encode_typed_arrays(fig)
+
+        [trace] = fig_dict["data"]
+        assert trace["type"] == "scatter"
+        np.testing.assert_array_equal(_decode(trace["x"]), [0, 1, 2])
+        np.testing.assert_array_equal(_decode(trace["y"]), [1.5, 2.5, 3.5])
+        assert list(trace["text"]) == ["a", "b", "c"]
+        assert fig_dict["layout"] == fig.layout
+        assert "frames" not in fig_dict
+
+    def test_nested_data_array(self):
+        fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4], marker={"size": np.array([5.0, 6.0])}))
+        [trace] = _encode_typed_arrays(fig)["data"]
+        np.testing.assert_array_equal(_decode(trace["marker"]["size"]), [5.0, 6.0])
+
+    def test_non_data_array_not_encoded(self):
+        fig = go.Figure(go.Pie(values=np.array([1.0, 2.0]), domain={"x": [0.0, 0.5]}))
+        [trace] = _encode_typed_arrays(fig)["data"]
+        assert trace["values"]["dtype"] == "f8"
+        assert trace["domain"] == {"x": [0.0, 0.5]}
+
+    def test_interaction_data_not_encoded(self):
+        fig = go.Figure(
+            go.Scatter(
+                x=np.arange(3),
+                y=np.arange(3),
+                customdata=np.array([[2000], [2001], [2002]]),
+                ids=np.array([1, 2, 3]),
+                selectedpoints=np.array([0, 2]),
+            )
+        )
+        [trace] = _encode_typed_arrays(fig)["data"]
+        assert trace["x"]["dtype"] == "i4"
+        np.testing.assert_array_equal(trace["customdata"], [[2000], [2001], [2002]])
+        np.testing.assert_array_equal(trace["ids"], [1, 2, 3])
+        np.testing.assert_array_equal(trace["selectedpoints"], [0, 2])
+
+    def test_not_figure(self):
+        fig_dict = {"data": [], "layout": {}}
+        assert _encode_typed_arrays(fig_dict) is fig_dict
+
+    @pytest.mark.parametrize("outputs_type", [dict, list])
+    def test_callback_outputs(self, outputs_type):
+        fig = go.Figure(go.Scatter(x=np.arange(3), y=np.arange(3)))
+        outputs = {"graph": fig, "card": "Text"}
+        if outputs_type is list:
+            outputs = list(outputs.values())
+        encoded_outputs = _encode_callback_outputs(outputs)
+
+        encoded_values = list(encoded_outputs.values()) if outputs_type is dict else encoded_outputs
+        assert encoded_values[0]["data"][0]["x"]["dtype"] == "i4"
+        assert encoded_values[1] == "Text"
@@ -1,6 +1,10 @@
+import numpy as np
+import pandas as pd
 import plotly.express as px
+import pytest
 
 import vizro.plotly.express as vpx
+from vizro.models._process_pool import _import_function
 
 
 def test_non_chart_unchanged():
@@ -9,5 +13,46 @@ def test_non_chart_unchanged():
 
 def test_chart_wrapped():
     graph = vpx.scatter(px.data.iris(), x="petal_width", y="petal_length")
-    assert graph._captured_callable._function is px.scatter
+    assert graph._captured_callable._function.__wrapped__ is px.scatter
     assert vpx.scatter is not px.scatter
+
+
+def test_chart_without_render_mode_wrapped():
+    graph = vpx.bar(px.data.iris(), x="species", y="petal_length")
+    assert graph._captured_callable._function is px.bar
+
+
+class TestRenderMode:
+    @pytest.fixture
+    def data_frame(self):
+        return pd.DataFrame({"x": np.arange(2000), "y": np.arange(2000)})
+
+    @pytest.mark.parametrize(
+        "webgl_threshold, kwargs, expected_trace_type",
+        [
+            (1000, {}, "scattergl"),
+            (5000, {}, "scatter"),
+            (5000, {"render_mode": "webgl"}, "scattergl"),
+            (1000, {"render_mode": "svg"}, "scatter"),
+        ],
+    )
+    def test_scatter(self, data_frame, monkeypatch, webgl_threshold, kwargs, expected_trace_type):
+        monkeypatch.setattr(vpx, "webgl_threshold", webgl_threshold)
+        assert vpx.scatter(data_frame, x="x", y="y", **kwargs).data[0].type == expected_trace_type
+
+    def test_below_default_threshold(self, data_frame):
+        assert vpx.line(data_frame.head(100), x="x", y="y").data[0].type == "scatter"
+
+    @pytest.mark.parametrize("kwargs", [{"line_shape": "spline"}, {"animation_frame": "x"}])
+    def test_webgl_not_supported(self, data_frame, monkeypatch, kwargs):
+        monkeypatch.setattr(vpx, "webgl_threshold", 0)
+        assert vpx.line(data_frame.head(10), x="x", y="y", **kwargs).data[0].type == "scatter"
+
+    def test_captured_callable_uses_threshold_when_called(self, data_frame, monkeypatch):
+        graph = vpx.scatter(data_frame.head(10), x="x", y="y")
+        assert graph.data[0].type == "scatter"
+        assert graph._captured_callable(data_frame=data_frame).data[0].type == "scattergl"
+
+    def test_imported_in_worker(self):
+        # Chart functions that run in the chart process pool are imported by name, and the wrapper must still apply.
+        assert _import_function(vpx.scatter.__module__, vpx.scatter.__qualname__).__wrapped__ is px.scatter
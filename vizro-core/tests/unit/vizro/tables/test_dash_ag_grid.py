@@ -1,10 +1,13 @@
 import dash_ag_grid as dag
+import numpy as np
 import pandas as pd
+import pytest
 from asserts import assert_component_equal
 from pandas import Timestamp
 
 from vizro.models.types import capture
 from vizro.tables import dash_ag_grid
+from vizro.tables._dash_ag_grid import _get_row_data
 
 data = pd.DataFrame(
     {
@@ -66,3 +69,33 @@ class TestDashAgGrid:
                 columnDefs=column_defs,
             ),
         )
+
+
+class TestGetRowData:
+    @pytest.mark.parametrize(
+        "column, expected_values",
+        [
+            (pd.to_datetime(["1969-12-31 23:00", "2024-01-01 00:00", None]), ["1969-12-31", "2024-01-01", None]),
+            (
+                pd.to_datetime(["2024-01-01 23:30", "2024-01-02 00:00"]).tz_localize("America/New_York"),
+                ["2024-01-01", "2024-01-02"],
+            ),
+            (pd.array([1, None], dtype="Int64"), [1, None]),
+            (pd.array(["a", None], dtype="string"), ["a", None]),
+            (pd.Categorical(["a", "b"]), ["a", "b"]),
+            (np.array([1, 2], dtype="int64"), [1, 2]),
+            (["a", None], ["a", None]),
+        ],
+    )
+    def test_column_values(self, column, expected_values):
+        values = [row["column"] for row in _get_row_data(pd.DataFrame({"column": column}))]
+        assert values == expected_values
+        # Values must be native Python types, e.g. int rather than np.int64, so that they can be serialized to JSON.
+        assert [type(value) for value in values] == [type(value) for value in expected_values]
+
+    def test_same_as_to_dict(self):
+        data_frame = data.drop(columns="date")
+        assert _get_row_data(data_frame) == data_frame.to_dict("records")
+
+    def test_no_columns(self):
+        assert _get_row_data(pd.DataFrame(index=range(2))) == [{}, {}]
@@ -0,0 +1,79 @@
+"""Benchmarks converting a DataFrame to the rowData of `vizro.tables.dash_ag_grid`.
+
+For each column type and number of rows, this records the time taken to make rowData with `DataFrame.to_dict` (as
+`dash_ag_grid` used to do) and with the column-wise conversion that `dash_ag_grid` now uses. Each DataFrame has an
+integer column as well as 5 columns of the given type.
+
+Usage: python tools/benchmark_ag_grid_row_data.py [--rows 1000 100000 1000000] [--repeat 3] [--output results.csv]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from vizro.tables._dash_ag_grid import _get_row_data
+
+# Fraction of values that are missing in nullable integer columns.
+MISSING_FRACTION = 0.1
+
+COLUMN_TYPES = {
+    "int": lambda rng, rows: rng.integers(0, 1000, rows),
+    "float": lambda rng, rows: rng.normal(size=rows),
+    "string": lambda rng, rows: rng.choice(["north", "south", "east", "west"], rows),
+    "category": lambda rng, rows: pd.Categorical(rng.choice(["north", "south", "east", "west"], rows)),
+    "datetime": lambda rng, rows: pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 10**6, rows), "min"),
+    "datetime_tz": lambda rng, rows: (
+        pd.Timestamp("2024-01-01", tz="Europe/London") + pd.to_timedelta(rng.integers(0, 10**6, rows), "min")
+    ),
+    "nullable_int": lambda rng, rows: pd.array(
+        np.where(rng.random(rows) < MISSING_FRACTION, None, rng.integers(0, 1000, rows))
+    ),
+}
+
+
+def _to_dict_row_data(data_frame: pd.DataFrame) -> list[dict]:
+    return data_frame.apply(
+        lambda x: x.dt.strftime("%Y-%m-%d") if pd.api.types.is_datetime64_any_dtype(x) else x
+    ).to_dict("records")
+
+
+CONVERSIONS = {"to_dict": _to_dict_row_data, "column_wise": _get_row_data}
+
+
+def _make_data(column_type: str, rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    columns = {f"{column_type}_{i}": COLUMN_TYPES[column_type](rng, rows) for i in range(5)}
+    return pd.DataFrame({"id": np.arange(rows), **columns})
+
+
+def benchmark(rows: list[int], repeat: int) -> pd.DataFrame:
+    """Returns the best time out of `repeat` runs for each column type, number of rows and conversion."""
+    results = []
+    for n_rows in rows:
+        for column_type in COLUMN_TYPES:
+            data_frame = _make_data(column_type, n_rows)
+            for conversion, convert in CONVERSIONS.items():
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    convert(data_frame)
+                    timings.append(time.perf_counter() - start)
+                results.append(
+                    {"column_type": column_type, "rows": n_rows, "conversion": conversion, "seconds": min(timings)}
+                )
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Path of a CSV file to save the results to.")
+    args = parser.parse_args()
+
+    results = benchmark(args.rows, args.repeat)
+    print(results.to_string(index=False))  # noqa: T201
+    if args.output:
+        results.to_csv(args.output, index=False)
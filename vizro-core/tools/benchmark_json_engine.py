@@ -0,0 +1,85 @@
+"""Benchmarks serializing callback responses to JSON with each `json_engine` of `Vizro`.
+
+The responses contain either a `dash_ag_grid` with its rowData or a large figure, as they are returned by the action
+callbacks. This records the time taken to serialize each response, together with the time taken by the standard
+library for comparison.
+
+Usage: python tools/benchmark_json_engine.py [--rows 1000 100000 1000000] [--repeat 3] [--output results.csv]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from dash._utils import to_json as dash_to_json
+from plotly.io.json import to_json_plotly
+
+import vizro.plotly.express as px
+from vizro.models._json_serializer import _to_json_orjson, orjson
+from vizro.models._typed_arrays import _encode_typed_arrays
+from vizro.tables import dash_ag_grid
+
+RESPONSES = {
+    "ag_grid": lambda data_frame: {"children": dash_ag_grid(data_frame)()},
+    "scatter": lambda data_frame: {"figure": px.scatter(data_frame, x="x", y="y", color="group")},
+    "scatter_typed_arrays": lambda data_frame: {
+        "figure": _encode_typed_arrays(px.scatter(data_frame, x="x", y="y", color="group"))
+    },
+}
+
+# json_engine="json" serializes as Dash does, which uses plotly's orjson engine if orjson is installed and otherwise the
+# standard library.
+SERIALIZERS = {"json": dash_to_json, "standard_library": lambda value: to_json_plotly(value, engine="json")}
+if orjson is not None:
+    SERIALIZERS["orjson"] = _to_json_orjson
+
+
+def _make_data(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x": np.arange(rows),
+            "time": pd.date_range("2024-01-01", periods=rows, freq="s"),
+            "y": rng.normal(size=rows).cumsum(),
+            "group": rng.choice(["a", "b", "c"], rows),
+        }
+    )
+
+
+def benchmark(rows: list[int], repeat: int) -> pd.DataFrame:
+    """Returns the payload size and best serialization time out of `repeat` runs for each response, rows and engine."""
+    results = []
+    for n_rows in rows:
+        data_frame = _make_data(n_rows)
+        for response, make_response in RESPONSES.items():
+            value = {"multi": True, "response": {"target": make_response(data_frame)}}
+            for engine, serialize in SERIALIZERS.items():
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    response_json = serialize(value)
+                    timings.append(time.perf_counter() - start)
+                results.append(
+                    {
+                        "response": response,
+                        "rows": n_rows,
+                        "engine": engine,
+                        "payload_bytes": len(response_json.encode()),
+                        "server_seconds": min(timings),
+                    }
+                )
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Path of a CSV file to save the results to.")
+    args = parser.parse_args()
+
+    results = benchmark(args.rows, args.repeat)
+    print(results.to_string(index=False))  # noqa: T201
+    if args.output:
+        results.to_csv(args.output, index=False)
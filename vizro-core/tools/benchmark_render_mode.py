@@ -0,0 +1,69 @@
+"""Benchmarks the SVG and WebGL render modes of plotly express charts made with `vizro.plotly.express`.
+
+For each chart, number of rows and render mode, this records the size of the figure JSON sent to the browser and the
+time taken on the server to make and serialize the figure. The results can be used to choose
+`vizro.plotly.express.webgl_threshold`.
+
+Usage: python tools/benchmark_render_mode.py [--rows 1000 10000 100000] [--repeat 3] [--output results.csv]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from plotly.io.json import to_json_plotly
+
+import vizro.plotly.express as px
+
+CHARTS = {
+    "scatter": lambda data_frame, render_mode: px.scatter(
+        data_frame, x="x", y="y", color="group", render_mode=render_mode
+    ),
+    "line": lambda data_frame, render_mode: px.line(data_frame, x="x", y="y", color="group", render_mode=render_mode),
+}
+
+
+def _make_data(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"x": np.arange(rows), "y": rng.normal(size=rows).cumsum(), "group": rng.choice(["a", "b", "c"], rows)}
+    )
+
+
+def benchmark(rows: list[int], repeat: int) -> pd.DataFrame:
+    """Returns the payload size and best server time out of `repeat` runs for each chart, row count and render mode."""
+    results = []
+    for n_rows in rows:
+        data_frame = _make_data(n_rows)
+        for chart, make_figure in CHARTS.items():
+            for render_mode in ["svg", "webgl"]:
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    figure_json = to_json_plotly(make_figure(data_frame, render_mode))
+                    timings.append(time.perf_counter() - start)
+                results.append(
+                    {
+                        "chart": chart,
+                        "rows": n_rows,
+                        "render_mode": render_mode,
+                        "trace_type": make_figure(data_frame.head(1), render_mode).data[0].type,
+                        "payload_bytes": len(figure_json.encode()),
+                        "server_seconds": min(timings),
+                    }
+                )
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Path of a CSV file to save the results to.")
+    args = parser.parse_args()
+
+    results = benchmark(args.rows, args.repeat)
+    print(results.to_string(index=False))  # noqa: T201
+    if args.output:
+        results.to_csv(args.output, index=False)
@@ -0,0 +1,71 @@
+"""Benchmarks loading static data from the data manager with and without `read_only` set.
+
+For each number of rows, this records the time taken and peak memory allocated to load a static data source that has
+10 float columns, both when every load copies the data (the default) and when `read_only` is set so that loads share
+memory with the original data.
+
+Usage: python tools/benchmark_static_data_read_only.py [--rows 1000 100000 1000000] [--repeat 3] [--output results.csv]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from vizro.managers import data_manager
+
+MODES = {"copy": False, "read_only": True}
+
+
+def _make_data(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(rows, 10)))
+
+
+def _peak_bytes(data_source_name: str) -> int:
+    tracemalloc.start()
+    data_manager[data_source_name].load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def benchmark(rows: list[int], repeat: int) -> pd.DataFrame:
+    """Returns the best time out of `repeat` loads and the peak memory of a load for each number of rows and mode."""
+    results = []
+    for n_rows in rows:
+        for mode, read_only in MODES.items():
+            data_source_name = f"{mode}_{n_rows}"
+            data_manager[data_source_name] = _make_data(n_rows)
+            data_manager[data_source_name].read_only = read_only
+            # Warm up so that the one-off cost of making read-only data isn't counted.
+            data_manager[data_source_name].load()
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                data_manager[data_source_name].load()
+                timings.append(time.perf_counter() - start)
+            results.append(
+                {
+                    "rows": n_rows,
+                    "mode": mode,
+                    "seconds": min(timings),
+                    "peak_bytes": _peak_bytes(data_source_name),
+                }
+            )
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Path of a CSV file to save the results to.")
+    args = parser.parse_args()
+
+    results = benchmark(args.rows, args.repeat)
+    print(results.to_string(index=False))  # noqa: T201
+    if args.output:
+        results.to_csv(args.output, index=False)
@@ -0,0 +1,80 @@
+"""Benchmarks sending figure trace data as plotly.js typed arrays rather than lists of numbers.
+
+For each chart and number of rows, this records the size of the figure JSON sent to the browser and the time taken on
+the server to serialize the figure, both with and without typed arrays.
+
+Usage: python tools/benchmark_typed_arrays.py [--rows 1000 100000 1000000] [--repeat 3] [--output results.csv]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from plotly.io.json import to_json_plotly
+
+import vizro.plotly.express as px
+from vizro.models._typed_arrays import _encode_typed_arrays
+
+CHARTS = {
+    "scatter": lambda data_frame: px.scatter(data_frame, x="x", y="y", color="group", size="size"),
+    "line": lambda data_frame: px.line(data_frame, x="x", y="y", color="group"),
+    "time_series": lambda data_frame: px.line(data_frame, x="time", y="y"),
+    "histogram": lambda data_frame: px.histogram(data_frame, x="y"),
+}
+
+ENCODINGS = {
+    "list": lambda fig: to_json_plotly(fig),
+    "typed_array": lambda fig: to_json_plotly(_encode_typed_arrays(fig)),
+}
+
+
+def _make_data(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x": np.arange(rows),
+            "time": pd.date_range("2024-01-01", periods=rows, freq="s"),
+            "y": rng.normal(size=rows).cumsum(),
+            "size": rng.uniform(1, 10, size=rows),
+            "group": rng.choice(["a", "b", "c"], rows),
+        }
+    )
+
+
+def benchmark(rows: list[int], repeat: int) -> pd.DataFrame:
+    """Returns the payload size and best serialization time out of `repeat` runs for each chart, rows and encoding."""
+    results = []
+    for n_rows in rows:
+        data_frame = _make_data(n_rows)
+        for chart, make_figure in CHARTS.items():
+            fig = make_figure(data_frame)
+            for encoding, serialize in ENCODINGS.items():
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    figure_json = serialize(fig)
+                    timings.append(time.perf_counter() - start)
+                results.append(
+                    {
+                        "chart": chart,
+                        "rows": n_rows,
+                        "encoding": encoding,
+                        "payload_bytes": len(figure_json.encode()),
+                        "server_seconds": min(timings),
+                    }
+                )
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Path of a CSV file to save the results to.")
+    args = parser.parse_args()
+
+    results = benchmark(args.rows, args.repeat)
+    print(results.to_string(index=False))  # noqa: T201
+    if args.output:
+        results.to_csv(args.output, index=False)